@@ -1,68 +1,103 @@
-```python
-from nautilus_trader.backtest.engine import BacktestEngine
-from nautilus_trader.model.data import Bar, BarType
-from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
-from nautilus_trader.model.data import InstrumentId
-from nautilus_trader.model.identifiers import Venue
-from nautilus_trader.model.instruments import Instrument
+import argparse
+from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.config import (
+    BacktestDataConfig,
+    BacktestEngineConfig,
+    BacktestRunConfig,
+    BacktestVenueConfig,
+    ImportableStrategyConfig,
+    LoggingConfig,
+)
+from nautilus_trader.model.data import Bar, QuoteTick
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
-from nautilus_trader.test_kit.providers import TestInstrumentProvider
-from strategies.arbitrage.strategy import ArbitrageStrategy, ArbitrageStrategyConfig
-from strategies.algo.strategy import QuantitativeStrategy, QuantitativeStrategyConfig
-from decimal import Decimal
-from clients.dome_client import DomeClient
-import pandas as pd
+from ingest import CATALOG_PATH, bar_type_for
 
-def run_backtest():
-    # Configure Engine
-    config = BacktestEngineConfig(
-        trader_id="SUPER_TRADER",
-    )
-    engine = BacktestEngine(config=config)
+def build_run_config(catalog_path=CATALOG_PATH, interval=60, chunk_size=50_000, quotes=False,
+                     algo_params=None, log_level="INFO"):
+    """
+    BacktestRunConfig over everything ingested into the catalog (see ingest.py).
+    algo_params override QuantitativeStrategyConfig fields. Returns None if the
+    catalog is empty.
 
-    # Define Instrument
-    venue = Venue("POLYMARKET")
-    instrument_id = InstrumentId.from_str("BTC-USD.POLYMARKET")
-    instrument = TestInstrumentProvider.default_fx_instrument(
-        symbol="BTC-USD",
-        venue=venue,
-    )
-    engine.add_instrument(instrument)
+    ArbitrageStrategy isn't run here: it scans a Gamma universe of events, which
+    the catalog's per-instrument bars and quotes don't carry.
+    """
+    catalog = ParquetDataCatalog(catalog_path)
+    instruments = catalog.instruments()
+    if not instruments:
+        return None
 
-    # Add Strategies
-    arb_config = ArbitrageStrategyConfig(instrument_id=instrument_id.value)
-    arb_strategy = ArbitrageStrategy(config=arb_config)
-    engine.add_strategy(arb_strategy)
+    instrument_ids = [str(instrument.id) for instrument in instruments]
+    bar_types = [str(bar_type_for(instrument.id, interval)) for instrument in instruments]
 
-    algo_config = QuantitativeStrategyConfig(instrument_id=instrument_id.value)
-    algo_strategy = QuantitativeStrategy(config=algo_config)
-    engine.add_strategy(algo_strategy)
+    # One QuantitativeStrategy per bar series (indicators are per instrument)
+    strategies = [
+        ImportableStrategyConfig(
+            strategy_path="strategies.algo.strategy:QuantitativeStrategy",
+            config_path="strategies.algo.strategy:QuantitativeStrategyConfig",
+            config={**(algo_params or {}), "instrument_id": instrument_id, "bar_type": bar_type, "order_id_tag": str(i)},
+        )
+        for i, (instrument_id, bar_type) in enumerate(zip(instrument_ids, bar_types))
+    ]
 
-    # Load Data from Dome API
-    from clients.dome_client import DomeClient
-    client = DomeClient()
-    
-    # Fetch historical data (using get_markets for now as proxy or just live data simulation)
-    # For backtesting, we need historical bars.
-    # Since get_history is a placeholder, we will simulate some data or use what we have.
-    # For this "Super Trader" setup, let's assume we fetch recent markets and treat them as the universe.
-    
-    print("Fetching markets from Dome API...")
-    markets = client.get_markets(limit=10)
-    print(f"Loaded {len(markets)} markets.")
+    data = [
+        BacktestDataConfig(
+            catalog_path=catalog_path,
+            data_cls=Bar,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+        )
+    ]
+    if quotes:
+        data.append(BacktestDataConfig(catalog_path=catalog_path, data_cls=QuoteTick, instrument_ids=instrument_ids))
+
+    return BacktestRunConfig(
+        engine=BacktestEngineConfig(
+            trader_id="SUPER-TRADER",
+            strategies=strategies,
+            logging=LoggingConfig(log_level=log_level),
+        ),
+        venues=[
+            BacktestVenueConfig(
+                name="POLYMARKET",
+                oms_type="NETTING",
+                account_type="CASH",
+                base_currency="USDC",
+                starting_balances=["10000 USDC"],
+            )
+        ],
+        data=data,
+        chunk_size=chunk_size,
+        # Fail the run instead of logging the error and returning no result
+        raise_exception=True,
+    )
 
-    # In a real scenario, we would convert this data to Bars/Ticks and load into the catalog.
-    # For now, we will proceed with the test instrument to verify the engine runs.
-    # catalog = ParquetDataCatalog("data/catalog")
-    # bars = catalog.bars(instrument_id=instrument_id)
-    # engine.add_data(bars)
+def run_backtest(catalog_path=CATALOG_PATH, interval=60, chunk_size=50_000, quotes=False):
+    """
+    Backtest the strategies over the catalog. With chunk_size set the node streams
+    the catalog in chunks instead of loading all bars up front, so memory stays
+    flat however long the history is. Raises if the node fails to build or run.
+    """
+    config = build_run_config(catalog_path, interval, chunk_size, quotes)
+    if config is None:
+        print(f"No instruments in {catalog_path}. Run ingest.py first.")
+        return None
 
     print("Running Backtest...")
-    engine.run()
+    node = BacktestNode(configs=[config])
+    results = node.run()
+    if not results:
+        raise RuntimeError("Backtest produced no result (see the node log)")
     print("Backtest Complete.")
-    
-    # Analyze Results
-    # engine.get_result()
+    for result in results:
+        print(result)
+    return results
 
 if __name__ == "__main__":
-    run_backtest()
+    parser = argparse.ArgumentParser(description="Run a streaming backtest over the Parquet catalog")
+    parser.add_argument("--catalog", default=CATALOG_PATH, help="Catalog directory (populated by ingest.py)")
+    parser.add_argument("--interval", type=int, default=60, help="Bar interval in minutes used at ingest")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="Rows streamed per chunk")
+    parser.add_argument("--quotes", action="store_true", help="Also replay ingested QuoteTicks")
+    args = parser.parse_args()
+    run_backtest(args.catalog, args.interval, args.chunk_size, args.quotes)
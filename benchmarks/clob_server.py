@@ -0,0 +1,245 @@
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import time
+import uuid
+
+from aiohttp import web
+
+# Local stand-in for clob.polymarket.com, enough for the sniper's execute_trade path:
+# API-key creation/derivation, /book and /books, /tick-size, /neg-risk, /fee-rate and
+# POST /order with FOK matching against scriptable order books. Latency and
+# jitter can be injected globally or per route. Signatures are not verified.
+# Point the snipers at it with CLOB_HOST:
+#
+#     python3 benchmarks/clob_server.py --books books.json --latency-ms 30 --jitter-ms 10
+#     CLOB_HOST=http://127.0.0.1:8002 python3 benchmarks/execution.py
+#
+# books.json maps token ids to {"bids": [[price, size], ...], "asks": [[price, size], ...]};
+# tokens without a scripted book get a default ladder around --default-ask.
+# Books can also be replaced at runtime with POST /admin/book.
+
+TOKEN_DECIMALS = 1_000_000   # USDC and outcome shares both use 6 decimals on-chain
+FOK_ERROR = "order couldn't be fully filled. FOK orders are fully filled or killed."
+
+def _levels(levels):
+    return [[float(price), float(size)] for price, size in levels]
+
+class OrderBooks:
+    def __init__(self, scripted=None, default_ask=0.35, default_depth=5, default_size=100.0, tick_size=0.01):
+        self.books = {token: {"bids": _levels(book.get("bids", [])), "asks": _levels(book.get("asks", []))}
+                      for token, book in (scripted or {}).items()}
+        self.default_ask = default_ask
+        self.default_depth = default_depth
+        self.default_size = default_size
+        self.tick_size = tick_size
+
+    def get(self, token_id):
+        book = self.books.get(token_id)
+        if book is None:
+            step = self.tick_size
+            asks = [[round(self.default_ask + i * step, 4), self.default_size] for i in range(self.default_depth)]
+            bids = [[round(self.default_ask - (i + 1) * step, 4), self.default_size] for i in range(self.default_depth)]
+            book = self.books[token_id] = {"bids": [b for b in bids if b[0] > 0], "asks": [a for a in asks if a[0] < 1]}
+        return book
+
+    def summary(self, token_id):
+        book = self.get(token_id)
+        # Like the live CLOB: bids ascending and asks descending, so the best price is last
+        bids = sorted(book["bids"], key=lambda level: level[0])
+        asks = sorted(book["asks"], key=lambda level: level[0], reverse=True)
+        payload = {
+            "market": "0x" + hashlib.sha1(token_id.encode()).hexdigest(),
+            "asset_id": token_id,
+            "timestamp": str(int(time.time() * 1000)),
+            "bids": [{"price": f"{p:g}", "size": f"{s:g}"} for p, s in bids],
+            "asks": [{"price": f"{p:g}", "size": f"{s:g}"} for p, s in asks],
+            "min_order_size": "5",
+            "tick_size": f"{self.tick_size:g}",
+            "neg_risk": False,
+            "last_trade_price": f"{asks[-1][0]:g}" if asks else "0.5",
+        }
+        payload["hash"] = hashlib.sha1(json.dumps(payload, separators=(",", ":")).encode()).hexdigest()
+        return payload
+
+    def match(self, token_id, side, price, size, fill_or_kill=True):
+        """Take liquidity up to `price`. Returns the filled size (0 if a FOK order can't fill completely)."""
+        book = self.get(token_id)
+        if side == "BUY":
+            levels = sorted(book["asks"], key=lambda level: level[0])
+            crosses = lambda level_price: level_price <= price + 1e-9
+        else:
+            levels = sorted(book["bids"], key=lambda level: level[0], reverse=True)
+            crosses = lambda level_price: level_price >= price - 1e-9
+
+        available = sum(s for p, s in levels if crosses(p))
+        if fill_or_kill and available + 1e-9 < size:
+            return 0.0
+
+        remaining = size
+        for level in levels:
+            if remaining <= 1e-9 or not crosses(level[0]):
+                break
+            take = min(level[1], remaining)
+            level[1] -= take
+            remaining -= take
+        key = "asks" if side == "BUY" else "bids"
+        book[key] = [level for level in levels if level[1] > 1e-9]
+        return size - remaining
+
+class ClobServer:
+    def __init__(self, books, latency_ms=0.0, jitter_ms=0.0, route_latency_ms=None, seed=0):
+        self.books = books
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.route_latency = {route: ms / 1000 for route, ms in (route_latency_ms or {}).items()}
+        self.rng = random.Random(seed)
+        self.orders = []
+        self.stats = {}
+
+    async def _delay(self, route):
+        self.stats[route] = self.stats.get(route, 0) + 1
+        latency = self.route_latency.get(route, self.latency)
+        if latency or self.jitter:
+            await asyncio.sleep(latency + self.rng.uniform(0, self.jitter))
+
+    def _creds(self, request):
+        # Deterministic per signing address (and nonce), like derive-api-key
+        address = request.headers.get("POLY_ADDRESS", "anonymous")
+        nonce = request.headers.get("POLY_NONCE", "0")
+        seed = hashlib.sha256(f"{address}:{nonce}".encode()).digest()
+        return {
+            "apiKey": str(uuid.UUID(bytes=seed[:16])),
+            "secret": base64.urlsafe_b64encode(seed).decode(),
+            "passphrase": seed[16:].hex(),
+        }
+
+    async def api_key(self, request):
+        await self._delay(request.path)
+        return web.json_response(self._creds(request))
+
+    async def book(self, request):
+        await self._delay(request.path)
+        return web.json_response(self.books.summary(request.query.get("token_id", "")))
+
+    async def books_batch(self, request):
+        await self._delay(request.path)
+        params = await request.json()
+        return web.json_response([self.books.summary(str(param["token_id"])) for param in params])
+
+    async def tick_size(self, request):
+        await self._delay(request.path)
+        return web.json_response({"minimum_tick_size": self.books.tick_size})
+
+    async def neg_risk(self, request):
+        await self._delay(request.path)
+        return web.json_response({"neg_risk": False})
+
+    async def fee_rate(self, request):
+        await self._delay(request.path)
+        return web.json_response({"base_fee": 0})
+
+    async def server_time(self, request):
+        await self._delay(request.path)
+        return web.json_response(int(time.time()))
+
+    async def post_order(self, request):
+        received = time.time()
+        await self._delay(request.path)
+        if not request.headers.get("POLY_API_KEY"):
+            return web.json_response({"error": "Unauthorized/Invalid api key"}, status=401)
+        body = await request.json()
+        order = body.get("order", {})
+        order_type = body.get("orderType", "GTC")
+
+        side = order.get("side")
+        side = "BUY" if side in ("BUY", 0, "0") else "SELL"
+        maker = int(order.get("makerAmount", 0)) / TOKEN_DECIMALS
+        taker = int(order.get("takerAmount", 0)) / TOKEN_DECIMALS
+        # BUY: maker pays USDC for taker shares; SELL: maker gives shares for taker USDC
+        size, price = (taker, maker / taker) if side == "BUY" else (maker, taker / maker)
+        if not size or not price:
+            return web.json_response({"error": "invalid order amounts"}, status=400)
+
+        token_id = str(order.get("tokenId", ""))
+        filled = self.books.match(token_id, side, round(price, 6), size, fill_or_kill=order_type == "FOK")
+        order_id = "0x" + uuid.uuid4().hex
+        record = {"orderID": order_id, "token_id": token_id, "side": side, "price": price, "size": size,
+                  "filled": filled, "order_type": order_type, "received": received}
+        self.orders.append(record)
+
+        if order_type == "FOK" and filled == 0:
+            return web.json_response({"error": FOK_ERROR}, status=400)
+        return web.json_response({
+            "success": True,
+            "errorMsg": "",
+            "orderID": order_id,
+            "status": "matched" if filled else "live",
+            "makingAmount": f"{filled * price:.6f}" if side == "BUY" else f"{filled:.6f}",
+            "takingAmount": f"{filled:.6f}" if side == "BUY" else f"{filled * price:.6f}",
+            "transactionsHashes": [],
+        })
+
+    async def set_book(self, request):
+        body = await request.json()
+        self.books.books[str(body["token_id"])] = {"bids": _levels(body.get("bids", [])), "asks": _levels(body.get("asks", []))}
+        return web.json_response({"ok": True})
+
+    async def admin_orders(self, request):
+        return web.json_response(self.orders)
+
+    async def admin_stats(self, request):
+        return web.json_response({"requests": self.stats, "orders": len(self.orders)})
+
+    def app(self):
+        app = web.Application()
+        app.router.add_post("/auth/api-key", self.api_key)
+        app.router.add_get("/auth/derive-api-key", self.api_key)
+        app.router.add_get("/book", self.book)
+        app.router.add_post("/books", self.books_batch)
+        app.router.add_get("/tick-size", self.tick_size)
+        app.router.add_get("/neg-risk", self.neg_risk)
+        app.router.add_get("/fee-rate", self.fee_rate)
+        app.router.add_get("/time", self.server_time)
+        app.router.add_post("/order", self.post_order)
+        app.router.add_post("/admin/book", self.set_book)
+        app.router.add_get("/admin/orders", self.admin_orders)
+        app.router.add_get("/admin/stats", self.admin_stats)
+        return app
+
+def _route_latency(specs):
+    """["/order=80", "/book=20"] -> {"/order": 80.0, "/book": 20.0}"""
+    routes = {}
+    for spec in specs or []:
+        route, _, ms = spec.partition("=")
+        routes[route] = float(ms)
+    return routes
+
+def main():
+    parser = argparse.ArgumentParser(description="Local CLOB stand-in for execution latency benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--books", default=None, help="JSON file of scripted order books by token id")
+    parser.add_argument("--default-ask", type=float, default=0.35, help="Best ask for unscripted tokens")
+    parser.add_argument("--default-depth", type=int, default=5, help="Levels per side for unscripted tokens")
+    parser.add_argument("--default-size", type=float, default=100.0, help="Size per level for unscripted tokens")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Base latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform random latency")
+    parser.add_argument("--route-latency", nargs="*", default=None, help="Per-route base latency, e.g. /order=80")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    scripted = None
+    if args.books:
+        with open(args.books, "r") as f:
+            scripted = json.load(f)
+    books = OrderBooks(scripted, args.default_ask, args.default_depth, args.default_size)
+    server = ClobServer(books, args.latency_ms, args.jitter_ms, _route_latency(args.route_latency), args.seed)
+    print(f"CLOB stand-in on http://{args.host}:{args.port}")
+    web.run_app(server.app(), host=args.host, port=args.port, print=None)
+
+if __name__ == "__main__":
+    main()
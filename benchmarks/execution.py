@@ -0,0 +1,123 @@
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+# Detection-to-order latency of the sniper's execute_trade, against the local
+# CLOB stand-in (benchmarks/clob_server.py) rather than real money:
+#
+#     python3 benchmarks/clob_server.py --latency-ms 30 --jitter-ms 10
+#     python3 benchmarks/execution.py --host http://127.0.0.1:8002 --runs 20
+#
+# Reports end-to-end execute_trade times plus a per-stage breakdown (client
+# construction, API-key derivation, order book, signing, posting), and the
+# pre-armed path (ArmedOrders.fire) that only has to post.
+
+DEFAULT_HOST = "http://127.0.0.1:8002"
+# Throwaway signing key: the stand-in doesn't verify signatures
+BENCH_KEY = "0x" + "11" * 32
+
+def _summary(timings):
+    timings = sorted(timings)
+    return {
+        "min_ms": timings[0] * 1e3,
+        "median_ms": statistics.median(timings) * 1e3,
+        "p90_ms": timings[int(0.9 * (len(timings) - 1))] * 1e3,
+        "max_ms": timings[-1] * 1e3,
+    }
+
+def _print(name, timings):
+    s = _summary(timings)
+    print(f"  {name:<16} min {s['min_ms']:8.2f}ms  median {s['median_ms']:8.2f}ms  "
+          f"p90 {s['p90_ms']:8.2f}ms  max {s['max_ms']:8.2f}ms")
+
+def stage_breakdown(sniper, token_id, runs):
+    """Run the same steps as execute_trade one at a time and time each."""
+    from py_clob_client.client import ClobClient
+    from py_clob_client.clob_types import OrderArgs, OrderType
+    from py_clob_client.order_builder.constants import BUY
+
+    stages = {name: [] for name in ("client", "api_creds", "order_book", "sign", "post", "total")}
+    for _ in range(runs):
+        started = last = time.perf_counter()
+        def lap(name):
+            nonlocal last
+            now = time.perf_counter()
+            stages[name].append(now - last)
+            last = now
+
+        client = ClobClient(sniper.CLOB_HOST, key=sniper.PRIVATE_KEY, chain_id=137)
+        lap("client")
+        client.set_api_creds(client.create_or_derive_api_creds())
+        lap("api_creds")
+        book = client.get_order_book(token_id)
+        price = min(float(ask.price) for ask in book.asks) if book.asks else 0.99
+        lap("order_book")
+        signed_order = client.create_order(OrderArgs(price=price, size=5.0, side=BUY, token_id=token_id))
+        lap("sign")
+        client.post_order(signed_order, OrderType.FOK)
+        lap("post")
+        stages["total"].append(time.perf_counter() - started)
+    return stages
+
+def armed_fire(sniper, token_id, runs):
+    """Arm once, then time fire(); the consumed order is re-signed between runs (untimed)."""
+    armed = sniper.ArmedOrders({token_id: (sniper.ORDER_SIZE, sniper.MAX_PRICE)})
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        armed.arm()
+    arming = time.perf_counter() - started
+
+    timings = []
+    for _ in range(runs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            armed.refresh()
+            started = time.perf_counter()
+            resp = armed.fire(token_id)
+        timings.append(time.perf_counter() - started)
+        if resp is None:
+            raise RuntimeError("armed order was rejected; is the book deep enough?")
+    return arming, timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the sniper's execute_trade against a local CLOB")
+    parser.add_argument("--host", default=os.getenv("CLOB_HOST", DEFAULT_HOST), help="CLOB base URL")
+    parser.add_argument("--token-id", default="1" * 20, help="Token to buy (any id works on the stand-in)")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--pi", action="store_true", help="Benchmark nasa_sniper_raspi/sniper_pi.py instead")
+    args = parser.parse_args()
+
+    # The snipers read these at import time
+    os.environ["CLOB_HOST"] = args.host
+    os.environ.setdefault("PRIVATE_KEY", BENCH_KEY)
+    if args.pi:
+        sys.path.append(os.path.join(ROOT, "nasa_sniper_raspi"))
+        import sniper_pi as sniper
+    else:
+        from strategies.nasa_sniper import sniper
+
+    print(f"Timing execute_trade against {sniper.CLOB_HOST} ({args.runs} runs)")
+    end_to_end = []
+    for _ in range(args.runs):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            sniper.execute_trade(args.token_id)
+        end_to_end.append(time.perf_counter() - started)
+    _print("execute_trade", end_to_end)
+
+    print("Stages:")
+    for name, timings in stage_breakdown(sniper, args.token_id, args.runs).items():
+        _print(name, timings)
+
+    arming, timings = armed_fire(sniper, args.token_id, args.runs)
+    print(f"Pre-armed (arming took {arming * 1e3:.2f}ms once):")
+    _print("fire", timings)
+
+if __name__ == "__main__":
+    main()
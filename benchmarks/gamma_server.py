@@ -0,0 +1,171 @@
+import argparse
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+
+from aiohttp import web
+
+from synthetic import generate_events, generate_temperature_event
+
+# Local stand-in for gamma-api.polymarket.com/events.
+#
+# Serves a seeded synthetic universe (negRisk groups, scalar ladders, ranked
+# groups, plain markets, plus the NASA temperature event) with Gamma's
+# limit/offset/order/ascending/closed/id/slug query semantics, and can inject
+# latency, 429s and page drift (events closing and appearing between requests).
+# Point the scrapers at it with GAMMA_API_BASE:
+#
+#     python3 benchmarks/gamma_server.py --events 100000 --latency-ms 40 --rate-limit 0.02 --drift-every 20
+#     GAMMA_API_BASE=http://127.0.0.1:8001 python3 -m old_things.scraper --parallel
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 500
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+def _iso(seconds):
+    return (EPOCH + timedelta(seconds=seconds)).isoformat().replace("+00:00", "Z")
+
+def _truthy(value):
+    return str(value).lower() in ("true", "1")
+
+class GammaUniverse:
+    """The event set plus per-ordering sorted views, rebuilt lazily after drift."""
+
+    def __init__(self, n, seed=0, closed_fraction=0.1):
+        self.rng = random.Random(seed)
+        self.events = {}
+        self.clock = 0   # seconds after EPOCH; advances on every drift step
+        self.next_id = 100000 + n
+        for event in generate_events(n, seed) + [generate_temperature_event(seed)]:
+            self._decorate(event, closed=self.rng.random() < closed_fraction)
+            self.events[event["id"]] = event
+        self.clock = 86400 * 300
+        self.by_slug = {event["slug"]: event for event in self.events.values()}
+        self._views = {}
+
+    def _decorate(self, event, closed=False):
+        created = self.clock or self.rng.randint(0, 86400 * 300)
+        event.setdefault("slug", f"event-{event['id']}")
+        event["createdAt"] = _iso(created)
+        event["updatedAt"] = _iso(max(created, self.clock) + self.rng.randint(0, 3600))
+        event["active"] = True
+        event["archived"] = False
+        event["closed"] = closed
+        event["volume"] = round(self.rng.uniform(0, 5_000_000), 2)
+        event["liquidity"] = round(self.rng.uniform(0, 500_000), 2)
+
+    def _sort_key(self, order):
+        if order == "id":
+            return lambda event: int(event["id"])
+        return lambda event: (event.get(order) or 0, int(event["id"]))
+
+    def view(self, order, ascending, closed):
+        key = (order, ascending, closed)
+        if key not in self._views:
+            events = self.events.values()
+            if closed is not None:
+                events = [event for event in events if event["closed"] == closed]
+            self._views[key] = sorted(events, key=self._sort_key(order), reverse=not ascending)
+        return self._views[key]
+
+    def drift(self):
+        """One step of live churn: an open event closes, one is updated and a new one is listed."""
+        self.clock += 60
+        open_events = [event for event in self.events.values() if not event["closed"]]
+        if open_events:
+            closing = self.rng.choice(open_events)
+            closing["closed"] = True
+            closing["updatedAt"] = _iso(self.clock)
+            updated = self.rng.choice(open_events)
+            updated["updatedAt"] = _iso(self.clock)
+            for market in updated.get("markets", []):
+                if "bestAsk" in market:
+                    market["bestAsk"] = round(min(0.999, max(0.001, market["bestAsk"] + self.rng.uniform(-0.02, 0.02))), 3)
+
+        event = generate_events(1, seed=self.next_id)[0]
+        event["id"] = str(self.next_id)
+        for j, market in enumerate(event["markets"]):
+            market["id"] = f"{event['id']}-{j}"
+        self.next_id += 1
+        self._decorate(event)
+        self.events[event["id"]] = event
+        self.by_slug[event["slug"]] = event
+        self._views.clear()
+
+class GammaServer:
+    def __init__(self, universe, latency_ms=0.0, jitter_ms=0.0, rate_limit=0.0, retry_after="1",
+                 drift_every=0, seed=0):
+        self.universe = universe
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.drift_every = drift_every
+        self.rng = random.Random(seed + 1)
+        self.stats = {"requests": 0, "served": 0, "rate_limited": 0, "drift_steps": 0, "events": len(universe.events)}
+
+    async def events(self, request):
+        self.stats["requests"] += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self.rng.uniform(0, self.jitter))
+        if self.rate_limit and self.rng.random() < self.rate_limit:
+            self.stats["rate_limited"] += 1
+            return web.json_response({"error": "rate limited"}, status=429, headers={"Retry-After": self.retry_after})
+
+        query = request.query
+        ids = query.getall("id", [])
+        slugs = query.getall("slug", [])
+        if ids or slugs:
+            found = [self.universe.events[i] for i in ids if i in self.universe.events]
+            found += [self.universe.by_slug[s] for s in slugs if s in self.universe.by_slug]
+            self.stats["served"] += 1
+            return web.json_response(found)
+
+        try:
+            limit = min(int(query.get("limit", DEFAULT_LIMIT)), MAX_LIMIT)
+            offset = int(query.get("offset", 0))
+        except ValueError:
+            return web.json_response({"error": "invalid limit/offset"}, status=400)
+        order = query.get("order", "id")
+        ascending = _truthy(query.get("ascending", "false"))
+        closed = _truthy(query["closed"]) if "closed" in query else None
+
+        page = self.universe.view(order, ascending, closed)[offset:offset + limit]
+        self.stats["served"] += 1
+        if self.drift_every and self.stats["served"] % self.drift_every == 0:
+            self.universe.drift()
+            self.stats["drift_steps"] += 1
+            self.stats["events"] = len(self.universe.events)
+        return web.json_response(page)
+
+    async def stats_handler(self, request):
+        return web.json_response(self.stats)
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get("/events", self.events)
+        app.router.add_get("/stats", self.stats_handler)
+        return app
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Gamma /events stand-in with a synthetic universe")
+    parser.add_argument("--events", type=int, default=10_000, help="Universe size")
+    parser.add_argument("--seed", type=int, default=0, help="Universe seed")
+    parser.add_argument("--closed-fraction", type=float, default=0.1, help="Share of events already closed")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Base latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform random latency")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Probability of answering 429")
+    parser.add_argument("--retry-after", default="1", help="Retry-After header sent with 429s")
+    parser.add_argument("--drift-every", type=int, default=0, help="Close/update/list one event every N pages (0 = static)")
+    args = parser.parse_args()
+
+    universe = GammaUniverse(args.events, args.seed, args.closed_fraction)
+    server = GammaServer(universe, args.latency_ms, args.jitter_ms, args.rate_limit, args.retry_after,
+                         args.drift_every, args.seed)
+    print(f"Serving {len(universe.events)} events on http://{args.host}:{args.port}/events")
+    web.run_app(server.app(), host=args.host, port=args.port, print=None)
+
+if __name__ == "__main__":
+    main()
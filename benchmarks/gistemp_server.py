@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import hashlib
+import random
+import time
+from email.utils import formatdate
+
+from aiohttp import web
+
+from synthetic import generate_gistemp, generate_gistemp_csv
+
+# Local stand-in for data.giss.nasa.gov's GISTEMP tables, for timing the NASA
+# snipers' release detection. Serves GLB.Ts+dSST.txt and .csv with ETag/Last-Modified
+# (and 304s for matching conditional requests). November flips from "****" to
+# a value --release-after seconds after start. The NH/SH tables, which the
+# snipers watch as a release signal, change --related-lead seconds earlier.
+# Point the snipers at it with GISTEMP_BASE:
+#
+#     python3 benchmarks/gistemp_server.py --release-after 30 --latency-ms 40
+#     GISTEMP_BASE=http://127.0.0.1:8003 python3 strategies/nasa_sniper/sniper.py
+
+TABLE_PATH = "/gistemp/tabledata_v4/GLB.Ts+dSST"
+FORMATS = {"txt": (generate_gistemp, "text/plain"), "csv": (generate_gistemp_csv, "text/csv")}
+
+class GistempServer:
+    def __init__(self, release_after=None, latency_ms=0.0, jitter_ms=0.0, format_latency_ms=None,
+                 related_lead=0.0, seed=0):
+        self.started = time.time()
+        self.release_after = release_after
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.format_latency = {fmt: ms / 1000 for fmt, ms in (format_latency_ms or {}).items()}
+        self.related_lead = related_lead
+        self.rng = random.Random(seed)
+        self.files = {}   # (format, released) -> (body, etag, last_modified)
+        self.stats = {"requests": 0, "ok": 0, "not_modified": 0, "bytes": 0, "related": 0, "released_at": None}
+
+    @property
+    def released(self):
+        return self.release_after is not None and time.time() - self.started >= self.release_after
+
+    def _file(self, fmt, released):
+        if (fmt, released) not in self.files:
+            body = FORMATS[fmt][0](released=released).encode()
+            modified = self.started + (self.release_after if released else 0)
+            etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            self.files[fmt, released] = (body, etag, formatdate(modified, usegmt=True))
+        return self.files[fmt, released]
+
+    def _not_modified(self, request, etag, last_modified):
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(",")]
+        return request.headers.get("If-Modified-Since") == last_modified
+
+    async def table(self, request):
+        self.stats["requests"] += 1
+        fmt = request.match_info["fmt"]
+        latency = self.format_latency.get(fmt, self.latency)
+        if latency or self.jitter:
+            await asyncio.sleep(latency + self.rng.uniform(0, self.jitter))
+        released = self.released
+        if released and self.stats["released_at"] is None:
+            self.stats["released_at"] = self.started + self.release_after
+        body, etag, last_modified = self._file(fmt, released)
+        headers = {"ETag": etag, "Last-Modified": last_modified, "Cache-Control": "max-age=0"}
+        if self._not_modified(request, etag, last_modified):
+            self.stats["not_modified"] += 1
+            return web.Response(status=304, headers=headers)
+        self.stats["ok"] += 1
+        self.stats["bytes"] += len(body)
+        return web.Response(body=body, content_type=FORMATS[fmt][1], headers=headers)
+
+    async def related(self, request):
+        self.stats["related"] += 1
+        region = request.match_info["region"]
+        changed = (self.release_after is not None
+                   and time.time() - self.started >= self.release_after - self.related_lead)
+        modified = self.started + (self.release_after - self.related_lead if changed else 0)
+        body = f"{region} Land-Ocean Temperature Index ({'updated' if changed else 'previous'})\n"
+        return web.Response(text=body, headers={"Last-Modified": formatdate(modified, usegmt=True)})
+
+    async def stats_handler(self, request):
+        return web.json_response({**self.stats, "released": self.released})
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get(TABLE_PATH + ".{fmt:txt|csv}", self.table)
+        app.router.add_get("/gistemp/tabledata_v4/{region:NH|SH}.Ts+dSST.txt", self.related)
+        app.router.add_get("/stats", self.stats_handler)
+        return app
+
+def main():
+    parser = argparse.ArgumentParser(description="Local GISTEMP table stand-in with a scheduled release")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8003)
+    parser.add_argument("--release-after", type=float, default=None,
+                        help="Seconds until November is published (default: never)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Base latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform random latency")
+    parser.add_argument("--format-latency", nargs="*", default=None, help="Per-table base latency, e.g. csv=200")
+    parser.add_argument("--related-lead", type=float, default=0.0,
+                        help="Seconds before the release that the NH/SH tables change")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    format_latency = {fmt: float(ms) for fmt, _, ms in (spec.partition("=") for spec in args.format_latency or [])}
+    server = GistempServer(args.release_after, args.latency_ms, args.jitter_ms, format_latency,
+                           args.related_lead, args.seed)
+    print(f"GISTEMP stand-in on http://{args.host}:{args.port}{TABLE_PATH}.txt (and .csv)")
+    web.run_app(server.app(), host=args.host, port=args.port, print=None)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from synthetic import generate_events, generate_gistemp, generate_prices, generate_temperatures
+
+# Microbenchmarks for the strategy and sniper hot paths.
+#
+# Every benchmark is timed at each size (1k/10k/100k events by default) on
+# deterministic synthetic inputs, best-of-N wall time. A run is written to
+# benchmarks/results/<timestamp>.json and compared with the previous run, so
+# optimisations can be checked against a baseline:
+#
+#     python3 benchmarks/run.py
+#     python3 benchmarks/run.py --sizes 1000 10000 --only negative_risk
+#     python3 benchmarks/run.py --compare benchmarks/results/<older>.json
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+def _load_targets():
+    """Import the code under test. Optional pieces are skipped (with a reason) if their deps are missing."""
+    targets, skipped = {}, {}
+
+    from strategies.arbitrage.strategy import ArbitrageStrategy, ArbitrageStrategyConfig
+    targets["arb"] = ArbitrageStrategy(ArbitrageStrategyConfig(instrument_id="BENCH"))
+
+    import mocks
+    targets["mocks"] = mocks
+
+    try:
+        from old_things.arbitrage import ArbitrageFinder
+        # The algorithmic checks don't touch the LLM/key state set up in __init__
+        targets["finder"] = ArbitrageFinder.__new__(ArbitrageFinder)
+    except ImportError as e:
+        skipped["old_things.arbitrage"] = str(e)
+
+    try:
+        from strategies.nasa_sniper import sniper
+        targets["sniper"] = sniper
+    except ImportError as e:
+        skipped["strategies.nasa_sniper.sniper"] = str(e)
+
+    return targets, skipped
+
+def _benchmarks(targets):
+    """name -> (setup(n) -> input, run(input)). Inputs are built outside the timed region."""
+    benches = {}
+    arb = targets["arb"]
+    benches["negative_risk"] = (generate_events, arb.check_negative_risk)
+    benches["spread_arb"] = (generate_events, arb.check_spread_arb)
+
+    def universe(n):
+        from markets import Universe
+        return Universe(generate_events(n))
+    benches["negative_risk_vectorized"] = (universe, arb.check_negative_risk_vectorized)
+
+    if "finder" in targets:
+        finder = targets["finder"]
+        benches["find_algo_arbitrage"] = (generate_events, finder.find_algo_arbitrage)
+        benches["mutual_exclusive_no"] = (generate_events, finder.check_mutual_exclusive_no)
+
+    mocks = targets["mocks"]
+    def indicators(prices):
+        ema_short, ema_long = mocks.ExponentialMovingAverage(10), mocks.ExponentialMovingAverage(20)
+        rsi, macd = mocks.RelativeStrengthIndex(14), mocks.MovingAverageConvergenceDivergence()
+        for price in prices:
+            ema_short.update(price)
+            ema_long.update(price)
+            rsi.update(price)
+            macd.update(price)
+    benches["indicators"] = (generate_prices, indicators)
+
+    if "sniper" in targets:
+        sniper = targets["sniper"]
+        def token_lookups(values):
+            for value in values:
+                sniper.get_token_id(value)
+        benches["get_token_id"] = (generate_temperatures, token_lookups)
+
+        def gistemp_scans(n):
+            return n, generate_gistemp(released=True)
+        def scan(args):
+            n, text = args
+            for _ in range(n):
+                sniper.parse_gistemp_txt(text, (2025,))
+        benches["gistemp_regex"] = (gistemp_scans, scan)
+
+        def gistemp_streams(n):
+            # The body as it comes off the wire, one TCP segment per chunk
+            body = generate_gistemp(released=True).encode()
+            return n, [body[i:i + 1460] for i in range(0, len(body), 1460)]
+        def stream(args):
+            n, chunks = args
+            for _ in range(n):
+                scanner = sniper.RowScanner((2025,), csv=False)
+                for chunk in chunks:
+                    if scanner.feed(chunk) is not None:
+                        break
+        benches["gistemp_stream"] = (gistemp_streams, stream)
+    return benches
+
+def time_benchmark(setup, run, n, repeat):
+    data = setup(n)
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run(data)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "n": n,
+        "best_s": best,
+        "mean_s": statistics.mean(timings),
+        "repeat": repeat,
+        "per_item_us": best / n * 1e6,
+        "items_per_s": n / best if best > 0 else None,
+    }
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _previous_result(exclude=None):
+    if not os.path.isdir(RESULTS_DIR):
+        return None
+    runs = sorted(f for f in os.listdir(RESULTS_DIR) if f.endswith(".json"))
+    runs = [os.path.join(RESULTS_DIR, f) for f in runs if os.path.join(RESULTS_DIR, f) != exclude]
+    return runs[-1] if runs else None
+
+def compare(current, baseline_path):
+    with open(baseline_path, "r") as f:
+        baseline = json.load(f)
+    print(f"\nCompared with {os.path.basename(baseline_path)} ({baseline.get('commit')}):")
+    old = {(r["name"], r["n"]): r for r in baseline.get("results", [])}
+    for result in current["results"]:
+        previous = old.get((result["name"], result["n"]))
+        if previous and previous["best_s"] > 0:
+            ratio = result["best_s"] / previous["best_s"]
+            print(f"  {result['name']:<26} n={result['n']:<7} {previous['best_s'] * 1e3:10.2f}ms -> "
+                  f"{result['best_s'] * 1e3:10.2f}ms  x{1 / ratio:.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the hot-path microbenchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Input sizes (events)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark and size (best is kept)")
+    parser.add_argument("--only", nargs="+", default=None, help="Only run these benchmarks")
+    parser.add_argument("--compare", default=None, help="Baseline result JSON (default: the previous run)")
+    parser.add_argument("--no-save", action="store_true", help="Don't write the result JSON")
+    args = parser.parse_args()
+
+    # Relative paths inside the code under test (e.g. the sniper's token map) assume the repo root
+    os.chdir(ROOT)
+    targets, skipped = _load_targets()
+    for name, reason in skipped.items():
+        print(f"Skipping {name}: {reason}")
+
+    benches = _benchmarks(targets)
+    names = [name for name in benches if not args.only or name in args.only]
+
+    results = []
+    for name in names:
+        setup, run = benches[name]
+        for n in args.sizes:
+            result = {"name": name, **time_benchmark(setup, run, n, args.repeat)}
+            results.append(result)
+            print(f"{name:<26} n={n:<7} best {result['best_s'] * 1e3:10.2f}ms  "
+                  f"{result['per_item_us']:8.2f}us/item")
+
+    run = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "sizes": args.sizes,
+        "skipped": skipped,
+        "results": results,
+    }
+
+    path = None
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, "w") as f:
+            json.dump(run, f, indent=2)
+        print(f"\nSaved results to {path}")
+
+    baseline = args.compare or _previous_result(exclude=path)
+    if baseline:
+        compare(run, baseline)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import json
+import random
+
+# Deterministic synthetic inputs for the benchmarks.
+#
+# Events are Gamma-shaped dicts (JSON-encoded outcomes/prices/token ids, the
+# way the API returns them) with a realistic mix of the shapes the strategies
+# care about: negRisk multi-outcome events, scalar threshold ladders, "#N" rank
+# groups and plain binary events. The same (n, seed) always gives the same data.
+
+LADDER_SUBJECTS = ["bitcoin", "ethereum", "solana", "cpi", "unemployment", "s&p 500", "gold", "fed rate"]
+RANK_SUBJECTS = ["chatgpt", "threads", "tiktok", "temu", "gemini", "capcut"]
+
+def _market(rng, market_id, question, yes, best_ask=True):
+    no = round(1.0 - yes + rng.uniform(-0.02, 0.02), 3)
+    market = {
+        "id": market_id,
+        "question": question,
+        "outcomes": json.dumps(["Yes", "No"]),
+        "outcomePrices": json.dumps([f"{yes:.3f}", f"{no:.3f}"]),
+        "clobTokenIds": json.dumps([str(rng.getrandbits(250)), str(rng.getrandbits(250))]),
+    }
+    if best_ask:
+        market["bestBid"] = round(max(0.001, yes - 0.01), 3)
+        market["bestAsk"] = round(min(0.999, yes + 0.01), 3)
+    return market
+
+def generate_events(n, seed=0):
+    """n Gamma-shaped events; about 30% negRisk, 25% ladder rungs, 15% rank legs, 30% plain."""
+    rng = random.Random(seed)
+    events = []
+    for i in range(n):
+        event_id = str(100000 + i)
+        kind = rng.random()
+        if kind < 0.30:
+            # Multi-outcome negRisk event; Yes prices sum to roughly 1
+            k = rng.randint(2, 12)
+            weights = [rng.random() for _ in range(k)]
+            scale = rng.uniform(0.95, 1.08) / sum(weights)
+            markets = [
+                _market(rng, f"{event_id}-{j}", f"Will candidate {j} win event {i}?", min(0.99, w * scale), rng.random() < 0.8)
+                for j, w in enumerate(weights)
+            ]
+            title, neg_risk = f"Winner of event {i}", True
+        elif kind < 0.55:
+            subject = rng.choice(LADDER_SUBJECTS)
+            operator = rng.choice([">", ">", "<", ">="])
+            threshold = rng.randint(1, 200) * 500
+            title, neg_risk = f"{subject} {operator} {threshold:,} by june?", False
+            markets = [_market(rng, f"{event_id}-0", title, rng.uniform(0.02, 0.98))]
+        elif kind < 0.70:
+            subject = rng.choice(RANK_SUBJECTS)
+            title, neg_risk = f"{subject} #{rng.randint(1, 10)} free app on friday?", False
+            markets = [_market(rng, f"{event_id}-0", title, rng.uniform(0.01, 0.6))]
+        else:
+            title, neg_risk = f"Will thing {i} happen?", False
+            markets = [_market(rng, f"{event_id}-0", title, rng.uniform(0.01, 0.99), rng.random() < 0.5)]
+        events.append({
+            "id": event_id,
+            "title": title,
+            "negRisk": neg_risk,
+            "tags": [{"label": rng.choice(["Politics", "Crypto", "Sports", "Economy"])}],
+            "markets": markets,
+        })
+    return events
+
+def generate_prices(n, seed=0):
+    """n closes of a bounded random walk in (0, 1), like a Polymarket Yes price."""
+    rng = random.Random(seed)
+    price, prices = 0.5, []
+    for _ in range(n):
+        price = min(0.99, max(0.01, price + rng.gauss(0, 0.01)))
+        prices.append(price)
+    return prices
+
+def _gistemp_rows(released, first_year, last_year):
+    """(year, 12 monthly anomalies in 0.01ºC, None where unpublished) shared by the .txt and .csv tables."""
+    rng = random.Random(first_year * 31 + last_year)
+    rows = []
+    for year in range(first_year, last_year + 1):
+        base = int((year - 1950) * 1.2)
+        months = [base + rng.randint(-25, 25) for _ in range(12)]
+        if year == last_year:
+            months[10] = base + 3 if released else None
+            months[11] = None
+        rows.append((year, months))
+    return rows
+
+def generate_gistemp(released=False, first_year=1880, last_year=2025):
+    """
+    GLB.Ts+dSST.txt-shaped table. The last year's November column is "****"
+    until `released`, like the file before the monthly update.
+    """
+    header = "Year   Jan  Feb  Mar  Apr  May  Jun  Jul  Aug  Sep  Oct  Nov  Dec    J-D D-N    DJF  MAM  JJA  SON  Year"
+    lines = [
+        "        GLOBAL Land-Ocean Temperature Index in 0.01 degrees Celsius   base period: 1951-1980",
+        "",
+    ]
+    for year, months in _gistemp_rows(released, first_year, last_year):
+        if (year - first_year) % 20 == 0:
+            lines.extend(["", header])
+        cells = [f"{m:4d}" if m is not None else "****" for m in months]
+        lines.append(f"{year}  " + " ".join(cells) + "   ***  ***    ***  ***  ***  ***  " + str(year))
+    lines.extend(["", "Best estimate for absolute global mean for 1951-1980 is 14.0 deg-C or 57.2 deg-F,"])
+    return "\n".join(lines) + "\n"
+
+def generate_gistemp_csv(released=False, first_year=1880, last_year=2025):
+    """The same table as GLB.Ts+dSST.csv: degrees Celsius, "***" where unpublished."""
+    lines = ["Land-Ocean: Global Means", "Year,Jan,Feb,Mar,Apr,May,Jun,Jul,Aug,Sep,Oct,Nov,Dec,J-D,D-N,DJF,MAM,JJA,SON"]
+    for year, months in _gistemp_rows(released, first_year, last_year):
+        cells = [f"{m / 100:.2f}" if m is not None else "***" for m in months]
+        lines.append(",".join([str(year)] + cells + ["***"] * 6))
+    return "\n".join(lines) + "\n"
+
+def generate_temperatures(n, seed=0):
+    """n anomaly values (degrees C) spread over the token map's brackets."""
+    rng = random.Random(seed)
+    return [round(rng.uniform(1.0, 1.4), 2) for _ in range(n)]
+
+# Bracket labels as Polymarket lists them for the monthly GISTEMP market
+TEMPERATURE_BRACKETS = ["<1.10ºC", "1.10–1.14ºC", "1.15–1.19ºC", "1.20–1.24ºC", "1.25–1.29ºC", ">1.29ºC"]
+TEMPERATURE_SLUG = "november-2025-temperature-increase-c"
+
+def generate_temperature_event(seed=0, event_id="900000"):
+    """The NASA sniper's bracket event (negRisk, one market per bracket), as Gamma returns it."""
+    rng = random.Random(seed)
+    markets = []
+    for j, label in enumerate(TEMPERATURE_BRACKETS):
+        market = _market(rng, f"{event_id}-{j}", f"Will November 2025 be {label}?", rng.uniform(0.02, 0.4))
+        market["groupItemTitle"] = label
+        markets.append(market)
+    return {
+        "id": event_id,
+        "title": "November 2025 Temperature Increase (ºC)",
+        "slug": TEMPERATURE_SLUG,
+        "negRisk": True,
+        "tags": [{"label": "Science"}],
+        "markets": markets,
+    }
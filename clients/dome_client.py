@@ -1,6 +1,8 @@
 import requests
 import os
-from typing import Optional, Dict, Any, List
+import asyncio
+import random
+from typing import Optional, Dict, Any, List, AsyncIterator, Iterator
 
 class DomeClient:
     """
@@ -17,11 +19,14 @@ class DomeClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        # Reuse one connection across calls instead of a new handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
 
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
         url = f"{self.BASE_URL}{endpoint}"
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -44,14 +49,57 @@ class DomeClient:
             
         return self._get(endpoint, params)
 
-    def get_history(self, market_slug: str) -> List[Dict[str, Any]]:
+    def get_market(self, market_slug: str) -> Optional[Dict[str, Any]]:
         """
-        Fetch historical data for a market.
-        Note: Endpoint to be confirmed.
+        Fetch a single market by slug, or None if Dome doesn't know it.
         """
-        # Placeholder
-        print("get_history not yet implemented (endpoint unknown)")
-        return []
+        markets, _ = _unwrap_markets(self.get_markets(market_slug=market_slug, limit=1), 1)
+        return markets[0] if markets else None
+
+    # Longest range Dome serves per candlestick request, by interval (minutes -> seconds)
+    CANDLE_WINDOWS = {1: 7 * 86400, 60: 30 * 86400, 1440: 365 * 86400}
+
+    def get_candlesticks(self, condition_id: str, start_time: int, end_time: int, interval: int = 60) -> Any:
+        """
+        Fetch OHLC candlesticks for both tokens of a market in one time window.
+        start_time/end_time are UNIX seconds; interval is 1, 60 or 1440 minutes.
+        """
+        endpoint = f"/polymarket/candlesticks/{condition_id}"
+        params = {"start_time": int(start_time), "end_time": int(end_time), "interval": interval}
+        return self._get(endpoint, params)
+
+    def iter_history(self, condition_id: str, start_time: int, end_time: int,
+                     interval: int = 60) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield a market's price history one API window at a time, oldest first.
+        Each chunk is a list of flat candles (see _unwrap_candles) sorted by time,
+        so callers can convert and persist it before fetching the next window.
+        """
+        window = self.CANDLE_WINDOWS.get(interval, self.CANDLE_WINDOWS[60])
+        last_ts = {}
+        start = int(start_time)
+        while start < end_time:
+            end = min(start + window, int(end_time))
+            candles = []
+            # Windows share their boundary, so drop candles already yielded
+            for candle in _unwrap_candles(self.get_candlesticks(condition_id, start, end, interval)):
+                if candle["ts"] > last_ts.get(candle["token_id"], -1):
+                    candles.append(candle)
+            candles.sort(key=lambda c: c["ts"])
+            for candle in candles:
+                last_ts[candle["token_id"]] = candle["ts"]
+            if candles:
+                yield candles
+            start = end
+
+    def get_history(self, condition_id: str, start_time: int, end_time: int,
+                    interval: int = 60) -> List[Dict[str, Any]]:
+        """
+        Fetch historical candles for a market (all windows, both tokens).
+        Prefer iter_history for long ranges to keep memory flat.
+        """
+        return [candle for chunk in self.iter_history(condition_id, start_time, end_time, interval)
+                for candle in chunk]
 
     def get_orderbook(self, token_id: str) -> Dict[str, Any]:
         """
@@ -61,6 +109,194 @@ class DomeClient:
         print("get_orderbook not yet implemented")
         return {}
 
+class AsyncDomeClient:
+    """
+    Async sibling of DomeClient.
+    All calls share one aiohttp session (keep-alive pooled), are capped by a
+    concurrency semaphore and retried with jittered backoff on 429/5xx.
+
+    Usage:
+        async with AsyncDomeClient() as client:
+            async for page in client.iter_markets(limit=100):
+                ...
+    """
+    BASE_URL = DomeClient.BASE_URL
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, api_key: Optional[str] = None, max_concurrency: int = 16,
+                 max_retries: int = 5, backoff_base: float = 0.5, backoff_cap: float = 10.0,
+                 timeout: float = 30.0):
+        self.api_key = api_key or os.getenv("DOME_API_KEY")
+        if not self.api_key:
+            raise ValueError("Dome API Key is required. Set DOME_API_KEY env var or pass to constructor.")
+
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        # aiohttp is only needed here, so the sync DomeClient works without it
+        import aiohttp
+
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session = None   # aiohttp.ClientSession, opened on first use
+
+    async def __aenter__(self):
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _ensure_session(self):
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            # Pool sized to the concurrency cap so every in-flight call has a warm connection
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=60, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=self.timeout)
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        # Honour Retry-After when the server sends one, otherwise full-jitter exponential backoff
+        if retry_after:
+            try:
+                return min(self.backoff_cap, float(retry_after))
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        import aiohttp
+
+        url = f"{self.BASE_URL}{endpoint}"
+        session = self._ensure_session()
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                async with self._semaphore:
+                    async with session.get(url, params=params) as response:
+                        if response.status in self.RETRY_STATUSES and attempt < self.max_retries:
+                            retry_after = response.headers.get("Retry-After")
+                        else:
+                            if response.status >= 400:
+                                print(f"Dome API Error: {await response.text()}")
+                            response.raise_for_status()
+                            return await response.json()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    print(f"Request Error: {e}")
+                    raise e
+            # Sleep outside the semaphore so backing-off calls don't hold a slot
+            await asyncio.sleep(self._backoff(attempt, retry_after))
+
+    async def get_markets(self, market_slug: Optional[str] = None, limit: int = 100,
+                          offset: Optional[int] = None) -> Any:
+        """
+        Fetch one page of markets from Dome API.
+        """
+        params = {"market_slug": market_slug, "limit": limit or None, "offset": offset}
+        return await self._get("/polymarket/markets", params)
+
+    async def iter_markets(self, limit: int = 100, max_pages: Optional[int] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Async iterator over get_markets pages, following offset pagination
+        until the API reports no more results.
+        """
+        offset = 0
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            data = await self.get_markets(limit=limit, offset=offset)
+            markets, has_more = _unwrap_markets(data, limit)
+            if not markets:
+                return
+            yield markets
+            pages += 1
+            if not has_more:
+                return
+            offset += len(markets)
+
+    async def get_markets_by_slugs(self, slugs: List[str], limit: int = 100) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Fetch many markets concurrently (bounded by max_concurrency).
+        Each result is the slug's list of markets, unwrapped like iter_markets pages,
+        in the same order as `slugs`; failed lookups are None.
+        """
+        async def fetch(slug):
+            try:
+                markets, _ = _unwrap_markets(await self.get_markets(market_slug=slug, limit=limit), limit)
+                return markets
+            except Exception as e:
+                print(f"Failed to fetch {slug}: {e}")
+                return None
+
+        return await asyncio.gather(*(fetch(slug) for slug in slugs))
+
+def _unwrap_markets(data: Any, limit: int):
+    """
+    Normalise a markets response to (markets, has_more).
+    Dome wraps pages as {"markets": [...], "pagination": {...}}; bare lists are also accepted.
+    """
+    if isinstance(data, dict):
+        markets = data.get("markets", [])
+        pagination = data.get("pagination") or {}
+        has_more = pagination.get("has_more", len(markets) >= limit)
+        return markets, has_more
+    markets = data or []
+    return markets, len(markets) >= limit
+
+def _candle_price(block: Any, field: str) -> Optional[float]:
+    # Dome sends prices both as "<field>_dollars" strings and integer cents under "<field>"
+    if not isinstance(block, dict):
+        return None
+    value = block.get(f"{field}_dollars")
+    if value is None:
+        value = block.get(field)
+        if value is None:
+            return None
+        return value / 100 if isinstance(value, int) else float(value)
+    return float(value)
+
+def _unwrap_candles(data: Any) -> List[Dict[str, Any]]:
+    """
+    Flatten a candlesticks response to one dict per candle:
+    {"token_id", "ts" (UNIX seconds, end of period), "open", "high", "low", "close",
+     "volume", "bid", "ask"}. Prices are dollars (0-1); bid/ask may be None.
+    Dome nests candles as {"candlesticks": [[candles, {"token_id": ...}], ...]}.
+    """
+    series = data.get("candlesticks", []) if isinstance(data, dict) else data or []
+    candles = []
+    for entry in series:
+        if not isinstance(entry, (list, tuple)) or len(entry) < 2:
+            continue
+        rows, meta = entry[0], entry[1] or {}
+        token_id = str(meta.get("token_id", ""))
+        for row in rows or []:
+            price = row.get("price") or {}
+            close = _candle_price(price, "close")
+            if close is None:
+                continue
+            candle = {"token_id": token_id, "ts": int(row.get("end_period_ts", 0)), "close": close}
+            for field in ("open", "high", "low"):
+                value = _candle_price(price, field)
+                candle[field] = close if value is None else value
+            candle["volume"] = float(row.get("volume") or 0)
+            candle["bid"] = _candle_price(row.get("yes_bid"), "close")
+            candle["ask"] = _candle_price(row.get("yes_ask"), "close")
+            candles.append(candle)
+    return candles
+
 if __name__ == "__main__":
     # Test the client
     # User provided key: 4d324782-861d-495a-84be-8b710d0c5735
@@ -0,0 +1,180 @@
+import argparse
+from datetime import datetime, timezone
+
+from nautilus_trader.model.currencies import USDC
+from nautilus_trader.model.data import Bar, BarType, QuoteTick
+from nautilus_trader.model.enums import AssetClass
+from nautilus_trader.model.identifiers import InstrumentId, Symbol
+from nautilus_trader.model.instruments import BinaryOption
+from nautilus_trader.model.objects import Price, Quantity
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from clients.dome_client import DomeClient
+
+# Dome price history -> Nautilus ParquetDataCatalog.
+#
+# History is pulled one candlestick window at a time (DomeClient.iter_history),
+# converted to Bars (and optionally QuoteTicks) and written to the catalog in
+# batches, so neither the download nor the conversion ever holds a whole
+# market's history. backtest.py then streams the catalog back in chunks.
+
+CATALOG_PATH = "data/catalog"
+
+PRICE_PRECISION = 3
+SIZE_PRECISION = 2
+QUOTE_SIZE = Quantity(1, SIZE_PRECISION)   # candles carry no depth; nominal top-of-book size
+
+BAR_SPECS = {1: "1-MINUTE", 60: "1-HOUR", 1440: "1-DAY"}
+
+def instrument_id_for(condition_id, token_id):
+    # Same "<condition>-<token>.POLYMARKET" scheme as Nautilus' Polymarket adapter
+    return InstrumentId.from_str(f"{condition_id}-{token_id}.POLYMARKET")
+
+def bar_type_for(instrument_id, interval=60):
+    return BarType.from_str(f"{instrument_id}-{BAR_SPECS[interval]}-LAST-EXTERNAL")
+
+def _to_ns(value):
+    if not value:
+        return 0
+    if isinstance(value, str):
+        return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1e9)
+    return int(value) * 1_000_000_000
+
+def make_instrument(market, token_id, outcome):
+    """BinaryOption for one outcome token of a Dome market record."""
+    instrument_id = instrument_id_for(market["condition_id"], token_id)
+    return BinaryOption(
+        instrument_id=instrument_id,
+        raw_symbol=Symbol(str(token_id)),
+        asset_class=AssetClass.ALTERNATIVE,
+        currency=USDC,
+        price_precision=PRICE_PRECISION,
+        size_precision=SIZE_PRECISION,
+        price_increment=Price(0.001, PRICE_PRECISION),
+        size_increment=Quantity(0.01, SIZE_PRECISION),
+        activation_ns=_to_ns(market.get("start_time")),
+        expiration_ns=_to_ns(market.get("end_time")),
+        ts_event=0,
+        ts_init=0,
+        outcome=outcome,
+        description=market.get("title") or market.get("market_slug"),
+    )
+
+def _price(value):
+    return Price(min(max(value, 0.0), 1.0), PRICE_PRECISION)
+
+def candle_to_bar(candle, bar_type):
+    ts = candle["ts"] * 1_000_000_000
+    high = max(candle["open"], candle["high"], candle["low"], candle["close"])
+    low = min(candle["open"], candle["high"], candle["low"], candle["close"])
+    return Bar(
+        bar_type=bar_type,
+        open=_price(candle["open"]),
+        high=_price(high),
+        low=_price(low),
+        close=_price(candle["close"]),
+        volume=Quantity(candle["volume"], SIZE_PRECISION),
+        ts_event=ts,
+        ts_init=ts,
+    )
+
+def candle_to_quote(candle, instrument_id):
+    """Closing top of book for the candle, or None if Dome had no bid/ask."""
+    if candle["bid"] is None or candle["ask"] is None:
+        return None
+    ts = candle["ts"] * 1_000_000_000
+    return QuoteTick(
+        instrument_id=instrument_id,
+        bid_price=_price(candle["bid"]),
+        ask_price=_price(candle["ask"]),
+        bid_size=QUOTE_SIZE,
+        ask_size=QUOTE_SIZE,
+        ts_event=ts,
+        ts_init=ts,
+    )
+
+def _tokens(market):
+    # Dome lists the two outcome tokens as side_a / side_b
+    for side in ("side_a", "side_b"):
+        token = market.get(side) or {}
+        if token.get("id"):
+            yield str(token["id"]), token.get("label")
+
+def ingest_market(client, catalog, market, start_time, end_time, interval=60,
+                  batch_size=10_000, quotes=False):
+    """
+    Pull one market's history into the catalog. Returns the number of bars written.
+    Bars (and quotes) are buffered per token and flushed every `batch_size` rows;
+    windows arrive oldest first, so each flush is a disjoint, sorted time range.
+    """
+    tokens = dict(_tokens(market))
+    if not tokens:
+        print(f"Skipping {market.get('market_slug')}: no token ids")
+        return 0
+
+    instruments = {token_id: make_instrument(market, token_id, label) for token_id, label in tokens.items()}
+    catalog.write_data(list(instruments.values()))
+    bar_types = {token_id: bar_type_for(instrument.id, interval) for token_id, instrument in instruments.items()}
+
+    bars = {token_id: [] for token_id in tokens}
+    ticks = {token_id: [] for token_id in tokens}
+    written = 0
+
+    def flush(token_id):
+        nonlocal written
+        if bars[token_id]:
+            catalog.write_data(bars[token_id])
+            written += len(bars[token_id])
+            bars[token_id] = []
+        if ticks[token_id]:
+            catalog.write_data(ticks[token_id])
+            ticks[token_id] = []
+
+    for chunk in client.iter_history(market["condition_id"], start_time, end_time, interval):
+        for candle in chunk:
+            token_id = candle["token_id"]
+            if token_id not in instruments:
+                continue
+            bars[token_id].append(candle_to_bar(candle, bar_types[token_id]))
+            if quotes:
+                tick = candle_to_quote(candle, instruments[token_id].id)
+                if tick is not None:
+                    ticks[token_id].append(tick)
+            if len(bars[token_id]) >= batch_size:
+                flush(token_id)
+
+    for token_id in tokens:
+        flush(token_id)
+    return written
+
+def _parse_time(value):
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest Dome price history into a Nautilus ParquetDataCatalog")
+    parser.add_argument("slugs", nargs="+", help="Polymarket market slugs")
+    parser.add_argument("--start", required=True, help="Start date/time (ISO, UTC)")
+    parser.add_argument("--end", default=None, help="End date/time (ISO, UTC); default now")
+    parser.add_argument("--interval", type=int, default=60, choices=sorted(BAR_SPECS), help="Candle interval in minutes")
+    parser.add_argument("--catalog", default=CATALOG_PATH, help="Catalog directory")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="Rows per catalog write")
+    parser.add_argument("--quotes", action="store_true", help="Also write closing bid/ask as QuoteTicks")
+    args = parser.parse_args()
+
+    start = _parse_time(args.start)
+    end = _parse_time(args.end) if args.end else int(datetime.now(timezone.utc).timestamp())
+
+    client = DomeClient()
+    catalog = ParquetDataCatalog(args.catalog)
+    for slug in args.slugs:
+        market = client.get_market(slug)
+        if not market:
+            print(f"Market not found: {slug}")
+            continue
+        count = ingest_market(client, catalog, market, start, end, args.interval, args.batch_size, args.quotes)
+        print(f"{slug}: wrote {count} bars")
+
+if __name__ == "__main__":
+    main()
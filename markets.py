@@ -0,0 +1,177 @@
+import json
+import numpy as np
+
+# Pre-parsed market universe.
+#
+# Gamma returns `outcomes`, `outcomePrices` and `clobTokenIds` as JSON-encoded
+# strings. Parse each event once at ingest into compact __slots__ records
+# (Event/Market) and, for vectorised scans, into flat NumPy arrays (Universe).
+# Strategies consume these instead of re-parsing raw dicts on every scan.
+
+# Universe.markets flags
+FLAG_NEG_RISK = 1   # parent event is flagged negRisk / mutually_exclusive
+FLAG_HAS_ASK = 2    # bestAsk was quoted
+FLAG_HAS_YES = 4    # a "Yes" outcome price was parsed
+FLAG_HAS_NO = 8     # a "No" outcome price was parsed
+
+MARKET_DTYPE = np.dtype([
+    ("event_index", np.int32),
+    ("yes_bid", np.float64),
+    ("yes_ask", np.float64),
+    ("no_bid", np.float64),
+    ("no_ask", np.float64),
+    ("yes_price", np.float64),
+    ("no_price", np.float64),
+    ("yes_token", "S78"),   # uint256 token ids have up to 78 digits
+    ("no_token", "S78"),
+    ("flags", np.uint8),
+])
+
+def _json_list(value):
+    if isinstance(value, str):
+        value = json.loads(value)
+    return list(value) if isinstance(value, (list, tuple)) else []
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _positive_float(value):
+    # Gamma sends 0 / "" / null for "no quote"; treat all of them as missing
+    if not value:
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+class Market:
+    """One binary market, parsed once. Prices are floats, missing values are None (also inside `prices`)."""
+    __slots__ = (
+        "id", "event_index", "question", "group_title",
+        "outcomes", "prices", "tokens",
+        "best_bid", "best_ask",
+        "yes_price", "no_price", "yes_token", "no_token",
+    )
+
+    def __init__(self, raw, event_index=0):
+        self.id = raw.get("id")
+        self.event_index = event_index
+        self.question = raw.get("question")
+        self.group_title = raw.get("groupItemTitle")
+        self.best_bid = _positive_float(raw.get("bestBid"))
+        self.best_ask = _positive_float(raw.get("bestAsk"))
+
+        # One unparseable price only blanks that outcome (None); an unparseable list leaves prices empty
+        try:
+            self.prices = [_float(p) for p in _json_list(raw.get("outcomePrices"))]
+        except ValueError:
+            self.prices = []
+        try:
+            self.outcomes = _json_list(raw["outcomes"]) if "outcomes" in raw else ["Yes", "No"]
+        except ValueError:
+            self.outcomes = []
+        try:
+            self.tokens = [str(t) for t in _json_list(raw.get("clobTokenIds"))]
+        except ValueError:
+            self.tokens = []
+
+        self.yes_price = self._outcome(self.prices, "Yes")
+        self.no_price = self._outcome(self.prices, "No")
+        self.yes_token = self._outcome(self.tokens, "Yes")
+        self.no_token = self._outcome(self.tokens, "No")
+
+    def _outcome(self, values, outcome):
+        if outcome not in self.outcomes:
+            return None
+        index = self.outcomes.index(outcome)
+        return values[index] if index < len(values) else None
+
+    @property
+    def yes_ask(self):
+        """Price to buy Yes: the quoted best ask, falling back to the Yes outcome price."""
+        return self.best_ask if self.best_ask is not None else self.yes_price
+
+    @property
+    def yes_bid(self):
+        return self.best_bid if self.best_bid is not None else self.yes_price
+
+    @property
+    def no_ask(self):
+        # Buying No is selling Yes at the bid on a binary book
+        return 1.0 - self.best_bid if self.best_bid is not None else self.no_price
+
+    @property
+    def no_bid(self):
+        return 1.0 - self.best_ask if self.best_ask is not None else self.no_price
+
+class Event:
+    """One Gamma event with its markets parsed. `neg_risk` covers both negRisk flags."""
+    __slots__ = ("id", "index", "title", "neg_risk", "neg_risk_flag", "tags", "markets")
+
+    def __init__(self, raw, index=0):
+        self.id = raw.get("id")
+        self.index = index
+        self.title = raw.get("title") or ""
+        self.neg_risk_flag = raw.get("negRisk") is True
+        self.neg_risk = bool(raw.get("negRisk", False) or raw.get("mutually_exclusive", False))
+        self.tags = [tag.get("label") for tag in raw.get("tags") or [] if isinstance(tag, dict)]
+        self.markets = [Market(market, index) for market in raw.get("markets") or []]
+
+def iter_normalized(events):
+    """Lazily normalise raw event dicts; already-normalised Events pass through."""
+    for index, event in enumerate(events):
+        yield event if isinstance(event, Event) else Event(event, index)
+
+def normalize_events(events):
+    return list(iter_normalized(events))
+
+def _nan(value):
+    return np.nan if value is None else value
+
+class Universe:
+    """
+    Flat, struct-of-arrays view of a list of events for vectorised scans.
+
+    markets:  structured array (MARKET_DTYPE), one row per market, grouped by event
+    offsets:  markets of event i are markets[offsets[i]:offsets[i + 1]]
+    events:   the normalised Event records, for titles and ids
+    Missing prices are NaN.
+    """
+    def __init__(self, events):
+        self.events = normalize_events(events)
+        counts = np.array([len(event.markets) for event in self.events], dtype=np.int64)
+        self.offsets = np.zeros(len(self.events) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+        self.neg_risk = np.array([event.neg_risk for event in self.events], dtype=bool)
+
+        self.markets = np.zeros(int(self.offsets[-1]), dtype=MARKET_DTYPE)
+        rows = self.markets
+        i = 0
+        for event_index, event in enumerate(self.events):
+            for market in event.markets:
+                flags = FLAG_NEG_RISK if event.neg_risk else 0
+                if market.best_ask is not None:
+                    flags |= FLAG_HAS_ASK
+                if market.yes_price is not None:
+                    flags |= FLAG_HAS_YES
+                if market.no_price is not None:
+                    flags |= FLAG_HAS_NO
+                rows[i] = (
+                    event_index,
+                    _nan(market.yes_bid), _nan(market.yes_ask),
+                    _nan(market.no_bid), _nan(market.no_ask),
+                    _nan(market.yes_price), _nan(market.no_price),
+                    (market.yes_token or "").encode(), (market.no_token or "").encode(),
+                    flags,
+                )
+                i += 1
+
+    def __len__(self):
+        return len(self.markets)
+
+    def event_markets(self, event_index):
+        return self.markets[self.offsets[event_index]:self.offsets[event_index + 1]]
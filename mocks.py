@@ -1,6 +1,4 @@
 import logging
-import numpy as np
-import pandas as pd
 
 # Mock Data Structures
 class Bar:
@@ -9,10 +7,11 @@ class Bar:
         self.timestamp = timestamp
 
 class QuoteTick:
-    def __init__(self, bid, ask, timestamp=None):
+    def __init__(self, bid, ask, timestamp=None, instrument_id=None):
         self.bid = bid
         self.ask = ask
         self.timestamp = timestamp
+        self.instrument_id = instrument_id
 
 # Mock Strategy Base Classes
 class StrategyConfig:
@@ -37,59 +36,119 @@ class Strategy:
         pass
 
 # Mock Indicators
+#
+# Streaming implementations: each update is O(1) and only fixed-size state is kept,
+# so long simulations don't slow down as history grows.
 class Indicator:
+    __slots__ = ("period", "count", "value", "is_initialized")
+    # Extra bars before the first value (RSI needs `period` moves, i.e. period + 1 closes)
+    lag = 0
+
     def __init__(self, period):
         self.period = period
-        self.values = []
+        self.count = 0
         self.value = 0.0
         self.is_initialized = False
 
     def update(self, value):
-        self.values.append(value)
-        if len(self.values) >= self.period:
+        self.count += 1
+        self._step(value)
+        if self.count >= self.period + self.lag:
             self.is_initialized = True
-            self._calculate()
 
-    def _calculate(self):
+    # Nautilus indicator API, so strategies drive the mocks and the real thing the same way
+    update_raw = update
+
+    @property
+    def initialized(self):
+        return self.is_initialized
+
+    def _step(self, value):
         pass
 
 class ExponentialMovingAverage(Indicator):
-    def _calculate(self):
-        # Simple EMA calculation
-        if len(self.values) < self.period:
-            return
-        # Use pandas for easy EMA
-        series = pd.Series(self.values)
-        self.value = series.ewm(span=self.period, adjust=False).mean().iloc[-1]
+    # Recursive EMA seeded with the first value (pandas ewm(span=period, adjust=False))
+    __slots__ = ("alpha", "ema")
+
+    def __init__(self, period):
+        super().__init__(period)
+        self.alpha = 2.0 / (period + 1)
+        self.ema = None
+
+    def _step(self, value):
+        self.ema = value if self.ema is None else self.ema + self.alpha * (value - self.ema)
+        if self.count >= self.period:
+            self.value = self.ema
 
 class RelativeStrengthIndex(Indicator):
-    def _calculate(self):
-        if len(self.values) < self.period + 1:
+    # Wilder's RSI: simple average of the first `period` moves, then smoothed with 1/period
+    __slots__ = ("prev", "avg_gain", "avg_loss")
+    lag = 1
+
+    def __init__(self, period):
+        super().__init__(period)
+        self.prev = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+
+    def _step(self, value):
+        prev, self.prev = self.prev, value
+        if prev is None:
             return
-        series = pd.Series(self.values)
-        delta = series.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=self.period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=self.period).mean()
-        rs = gain / loss
-        self.value = 100 - (100 / (1 + rs.iloc[-1]))
+        change = value - prev
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        moves = self.count - 1
+        if moves <= self.period:
+            self.avg_gain += (gain - self.avg_gain) / moves
+            self.avg_loss += (loss - self.avg_loss) / moves
+            if moves < self.period:
+                return
+        else:
+            self.avg_gain += (gain - self.avg_gain) / self.period
+            self.avg_loss += (loss - self.avg_loss) / self.period
+
+        if self.avg_loss == 0:
+            self.value = 100.0 if self.avg_gain > 0 else 50.0
+        else:
+            self.value = 100 - (100 / (1 + self.avg_gain / self.avg_loss))
 
 class MovingAverageConvergenceDivergence:
+    # .value is the histogram: (fast EMA - slow EMA) - signal EMA of that difference
+    __slots__ = (
+        "fast_period", "slow_period", "signal_period",
+        "fast", "slow", "signal_alpha", "macd", "signal",
+        "count", "value", "is_initialized",
+    )
+
     def __init__(self, fast=12, slow=26, signal=9):
         self.fast_period = fast
         self.slow_period = slow
         self.signal_period = signal
-        self.values = []
-        self.value = 0.0 # Histogram value usually, or tuple? Nautilus MACD usually exposes .value as the histogram or signal?
-        # Let's assume .value is the histogram for simplicity in this mock
+        self.fast = ExponentialMovingAverage(fast)
+        self.slow = ExponentialMovingAverage(slow)
+        self.signal_alpha = 2.0 / (signal + 1)
+        self.macd = 0.0
+        self.signal = None
+        self.count = 0
+        self.value = 0.0
         self.is_initialized = False
 
     def update(self, value):
-        self.values.append(value)
-        if len(self.values) > self.slow_period + self.signal_period:
+        self.count += 1
+        self.fast.update(value)
+        self.slow.update(value)
+        self.macd = self.fast.ema - self.slow.ema
+        if self.signal is None:
+            self.signal = self.macd
+        else:
+            self.signal += self.signal_alpha * (self.macd - self.signal)
+        if self.count > self.slow_period + self.signal_period:
             self.is_initialized = True
-            series = pd.Series(self.values)
-            exp1 = series.ewm(span=self.fast_period, adjust=False).mean()
-            exp2 = series.ewm(span=self.slow_period, adjust=False).mean()
-            macd = exp1 - exp2
-            signal = macd.ewm(span=self.signal_period, adjust=False).mean()
-            self.value = (macd - signal).iloc[-1] # Histogram
+            self.value = self.macd - self.signal
+
+    update_raw = update
+
+    @property
+    def initialized(self):
+        return self.is_initialized
@@ -1,3 +1,5 @@
+import asyncio
+import bisect
 import time
 import requests
 import re
@@ -5,77 +7,155 @@ import json
 import os
 import threading
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import OrderArgs, OrderType
+from py_clob_client.clob_types import BookParams, OrderArgs, OrderType, PartialCreateOrderOptions
 from py_clob_client.order_builder.constants import BUY
 from dotenv import load_dotenv
 
+try:
+    import aiohttp
+except ImportError:
+    # Without aiohttp the Pi falls back to the single-source threaded poller
+    aiohttp = None
+
 # Load Env
 load_dotenv()
 PRIVATE_KEY = os.getenv("PRIVATE_KEY")
 
-NASA_URL = "https://data.giss.nasa.gov/gistemp/tabledata_v4/GLB.Ts+dSST.txt"
+# Overridable so detection can be timed against a local copy (benchmarks/gistemp_server.py)
+GISTEMP_BASE = os.getenv("GISTEMP_BASE", "https://data.giss.nasa.gov")
+NASA_URL = f"{GISTEMP_BASE}/gistemp/tabledata_v4/GLB.Ts+dSST.txt"
+# Tables NASA regenerates alongside GLB; their Last-Modified moving means a release is rolling out
+RELATED_URLS = [f"{GISTEMP_BASE}/gistemp/tabledata_v4/{region}.Ts+dSST.txt" for region in ("NH", "SH")]
+# Overridable so execution can be timed against a local CLOB (benchmarks/clob_server.py)
+CLOB_HOST = os.getenv("CLOB_HOST", "https://clob.polymarket.com")
 TOKEN_MAP_PATH = "token_map.json" # Expecting it in the same folder on Pi
+TARGETS_PATH = "targets.json"   # Optional; defaults to November 2025 on TOKEN_MAP_PATH
+ORDER_SIZE = 5.0
+MAX_PRICE = 0.99   # Limit used when the book has no asks, and the cap otherwise
+BOOK_REFRESH_SECONDS = 2.0   # How often armed orders are checked against the book
+POLL_SECONDS = 0.5   # Conditional polls are a 304 with no body until the file changes
+STREAM_CHUNK_BYTES = 2048   # requests read size while scanning a table body for the watched rows
+HEDGE_DELAY_SECONDS = 0.25   # How long the race waits on a source before asking the next one too
+# Outside the expected release window polling idles, then ramps towards WARM as the window nears
+IDLE_POLL_SECONDS = 60.0
+WARM_POLL_SECONDS = 5.0
+RAMP_SECONDS = 6 * 3600
+BOOST_SECONDS = 15 * 60   # HOT polling after a related file changes
+WATCH_SECONDS = 30.0      # How often the related files are checked
 
 # Global State
-TARGET_VALUE = None
-FOUND_EVENT = threading.Event()
+TOKEN_INDEX = None   # TokenIndex for TOKEN_MAP_PATH, compiled on first get_token_id
+FOUND_EVENT = threading.Event()   # Set once every target has fired
 LAST_CHECK_TIME = None
 CURRENT_STATUS = "Initializing"
-NOV_VALUE_SEEN = "****"
+
+# Bucket labels: "<1.10ºC", "1.10–1.14ºC", ">1.29ºC" (ASCII, en or em dash; º/° suffix optional)
+BUCKET_LABEL_PATTERN = re.compile(
+    r"^\s*([<>])?\s*(-?\d+(?:\.\d+)?)\s*(?:[-–—]\s*(-?\d+(?:\.\d+)?))?\s*(?:[º°]\s*C?|C)?\s*$"
+)
+
+def parse_bucket(label):
+    """
+    Label -> inclusive (low, high) in hundredths of a degree (GISTEMP's
+    resolution); None for an open end. "<1.10" is (None, 109), ">1.29" is (130, None).
+    """
+    match = BUCKET_LABEL_PATTERN.match(label)
+    if not match:
+        raise ValueError(f"Unrecognised bucket label: {label!r}")
+    op, first, second = match.groups()
+    first = round(float(first) * 100)
+    if op == "<":
+        return None, first - 1
+    if op == ">":
+        return first + 1, None
+    if second is None:
+        return first, first
+    second = round(float(second) * 100)
+    if second < first:
+        raise ValueError(f"Empty bucket: {label!r}")
+    return first, second
+
+class TokenIndex:
+    """
+    The token map compiled once into a sorted interval table. Buckets must tile
+    the range they cover exactly: overlaps and gaps are rejected at load.
+    """
+    def __init__(self, mapping):
+        buckets = sorted(
+            ((*parse_bucket(label), label, token_id) for label, token_id in mapping.items()),
+            key=lambda b: float("-inf") if b[0] is None else b[0],
+        )
+        if not buckets:
+            raise ValueError("Token map is empty")
+        for (low, high, label, _), (next_low, _, next_label, _) in zip(buckets, buckets[1:]):
+            if high is None or next_low is None or next_low <= high:
+                raise ValueError(f"Buckets overlap: {label!r} and {next_label!r}")
+            if next_low != high + 1:
+                raise ValueError(f"Gap between buckets {label!r} and {next_label!r}")
+        self.lows = [low for low, _, _, _ in buckets]
+        self.highs = [high for _, high, _, _ in buckets]
+        self.labels = [label for _, _, label, _ in buckets]
+        self.token_ids = [token_id for _, _, _, token_id in buckets]
+        if self.lows[0] is None:
+            self.lows[0] = float("-inf")
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+    def lookup(self, value):
+        """Token id for a value in degrees (e.g. 1.22), or None if no bucket holds it."""
+        hundredths = round(float(value) * 100)
+        i = bisect.bisect_right(self.lows, hundredths) - 1
+        if i < 0:
+            return None
+        high = self.highs[i]
+        if high is not None and hundredths > high:
+            return None
+        return self.token_ids[i]
 
 def get_token_id(value):
     """
-    Map value (e.g. 1.22) to Token ID using token_map.json.
+    Map value (e.g. 1.22) to Token ID using the compiled token map.
     """
+    global TOKEN_INDEX
     try:
-        with open(TOKEN_MAP_PATH, "r") as f:
-            mapping = json.load(f)
-            
-        val = float(value)
-        
-        for label, token_id in mapping.items():
-            if "<" in label:
-                limit = float(re.search(r"[\d.]+", label).group())
-                if val < limit: return token_id
-            elif ">" in label:
-                limit = float(re.search(r"[\d.]+", label).group())
-                if val > limit: return token_id
-            elif "-" in label:
-                parts = re.findall(r"[\d.]+", label)
-                if len(parts) == 2:
-                    low, high = float(parts[0]), float(parts[1])
-                    if low <= val <= high: return token_id
-                    
+        if TOKEN_INDEX is None:
+            TOKEN_INDEX = TokenIndex.load(TOKEN_MAP_PATH)
+        return TOKEN_INDEX.lookup(value)
     except Exception as e:
         print(f"Error mapping token: {e}")
     return None
 
-def execute_trade(token_id):
+def best_ask(book):
+    # The book lists asks best-last; take the minimum rather than rely on the order
+    return min((float(ask.price) for ask in book.asks), default=None)
+
+def execute_trade(token_id, size=ORDER_SIZE, max_price=MAX_PRICE):
     """
-    Place buy order for 5 tokens at best ask.
+    Place buy order for `size` tokens at best ask (no higher than max_price).
     """
     print(f"\n🚀 [EXECUTION] EXECUTING TRADE FOR TOKEN: {token_id}")
     try:
-        host = "https://clob.polymarket.com"
+        host = CLOB_HOST
         chain_id = 137
         client = ClobClient(host, key=PRIVATE_KEY, chain_id=chain_id)
         client.set_api_creds(client.create_or_derive_api_creds())
         
-        ob = client.get_orderbook(token_id)
-        asks = ob.asks
-        if not asks:
-            print("⚠️ No asks found! Placing limit at 0.99")
-            price = 0.99
+        price = best_ask(client.get_order_book(token_id))
+        if price is None:
+            print(f"⚠️ No asks found! Placing limit at {max_price}")
+            price = max_price
         else:
-            best_ask = float(asks[0].price)
-            price = best_ask
             print(f"✅ Best Ask: {price}")
+            price = min(price, max_price)
 
         order_args = OrderArgs(
             price=price,
-            size=5.0,
+            size=size,
             side=BUY,
             token_id=token_id,
         )
@@ -88,84 +168,674 @@ def execute_trade(token_id):
         print(f"❌ TRADE FAILED: {e}")
         return False
 
-def monitor_loop():
-    global LAST_CHECK_TIME, CURRENT_STATUS, NOV_VALUE_SEEN, TARGET_VALUE
+class ArmedOrders:
+    """
+    Pre-armed execution: one client with credentials derived once, and a signed
+    FOK buy per bucket token that is re-signed whenever its best ask moves.
+    On detection fire() only has to POST the matching order.
+    """
+    def __init__(self, specs, refresh_seconds=BOOK_REFRESH_SECONDS):
+        self.specs = dict(specs)   # token_id -> (size, max_price)
+        self.refresh_seconds = refresh_seconds
+        self.client = None
+        self.orders = {}   # token_id -> (price, signed order)
+        self.lock = threading.Lock()
+
+    def arm(self):
+        self.client = ClobClient(CLOB_HOST, key=PRIVATE_KEY, chain_id=137)
+        self.client.set_api_creds(self.client.create_or_derive_api_creds())
+        self.refresh()
+        print(f"🔫 [ARMED] {len(self.orders)}/{len(self.specs)} orders signed and ready")
+
+    def refresh(self):
+        # One batched book request for every bucket; only moved prices are re-signed
+        books = self.client.get_order_books([BookParams(token_id=t) for t in list(self.specs)])
+        for book in books:
+            spec = self.specs.get(book.asset_id)
+            if spec is None:
+                continue   # Disarmed while the request was in flight
+            size, max_price = spec
+            price = min(best_ask(book) or max_price, max_price)
+            armed = self.orders.get(book.asset_id)
+            if armed and armed[0] == price:
+                continue
+            order = self.client.create_order(
+                OrderArgs(price=price, size=size, side=BUY, token_id=book.asset_id),
+                PartialCreateOrderOptions(tick_size=book.tick_size, neg_risk=book.neg_risk),
+            )
+            with self.lock:
+                self.orders[book.asset_id] = (price, order)
+
+    def keep_armed(self, scheduler):
+        # Stops once the value is found; refreshes no faster than the monitors poll
+        while True:
+            scheduler.sleep(minimum=self.refresh_seconds)
+            if FOUND_EVENT.is_set():
+                return
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Re-arm failed: {e}")
+
+    def disarm(self, token_ids):
+        """Stop keeping orders for these tokens (e.g. a target that has fired)."""
+        with self.lock:
+            for token_id in token_ids:
+                self.specs.pop(token_id, None)
+                self.orders.pop(token_id, None)
+
+    def fire(self, token_id):
+        """Post the armed order for token_id. Returns the response, or None if nothing was armed or it failed."""
+        with self.lock:
+            armed = self.orders.pop(token_id, None)
+        if armed is None:
+            return None
+        price, order = armed
+        print(f"\n🚀 [EXECUTION] FIRING ARMED ORDER FOR TOKEN: {token_id} @ {price}")
+        try:
+            resp = self.client.post_order(order, OrderType.FOK)
+        except Exception as e:
+            # Most likely the book moved since arming and the FOK was killed
+            print(f"❌ ARMED ORDER FAILED: {e}")
+            return None
+        print(f"🎉 Order Response: {resp}")
+        return resp
+
+class GistempPoller:
+    """
+    Conditional GET over one keep-alive session: the body is only downloaded
+    (and parsed) when the server reports a change via ETag/Last-Modified.
+    """
+    def __init__(self, url=NASA_URL, timeout=5):
+        self.url = url
+        self.csv = url.endswith(".csv")
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.etag = None
+        self.last_modified = None
+        self.polls = 0
+        self.not_modified = 0
+
+    def poll(self, years):
+        """Parsed rows for `years` if the table changed since the last poll, else None."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        with self.session.get(self.url, headers=headers, timeout=self.timeout, stream=True) as res:
+            self.polls += 1
+            if res.status_code == 304:
+                self.not_modified += 1
+                return None
+            res.raise_for_status()
+            scanner = RowScanner(years, self.csv)
+            rows = None
+            for chunk in res.iter_content(STREAM_CHUNK_BYTES):
+                rows = scanner.feed(chunk)
+                if rows is not None:
+                    break   # Closing the response drops the rest of the body
+            etag, last_modified = res.headers.get("ETag"), res.headers.get("Last-Modified")
+        if rows is None:
+            rows = scanner.finish()
+        # Only take validators once the table parsed, so a bad body is fetched again
+        self.etag, self.last_modified = etag, last_modified
+        return rows
+
+def monitor_loop(registry, scheduler):
+    global LAST_CHECK_TIME, CURRENT_STATUS
     
+    poller = GistempPoller()
     while not FOUND_EVENT.is_set():
         try:
             CURRENT_STATUS = "Fetching NASA Data..."
-            res = requests.get(NASA_URL, timeout=5)
-            text = res.text
+            rows = poller.poll(registry.years)
             LAST_CHECK_TIME = datetime.now().strftime("%H:%M:%S")
+            if rows is None:
+                # 304: same file as last time, nothing to parse
+                CURRENT_STATUS = "Monitoring (unchanged, 304)"
+                scheduler.sleep()
+                continue
             
-            # Regex for 2025 row
-            # We look for the row starting with 2025
-            match = re.search(r"2025\s+((?:-?\d+\s+){10})([^\s]+)", text)
-            
-            if match:
-                nov_val = match.group(2)
-                NOV_VALUE_SEEN = nov_val
-                
-                if "****" not in nov_val:
-                    # Target Found!
-                    CURRENT_STATUS = "TARGET ACQUIRED!"
-                    val_float = float(nov_val) / 100.0
-                    TARGET_VALUE = val_float
-                    FOUND_EVENT.set()
-                    return
-                else:
-                    CURRENT_STATUS = "Monitoring (Value is ****)"
-            else:
-                CURRENT_STATUS = "Row 2025 not found (Data format change?)"
+            # One parse of the watched years' rows serves every target
+            registry.evaluate(rows, NASA_URL)
+            CURRENT_STATUS = f"Monitoring ({len(registry.pending)} target(s) still ****)"
                 
+        except ValueError:
+            CURRENT_STATUS = "Target rows not found (Data format change?)"
         except Exception as e:
             CURRENT_STATUS = f"Error: {str(e)[:20]}..."
             
-        time.sleep(1) # Check every second
+        scheduler.sleep()
+
+_ROW_PATTERNS = {}
+
+def _parse_row(line, year, csv):
+    cells = line.split(",") if csv else line.split()
+    if len(cells) < 13:
+        raise ValueError(f"Short {year} row: {line!r}")
+    scale = 1.0 if csv else 100.0
+    return [None if "*" in cell else float(cell) / scale for cell in cells[1:13]]
+
+def _parse_rows(text, years, csv):
+    rows = {}
+    for year in years:
+        key = (year, csv)
+        if key not in _ROW_PATTERNS:
+            # Anchored at a line start so a year can't match inside another row
+            _ROW_PATTERNS[key] = re.compile(rf"^{year}," if csv else rf"^{year}\s", re.M)
+        match = _ROW_PATTERNS[key].search(text)
+        if not match:
+            continue
+        end = text.find("\n", match.start())
+        rows[year] = _parse_row(text[match.start():end if end != -1 else len(text)], year, csv)
+    if not rows:
+        raise ValueError(f"No row for {', '.join(map(str, years))} in the table")
+    return rows
+
+def parse_gistemp_txt(text, years):
+    """
+    {year: [Jan..Dec in degrees, None while ****]} for each of `years` with a row
+    in GLB.Ts+dSST.txt (values are hundredths). ValueError if none has a row.
+    """
+    return _parse_rows(text, years, csv=False)
+
+def parse_gistemp_csv(text, years):
+    """Same from GLB.Ts+dSST.csv, which is already in degrees and uses *** for missing months."""
+    return _parse_rows(text, years, csv=True)
+
+class RowScanner:
+    """
+    Finds the watched years' rows in a table body as it streams in. feed() each
+    chunk; once every row has fully arrived it returns the parsed rows and the
+    rest of the body can be dropped. Only new bytes are searched on each feed.
+    If a row never turns up or doesn't parse, finish() parses the whole body.
+    """
+    def __init__(self, years, csv):
+        self.years = years
+        self.csv = csv
+        # Rows start a line: "\n2025 " in the .txt table, "\n2025," in the .csv
+        self.markers = {year: f"\n{year}{',' if csv else ' '}".encode() for year in years}
+        self.overlap = max(len(marker) for marker in self.markers.values()) - 1
+        self.buffer = bytearray(b"\n")   # So a row on the first line still follows a newline
+        self.starts = {}   # year -> offset of its row in the buffer
+        self.rows = {}
+        self.anomaly = False
+
+    def feed(self, chunk):
+        """The rows once all are in, else None (keep reading)."""
+        searched = max(len(self.buffer) - self.overlap, 0)
+        self.buffer += chunk
+        if self.anomaly:
+            return None
+        for year, marker in self.markers.items():
+            if year in self.rows:
+                continue
+            if year not in self.starts:
+                at = self.buffer.find(marker, searched)
+                if at == -1:
+                    continue
+                self.starts[year] = at + 1
+            end = self.buffer.find(b"\n", self.starts[year])
+            if end == -1:
+                continue   # Row still arriving
+            try:
+                self.rows[year] = _parse_row(self.buffer[self.starts[year]:end].decode(), year, self.csv)
+            except ValueError:
+                # Not the layout we expect: read everything and let finish() decide
+                self.anomaly = True
+                return None
+        return self.rows if len(self.rows) == len(self.markers) else None
+
+    def finish(self):
+        """Full parse of everything fed, for bodies where feed() never returned the rows."""
+        return _parse_rows(self.buffer.decode(), self.years, self.csv)
+
+class GistempSource:
+    """One URL in the race, with its own conditional-request validators and running stats."""
+    def __init__(self, url, csv):
+        self.url = url
+        self.csv = csv
+        self.etag = None
+        self.last_modified = None
+        self.polls = 0
+        self.wins = 0
+        self.errors = 0
+        self.latency = None   # EWMA seconds
 
-def status_reporter():
+    def observe(self, seconds):
+        self.latency = seconds if self.latency is None else 0.8 * self.latency + 0.2 * seconds
+
+    @property
+    def score(self):
+        # Lower is better. Unmeasured sources go first so every source gets sampled.
+        if self.latency is None:
+            return 0.0
+        return self.latency * (1 + self.errors / self.polls)
+
+    async def fetch(self, session, timeout, years):
+        """Parsed rows for `years`, or None if the table is unchanged since the last parse (304)."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        async with session.get(self.url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as res:
+            if res.status == 304:
+                return None
+            res.raise_for_status()
+            scanner = RowScanner(years, self.csv)
+            rows = None
+            # iter_any() yields bytes as they arrive, so the decision doesn't wait for a chunk to fill
+            async for chunk in res.content.iter_any():
+                rows = scanner.feed(chunk)
+                if rows is not None:
+                    res.close()   # Drop the rest of the body
+                    break
+            etag, last_modified = res.headers.get("ETag"), res.headers.get("Last-Modified")
+        if rows is None:
+            rows = scanner.finish()
+        self.etag, self.last_modified = etag, last_modified
+        return rows
+
+def gistemp_sources():
+    """The .txt and .csv tables on GISTEMP_BASE and every host in GISTEMP_MIRRORS (comma separated)."""
+    bases = [GISTEMP_BASE] + [base.strip() for base in os.getenv("GISTEMP_MIRRORS", "").split(",") if base.strip()]
+    sources = []
+    for base in bases:
+        sources.append(GistempSource(f"{base}/gistemp/tabledata_v4/GLB.Ts+dSST.txt", csv=False))
+        sources.append(GistempSource(f"{base}/gistemp/tabledata_v4/GLB.Ts+dSST.csv", csv=True))
+    return sources
+
+class HedgedMonitor:
+    """
+    Each poll races the sources: the best-scoring one is asked first and the next
+    is added every `hedge_delay` seconds without an answer (or at once if a request
+    fails) until one returns a table that publishes a watched cell
+    (`publishes(rows)`). Only that answer wins and cancels the rest; an unchanged
+    or still-**** table ends the hedging and lets the requests in flight finish.
+    Every valid reply is timed, so slow sources stop being asked first.
+    """
+    def __init__(self, sources, years, publishes, hedge_delay=HEDGE_DELAY_SECONDS, timeout=5):
+        self.sources = sources
+        self.years = years
+        self.publishes = publishes
+        self.hedge_delay = hedge_delay
+        self.timeout = timeout
+
+    async def _timed(self, source, session):
+        started = time.perf_counter()
+        source.polls += 1
+        try:
+            rows = await source.fetch(session, self.timeout, self.years)
+        except asyncio.CancelledError:
+            # Lost the race; race() records the censored sample
+            raise
+        except Exception:
+            source.errors += 1
+            raise
+        # A 304 or unchanged table is still a full round trip
+        source.observe(time.perf_counter() - started)
+        if rows is None or not self.publishes(rows):
+            return None
+        return rows
+
+    async def race(self, session):
+        """
+        One poll. Returns (rows, winning source) once a source publishes a watched
+        cell; (None, source) if the sources answered but none has published;
+        (None, None) if every source failed.
+        """
+        ranked = sorted(self.sources, key=lambda source: source.score)
+        waiting = iter(ranked)
+        pending = {}
+        started = {}
+        answered = None
+
+        def hedge():
+            source = next(waiting, None)
+            if source is not None:
+                task = asyncio.create_task(self._timed(source, session))
+                pending[task], started[task] = source, time.perf_counter()
+            return source is not None
+
+        try:
+            more = hedge()
+            while pending:
+                delay = self.hedge_delay if more and answered is None else None
+                done, _ = await asyncio.wait(pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    more = hedge()   # No answer in time: add the next source
+                    continue
+                for task in done:
+                    source = pending.pop(task)
+                    if task.exception() is not None:
+                        if answered is None:
+                            more = hedge()   # Failed: hedge straight away
+                        continue
+                    if task.result() is not None:
+                        source.wins += 1
+                        # Losers took at least as long as the winner; a late hedge's own wait is shorter
+                        won = time.perf_counter() - started[task]
+                        for loser, other in pending.items():
+                            if not loser.done():
+                                other.observe(max(time.perf_counter() - started[loser], won))
+                        return task.result(), source
+                    answered = answered or source
+            return None, answered
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def report(self):
+        return [
+            f"{source.url}: {source.wins}/{source.polls} wins, {source.errors} errors, "
+            f"{(source.latency or 0) * 1e3:.0f}ms avg"
+            for source in sorted(self.sources, key=lambda source: source.score)
+        ]
+
+class Target:
+    """
+    One GISTEMP cell to snipe: the (year, month) to watch, the market's token
+    map and the order to place when the value lands.
+    """
+    def __init__(self, name, year, month, token_map, size=ORDER_SIZE, max_price=MAX_PRICE):
+        if not 1 <= month <= 12:
+            raise ValueError(f"{name}: month must be 1-12, got {month}")
+        self.name = name
+        self.year = year
+        self.month = month
+        self.index = TokenIndex.load(token_map)
+        self.size = size
+        self.max_price = max_price
+        self.value = None
+
+class TargetRegistry:
+    """
+    Every armed target, evaluated against each parsed table, so one fetch and
+    parse per poll serves them all. A target fires once, on its own thread, the
+    first time its cell is published; FOUND_EVENT is set once all of them have.
+    """
+    def __init__(self, targets, on_found=None):
+        # Armed orders are keyed by token, so each token can belong to one target only
+        owners = {}
+        for target in targets:
+            for token_id in target.index.token_ids:
+                if token_id in owners:
+                    raise ValueError(f"Targets {owners[token_id]!r} and {target.name!r} share token {token_id}")
+                owners[token_id] = target.name
+        self.targets = targets
+        self.on_found = on_found
+        self.lock = threading.Lock()
+        self.threads = []
+
+    @classmethod
+    def load(cls, path=TARGETS_PATH):
+        """
+        targets.json: [{"name", "year", "month", "token_map", "size"?, "max_price"?}].
+        Without one, the November 2025 market on TOKEN_MAP_PATH.
+        """
+        if not os.path.exists(path):
+            return cls([Target("november-2025", 2025, 11, TOKEN_MAP_PATH)])
+        with open(path, "r") as f:
+            return cls([Target(**spec) for spec in json.load(f)])
+
+    @property
+    def years(self):
+        return sorted({target.year for target in self.targets})
+
+    @property
+    def pending(self):
+        return [target for target in self.targets if target.value is None]
+
+    def publishes(self, rows):
+        """Whether `rows` have a value for any target still waiting on one."""
+        for target in self.pending:
+            row = rows.get(target.year)
+            if row and row[target.month - 1] is not None:
+                return True
+        return False
+
+    def order_specs(self):
+        return {token_id: (target.size, target.max_price)
+                for target in self.pending for token_id in target.index.token_ids}
+
+    def summary(self):
+        return ", ".join(f"{target.name}={'****' if target.value is None else target.value}"
+                         for target in self.targets)
+
+    def evaluate(self, rows, origin):
+        with self.lock:
+            for target in self.pending:
+                row = rows.get(target.year)
+                value = row[target.month - 1] if row else None
+                if value is None:
+                    continue
+                target.value = value
+                print(f"\n⚡ {target.name}: {value} (first seen in {origin})")
+                thread = threading.Thread(target=self.on_found, args=(target,))
+                thread.start()
+                self.threads.append(thread)
+            if not self.pending:
+                FOUND_EVENT.set()
+
+    def join(self):
+        for thread in self.threads:
+            thread.join()
+
+def release_window(year, month):
+    """
+    GISTEMP publishes a month around the 10th-15th of the next one; the window
+    pads that to the 8th-18th (UTC). Returns (start, end) epoch seconds.
+    """
+    year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    start = datetime(year, month, 8, tzinfo=timezone.utc)
+    end = datetime(year, month, 18, tzinfo=timezone.utc)
+    return start.timestamp(), end.timestamp()
+
+def _utc_timestamp(text):
+    moment = datetime.fromisoformat(text.strip())
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+def release_windows(targets):
+    """
+    GISTEMP_RELEASE_WINDOWS ("2025-12-08T00:00/2025-12-18T00:00,...", UTC unless
+    an offset is given), else the default window for each target's month.
+    """
+    spec = os.getenv("GISTEMP_RELEASE_WINDOWS")
+    if spec is None:
+        return sorted({release_window(target.year, target.month) for target in targets})
+    windows = []
+    for part in spec.split(","):
+        if part.strip():
+            start, _, end = part.partition("/")
+            windows.append((_utc_timestamp(start), _utc_timestamp(end)))
+    return windows
+
+class PollScheduler:
+    """
+    Poll interval driven by the release calendar:
+      HOT   inside a window, or for BOOST_SECONDS after signal()
+      RAMP  in the RAMP_SECONDS before a window, sliding from IDLE down to WARM
+      LATE  after the last window with no release yet: WARM
+      IDLE  otherwise
+    An empty calendar means always HOT.
+    """
+    def __init__(self, windows, hot=POLL_SECONDS, warm=WARM_POLL_SECONDS, idle=IDLE_POLL_SECONDS,
+                 ramp=RAMP_SECONDS, boost=BOOST_SECONDS):
+        self.windows = sorted(windows)
+        self.hot = hot
+        self.warm = warm
+        self.idle = idle
+        self.ramp = ramp
+        self.boost = boost
+        self.boost_until = 0.0
+
+    def signal(self, reason):
+        print(f"📡 {reason}: polling hot for {self.boost / 60:.0f} min")
+        self.boost_until = time.time() + self.boost
+
+    def state(self, now=None):
+        """(mode, interval seconds)"""
+        now = time.time() if now is None else now
+        if not self.windows or now < self.boost_until:
+            return "HOT", self.hot
+        for start, end in self.windows:
+            if start <= now < end:
+                return "HOT", self.hot
+            if now < start:
+                lead = start - now
+                if lead < self.ramp:
+                    return "RAMP", self.warm + (self.idle - self.warm) * lead / self.ramp
+                return "IDLE", self.idle
+        return "LATE", self.warm
+
+    def interval(self):
+        return self.state()[1]
+
+    def _remaining(self, started, minimum):
+        # Re-evaluated while waiting, so entering a window or a signal cuts a long idle sleep short
+        return started + max(minimum, self.interval()) - time.time()
+
+    def sleep(self, minimum=0.0):
+        started = time.time()
+        while not FOUND_EVENT.is_set():
+            remaining = self._remaining(started, minimum)
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, 1.0))
+
+    async def sleep_async(self, minimum=0.0):
+        started = time.time()
+        while not FOUND_EVENT.is_set():
+            remaining = self._remaining(started, minimum)
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, 1.0))
+
+    def watch(self, urls, every=WATCH_SECONDS):
+        """HEAD the related files; a changed Last-Modified/ETag triggers signal()."""
+        session = requests.Session()
+        seen = {}
+        while not FOUND_EVENT.is_set():
+            for url in urls:
+                try:
+                    res = session.head(url, timeout=5)
+                except requests.RequestException:
+                    continue
+                if not res.ok:
+                    continue
+                stamp = (res.headers.get("Last-Modified"), res.headers.get("ETag"))
+                if url in seen and seen[url] != stamp:
+                    self.signal(f"{url} changed")
+                seen[url] = stamp
+            FOUND_EVENT.wait(every)
+
+async def _monitor_hedged(monitor, registry, scheduler):
+    global LAST_CHECK_TIME, CURRENT_STATUS
+    async with aiohttp.ClientSession() as session:
+        while not FOUND_EVENT.is_set():
+            try:
+                CURRENT_STATUS = "Racing NASA sources..."
+                rows, source = await monitor.race(session)
+                LAST_CHECK_TIME = datetime.now().strftime("%H:%M:%S")
+                if source is None:
+                    CURRENT_STATUS = "All sources failed, retrying"
+                elif rows is None:
+                    CURRENT_STATUS = f"Monitoring ({len(registry.pending)} target(s) still ****, first answer: {source.url})"
+                else:
+                    registry.evaluate(rows, source.url)
+                    CURRENT_STATUS = f"Monitoring ({len(registry.pending)} target(s) still ****, published first: {source.url})"
+
+            except ValueError:
+                CURRENT_STATUS = "Target rows not found (Data format change?)"
+            except Exception as e:
+                CURRENT_STATUS = f"Error: {str(e)[:20]}..."
+
+            await scheduler.sleep_async()
+
+def monitor_hedged(registry, scheduler):
+    monitor = HedgedMonitor(gistemp_sources(), registry.years, registry.publishes)
+    try:
+        asyncio.run(_monitor_hedged(monitor, registry, scheduler))
+    except Exception as e:
+        print(f"\n⚠️ Hedged monitor stopped: {e}")
+    finally:
+        print("\n" + "\n".join(monitor.report()))
+    # There is no second monitor thread on the Pi, so keep polling the .txt table
+    if not FOUND_EVENT.is_set():
+        print("⚠️ Falling back to single-source polling")
+        monitor_loop(registry, scheduler)
+
+def status_reporter(registry, scheduler):
     """
     Reports status every 5 seconds to the shell.
     """
     while not FOUND_EVENT.is_set():
-        sys.stdout.write(f"\r[{datetime.now().strftime('%H:%M:%S')}] Status: {CURRENT_STATUS} | Last Check: {LAST_CHECK_TIME} | Nov Value: {NOV_VALUE_SEEN}   ")
+        sys.stdout.write(f"\r[{datetime.now().strftime('%H:%M:%S')}] Status: {CURRENT_STATUS} | Mode: {scheduler.state()[0]} | Last Check: {LAST_CHECK_TIME} | Values: {registry.summary()}   ")
         sys.stdout.flush()
         time.sleep(5)
 
+def snipe(target, armed):
+    print("\n" + "="*50)
+    print(f"🚨 ALERT! {target.name} VALUE FOUND: {target.value}")
+    print("="*50)
+    
+    # Execute Trade
+    token_id = target.index.lookup(target.value)
+    if token_id:
+        success = bool(armed and armed.fire(token_id)) or execute_trade(token_id, target.size, target.max_price)
+        if armed:
+            armed.disarm(target.index.token_ids)
+        if success:
+            print(f"\n🏆 {target.name} SNIPE COMPLETE. CHECK POLYMARKET.")
+        else:
+            print(f"\n⚠️ {target.name} SNIPE ATTEMPTED BUT FAILED.")
+    else:
+        print(f"\n❌ CRITICAL: Could not map {target.value} to a {target.name} Token ID!")
+
 def main():
+    # Targets compile their token maps on load, so a bad map fails here, not when the value lands
+    registry = TargetRegistry.load()
+
     print("🥧 NASA Sniper (RasPi Edition) Started.")
     print("----------------------------------------")
     print(f"Target URL: {NASA_URL}")
-    print("Waiting for November 2025 update...")
+    for target in registry.targets:
+        print(f"Waiting for {target.name} ({target.year}-{target.month:02d}) update...")
     print("----------------------------------------")
     
-    # Start Monitor
-    monitor_thread = threading.Thread(target=monitor_loop)
+    # Poll hard only around the expected releases, or once a related file changes
+    scheduler = PollScheduler(release_windows(registry.targets))
+    threading.Thread(target=scheduler.watch, args=(RELATED_URLS,), daemon=True).start()
+
+    # Arm orders before monitoring so detection only has to post
+    armed = None
+    try:
+        armed = ArmedOrders(registry.order_specs())
+        armed.arm()
+        threading.Thread(target=armed.keep_armed, args=(scheduler,), daemon=True).start()
+    except Exception as e:
+        print(f"⚠️ Arming failed ({e}); will build the order on detection")
+        armed = None
+    registry.on_found = lambda target: snipe(target, armed)
+
+    # Start Monitor: one fetch and parse per poll for every target
+    monitor_thread = threading.Thread(target=monitor_hedged if aiohttp else monitor_loop, args=(registry, scheduler))
     monitor_thread.daemon = True
     monitor_thread.start()
     
     # Start Reporter
-    reporter_thread = threading.Thread(target=status_reporter)
+    reporter_thread = threading.Thread(target=status_reporter, args=(registry, scheduler))
     reporter_thread.daemon = True
     reporter_thread.start()
     
-    # Wait for Event
+    # Wait for every target to fire
     FOUND_EVENT.wait()
-    
-    print("\n\n" + "="*50)
-    print(f"🚨 ALERT! TARGET VALUE FOUND: {TARGET_VALUE}")
-    print("="*50)
-    
-    # Execute Trade
-    token_id = get_token_id(TARGET_VALUE)
-    if token_id:
-        success = execute_trade(token_id)
-        if success:
-            print("\n🏆 SNIPE COMPLETE. CHECK POLYMARKET.")
-        else:
-            print("\n⚠️ SNIPE ATTEMPTED BUT FAILED.")
-    else:
-        print("\n❌ CRITICAL: Could not map value to Token ID!")
+    registry.join()
         
     # Keep alive for user to see
     while True:
@@ -1,4 +1,5 @@
 import os
+import re
 import json
 import asyncio
 import argparse
@@ -6,21 +7,36 @@ from datetime import datetime
 
 from openai import OpenAI
 import subprocess
-import glob
 import time
 import random
+import sys
 
-# Configuration
+from markets import Event, iter_normalized
+from old_things import store
+from strategies.arbitrage.basket import best_no_basket
+from strategies.arbitrage.ladder import SPREAD_PATTERN, find_ladder_violation, ladder_direction
 
-OPENAI_KEYS_FILE = "openai_keys.txt"
-DATA_DIR = "data"
-RESULTS_DIR = "results"
+# Configuration
+#
+# Run from the repo root as a package module (python3 -m old_things.arbitrage);
+# keys, snapshots and results stay next to this file.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OPENAI_KEYS_FILE = os.path.join(HERE, "openai_keys.txt")
+GAMMA_API_BASE = os.getenv("GAMMA_API_BASE", "https://gamma-api.polymarket.com")
+DATA_DIR = os.path.join(HERE, "data")
+RESULTS_DIR = os.path.join(HERE, "results")
 os.makedirs(RESULTS_DIR, exist_ok=True)
 
+# "Subject #N" rankings for the cross-event checks; "X > Y" ladders use SPREAD_PATTERN from ladder.py
+RANK_PATTERN = re.compile(r'(.+?)\s*(#|rank)\s*(\d+)')
+MUTUALLY_EXCLUSIVE_KEYWORDS = ["winner", "champion", "next", "who", "most", "nominee", "president", "ceo", "mayor", "governor", "senator"]
+CUMULATIVE_KEYWORDS = ["released by", "reach", ">", "<", "market cap", "price", "hit"]
+
 class KeyManager:
     def __init__(self, key_file):
         self.key_file = key_file
-        self.working_key_file = "working_keys.txt"
+        self.working_key_file = os.path.join(HERE, "working_keys.txt")
         self.keys = self._load_keys()
         self.current_index = 0
 
@@ -94,7 +110,8 @@ class ArbitrageFinder:
         try:
             # Run scraper.py using subprocess with Popen to capture output
             process = subprocess.Popen(
-                ["python3", "scraper.py"],
+                [sys.executable, "-m", "old_things.scraper"],
+                cwd=os.path.dirname(HERE),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
@@ -113,12 +130,11 @@ class ArbitrageFinder:
             if process.returncode != 0:
                 raise Exception(f"Scraper failed with exit code {process.returncode}")
             
-            # Find the latest data folder
-            list_of_dirs = glob.glob(os.path.join(DATA_DIR, "*"))
-            if not list_of_dirs:
-                raise Exception("No data directories found after scraping")
-                
-            latest_dir = max(list_of_dirs, key=os.path.getctime)
+            # Find the latest snapshot
+            latest_dir = store.latest_snapshot(DATA_DIR)
+            if not latest_dir:
+                raise Exception("No data snapshots found after scraping")
+
             self.current_timestamp = os.path.basename(latest_dir)
             print(f"Scraper finished. Data saved to {latest_dir}")
             return latest_dir
@@ -128,7 +144,7 @@ class ArbitrageFinder:
 
     async def fetch_event_data(self, event_id):
         """Fetch fresh data for a specific event to validate."""
-        url = "https://gamma-api.polymarket.com/events"
+        url = f"{GAMMA_API_BASE}/events"
         params = {"id": event_id}
         try:
             import aiohttp
@@ -207,74 +223,58 @@ class ArbitrageFinder:
         # Group by "base" title to find related markets
         # Heuristic: Remove numbers and "Yes/No" to find base
         groups = {}
-        for event in events:
-            title = event.get("title", "").lower()
+        for event in iter_normalized(events):
+            title = event.title.lower()
             # Simple heuristic: extract text before any numbers
             # or just group by first 10 chars? No, too risky.
             # Let's try to find " > " or " < " structure.
-            import re
             # Pattern for "X > Y"
-            match = re.search(r'(.+?)\s*(>|>=|<|<=)\s*([\d,.]+)', title)
+            match = SPREAD_PATTERN.search(title)
             if match:
                 subject = match.group(1).strip()
                 operator = match.group(2)
                 try:
                     threshold = float(match.group(3).replace(",", ""))
-                    if subject not in groups: groups[subject] = []
                     
                     # Get "Yes" price
-                    markets = event.get("markets", [])
-                    if not markets: continue
-                    market = markets[0] # Assume main market
-                    if "outcomePrices" in market:
-                        prices = json.loads(market["outcomePrices"])
-                        outcomes = json.loads(market["outcomes"]) if "outcomes" in market else ["Yes", "No"]
-                        if "Yes" in outcomes:
-                            yes_price = float(prices[outcomes.index("Yes")])
-                            groups[subject].append({
-                                "threshold": threshold,
-                                "price": yes_price,
-                                "operator": operator,
-                                "title": title,
-                                "market": market,
-                                "event_id": event.get("id")
-                            })
+                    if not event.markets: continue
+                    market = event.markets[0] # Assume main market
+                    if market.yes_price is not None:
+                        # ">" and "<" ladders on the same subject are checked separately
+                        groups.setdefault((subject, ladder_direction(operator)), []).append({
+                            "threshold": threshold,
+                            "price": market.yes_price,
+                            "operator": operator,
+                            "title": title,
+                            "event_id": event.id
+                        })
                 except:
                     pass
         
         # Analyze groups
-        for subject, items in groups.items():
-            # Sort by threshold
-            items.sort(key=lambda x: x["threshold"])
-            
-            # Check for monotonicity violations
-            # For ">", higher threshold should have LOWER price.
-            # If Price(High) > Price(Low), it's an arb.
-            for i in range(len(items)):
-                for j in range(i + 1, len(items)):
-                    low = items[i]
-                    high = items[j]
-                    
-                    if low["operator"] in [">", ">="] and high["operator"] in [">", ">="]:
-                        # Logic: > 28B (High) implies > 26B (Low).
-                        # So Price(High) should be <= Price(Low).
-                        # Arb if Price(High) > Price(Low).
-                        if high["price"] > low["price"]:
-                            # Found Arb!
-                            # Strategy: Buy Yes(Low) and Buy No(High).
-                            # Cost = Price(Low) + (1 - Price(High))
-                            # If Price(High) > Price(Low), then Cost < 1.
-                            cost = low["price"] + (1.0 - high["price"])
-                            profit = (1.0 - cost) * 100
-                            opportunities.append({
-                                "market_title": f"{low['title']} vs {high['title']}",
-                                "type": "Logic",
-                                "description": f"Spread Arb: {high['title']} ({high['price']}) > {low['title']} ({low['price']}). Buy Yes on Low, No on High. Cost {cost:.2f}.",
-                                "profit_potential": "High" if profit > 5 else "Medium",
-                                "confidence": 1.0,
-                                "source": "Algorithm",
-                                "event_id": low["event_id"] # Use one of them
-                            })
+        for (subject, direction), items in groups.items():
+            # Check for monotonicity violations with one sort-and-sweep per ladder.
+            # For ">", higher threshold should have LOWER price (> 28B implies > 26B);
+            # for "<" it is the other way round. Only the most profitable inversion is reported.
+            violation = find_ladder_violation(items)
+            if violation is None:
+                continue
+
+            # Found Arb!
+            # Strategy: Buy Yes(Low) and Buy No(High), where Low is the looser rung.
+            # Cost = Price(Low) + (1 - Price(High)) < 1.
+            low, high, gap = violation
+            cost = low["price"] + (1.0 - high["price"])
+            profit = (1.0 - cost) * 100
+            opportunities.append({
+                "market_title": f"{low['title']} vs {high['title']}",
+                "type": "Logic",
+                "description": f"Spread Arb: {high['title']} ({high['price']}) > {low['title']} ({low['price']}). Buy Yes on Low, No on High. Cost {cost:.2f}.",
+                "profit_potential": "High" if profit > 5 else "Medium",
+                "confidence": 1.0,
+                "source": "Algorithm",
+                "event_id": low["event_id"] # Use one of them
+            })
 
         return opportunities
 
@@ -282,134 +282,118 @@ class ArbitrageFinder:
         opportunities = []
         # Group by subject looking for "Rank #X" or similar mutually exclusive traits
         groups = {}
-        import re
-        for event in events:
-            title = event.get("title", "").lower()
+        for event in iter_normalized(events):
+            title = event.title.lower()
             # Pattern for "Subject #N" or "Subject Rank N"
-            match = re.search(r'(.+?)\s*(#|rank)\s*(\d+)', title)
+            match = RANK_PATTERN.search(title)
             if match:
                 subject = match.group(1).strip()
                 try:
                     rank = int(match.group(3))
-                    if subject not in groups: groups[subject] = []
                     
-                    markets = event.get("markets", [])
-                    if not markets: continue
-                    market = markets[0]
-                    if "outcomePrices" in market:
-                        prices = json.loads(market["outcomePrices"])
-                        outcomes = json.loads(market["outcomes"]) if "outcomes" in market else ["Yes", "No"]
-                        if "No" in outcomes:
-                            no_price = float(prices[outcomes.index("No")])
-                            groups[subject].append({
-                                "rank": rank,
-                                "no_price": no_price,
-                                "title": title,
-                                "event_id": event.get("id")
-                            })
+                    if not event.markets: continue
+                    market = event.markets[0]
+                    if market.no_price is not None:
+                        groups.setdefault(subject, []).append({
+                            "rank": rank,
+                            "no_price": market.no_price,
+                            "title": title,
+                            "event_id": event.id
+                        })
                 except:
                     pass
 
         # Analyze groups
+        ranked = []
         for subject, items in groups.items():
-            # If we have multiple ranks for same subject, they are likely mutually exclusive.
-            # (Can't be #1 and #2).
-            if len(items) >= 2:
-                # Check pairs for Sum(No) < 1
-                for i in range(len(items)):
-                    for j in range(i + 1, len(items)):
-                        item1 = items[i]
-                        item2 = items[j]
-                        
-                        cost = item1["no_price"] + item2["no_price"]
-                        if cost < 1.0:
-                            profit = (1.0 - cost) * 100
-                            opportunities.append({
-                                "market_title": f"{item1['title']} + {item2['title']}",
-                                "type": "Real",
-                                "description": f"Mutually Exclusive No Arb: Buy No on both. Total Cost {cost:.2f} (< 1.0).",
-                                "profit_potential": "High" if profit > 5 else "Medium",
-                                "confidence": 1.0,
-                                "source": "Algorithm",
-                                "event_id": item1["event_id"]
-                            })
+            # Multiple ranks for the same subject are mutually exclusive (can't be #1 and #2).
+            # The same rank listed twice is not, so keep only the cheapest No per rank.
+            legs = {}
+            for item in items:
+                if item["rank"] not in legs or item["no_price"] < legs[item["rank"]]["no_price"]:
+                    legs[item["rank"]] = item
+
+            # At most one leg wins Yes, so No on k legs pays >= k - 1; pick the best basket
+            basket = best_no_basket(list(legs.values()))
+            if basket is None:
+                continue
+            basket, cost, profit = basket
+            ranked.append((profit, {
+                "market_title": " + ".join(item["title"] for item in basket),
+                "type": "Real",
+                "description": f"Mutually Exclusive No Arb: Buy No on {len(basket)} legs. Total Cost {cost:.2f}, guaranteed payout {len(basket) - 1}. Profit {profit * 100:.2f}%.",
+                "profit_potential": "High" if profit * 100 > 5 else "Medium",
+                "confidence": 1.0,
+                "source": "Algorithm",
+                "event_id": basket[0]["event_id"]
+            }))
+
+        # One opportunity per group, most profitable first
+        ranked.sort(key=lambda entry: entry[0], reverse=True)
+        opportunities.extend(opp for _profit, opp in ranked)
         return opportunities
 
     def find_algo_arbitrage(self, data):
+        """
+        Single pass over `data`, which may be a lazy generator (store.iter_events).
+        Each event is parsed once into a markets.Event record; the cross-event
+        group checks only keep the records whose title can match their patterns.
+        """
         opportunities = []
-        
-        # 0. Run Advanced Checks
-        opportunities.extend(self.check_spread_arb(data))
-        opportunities.extend(self.check_mutual_exclusive_no(data))
+        group_events = []
 
-        for event in data:
+        for index, raw in enumerate(data):
+            # One malformed event must not abort the scan of the whole category
             try:
+                event = raw if isinstance(raw, Event) else Event(raw, index)
+                title_lower = event.title.lower()
+                if event.markets and (SPREAD_PATTERN.search(title_lower) or RANK_PATTERN.search(title_lower)):
+                    group_events.append(event)
+
                 # 1. Check for Event-level Negative Risk (Sum of all "Yes" outcomes < 1.0)
                 # Only applies if the event has multiple mutually exclusive markets (like "Winner of 2024")
                 # We assume markets in an event are mutually exclusive if it's a "Winner" type event.
                 # This is a heuristic.
-                
-                event_markets = event.get("markets", [])
-                if not event_markets:
+                if not event.markets:
                     continue
 
                 yes_prices = []
                 market_titles = []
-                
+            
                 # 2. Check for Market-level Negative Risk (Yes + No < 1.0)
-                for market in event_markets:
-                    if "outcomePrices" in market and market["outcomePrices"]:
-                        try:
-                            prices = [float(p) for p in json.loads(market["outcomePrices"])]
-                            outcomes = json.loads(market["outcomes"]) if "outcomes" in market else ["Yes", "No"]
-                            
-                            # Check Yes+No arb
-                            if sum(prices) < 1.0:
-                                profit = (1.0 - sum(prices)) * 100
-                                opportunities.append({
-                                    "market_title": market.get("question", event.get("title", "Unknown")),
-                                    "type": "Real",
-                                    "description": f"Algorithm detected Market Risk: Sum of {outcomes} is {sum(prices):.4f} (< 1.0). Profit: {profit:.2f}%.",
-                                    "profit_potential": "High" if profit > 5 else "Medium",
-                                    "confidence": 1.0,
-                                    "source": "Algorithm",
-                                    "event_id": event.get("id")
-                                })
-                            
-                            # Collect "Yes" price for Event-level check
-                            # Assuming "Yes" is index 0 or 1. Usually Yes is 0? 
-                            # Let's check outcomes.
-                            if "Yes" in outcomes:
-                                yes_idx = outcomes.index("Yes")
-                                # KPI: Use bestAsk if available for more accuracy
-                                if "bestAsk" in market and market["bestAsk"]:
-                                    try:
-                                        ask = float(market["bestAsk"])
-                                        if ask > 0:
-                                            yes_prices.append(ask)
-                                            market_titles.append(market.get("question", ""))
-                                            continue # Skip fallback
-                                    except:
-                                        pass
-                                
-                                # Fallback to outcomePrices
-                                yes_prices.append(prices[yes_idx])
-                                market_titles.append(market.get("question", ""))
-                        except:
-                            continue
+                for market in event.markets:
+                    # The Yes + No check needs every outcome priced
+                    if not market.prices or None in market.prices:
+                        continue
+
+                    # Check Yes+No arb
+                    total = sum(market.prices)
+                    if total < 1.0:
+                        profit = (1.0 - total) * 100
+                        opportunities.append({
+                            "market_title": market.question or event.title or "Unknown",
+                            "type": "Real",
+                            "description": f"Algorithm detected Market Risk: Sum of {market.outcomes} is {total:.4f} (< 1.0). Profit: {profit:.2f}%.",
+                            "profit_potential": "High" if profit > 5 else "Medium",
+                            "confidence": 1.0,
+                            "source": "Algorithm",
+                            "event_id": event.id
+                        })
+                
+                    # Collect "Yes" price for Event-level check
+                    # KPI: Use bestAsk if available for more accuracy, fallback to outcomePrices
+                    if market.yes_price is not None:
+                        yes_prices.append(market.yes_ask)
+                        market_titles.append(market.question or "")
 
                 # 3. Event-level Sum(Yes) Check
                 # Only if we have multiple markets (candidates)
                 # AND the event implies mutually exclusive outcomes (Winner, Next, etc.)
                 # Heuristic: Check title for keywords.
-                title_lower = event.get("title", "").lower()
-                mutually_exclusive_keywords = ["winner", "champion", "next", "who", "most", "nominee", "president", "ceo", "mayor", "governor", "senator"]
-                cumulative_keywords = ["released by", "reach", ">", "<", "market cap", "price", "hit"]
-                
-                is_mutually_exclusive = any(k in title_lower for k in mutually_exclusive_keywords) and not any(k in title_lower for k in cumulative_keywords)
-                
+                is_mutually_exclusive = any(k in title_lower for k in MUTUALLY_EXCLUSIVE_KEYWORDS) and not any(k in title_lower for k in CUMULATIVE_KEYWORDS)
+            
                 # Also check if "negRisk" is true in event data (Polymarket flag)
-                if event.get("negRisk") is True:
+                if event.neg_risk_flag:
                     is_mutually_exclusive = True
 
                 if len(yes_prices) > 1 and is_mutually_exclusive:
@@ -417,41 +401,41 @@ class ArbitrageFinder:
                     if total_yes < 1.0:
                         profit = (1.0 - total_yes) * 100
                         opportunities.append({
-                            "market_title": event.get("title", "Unknown Event"),
+                            "market_title": event.title or "Unknown Event",
                             "type": "Real",
                             "description": f"Algorithm detected Event Risk: Sum of all 'Yes' outcomes is {total_yes:.4f} (< 1.0). Profit: {profit:.2f}%.",
                             "profit_potential": "High" if profit > 5 else "Medium",
                             "confidence": 1.0,
                             "source": "Algorithm",
-                            "event_id": event.get("id")
+                            "event_id": event.id
                         })
-
-            except Exception as e:
+            except Exception:
                 continue
-        return opportunities
 
-    async def analyze_file(self, filepath, output_dir):
-        filename = os.path.basename(filepath)
-        category = filename.replace(".json", "")
+        # 0. Run Advanced Checks (reported first)
+        return self.check_spread_arb(group_events) + self.check_mutual_exclusive_no(group_events) + opportunities
+
+    async def analyze_category(self, snapshot_dir, label, output_dir):
+        category = label
+        filename = f"{store.sanitize_filename(label)}.json"
         
         # print(f"Analyzing {category}...")
         
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
-        except:
-            print(f"Error reading {filepath}")
+            # The algorithmic checks only need titles, flags and prices, streamed row group by row group
+            events = store.iter_events(snapshot_dir, label=label, columns=store.ALGO_EVENT_COLUMNS)
+            # 1. Run Algorithmic Check
+            algo_opportunities = self.find_algo_arbitrage(events)
+        except Exception as e:
+            print(f"Error reading {category} from {snapshot_dir}: {e}")
             return
             
-        # 1. Run Algorithmic Check
-        algo_opportunities = self.find_algo_arbitrage(data)
         if algo_opportunities:
             print(f"Found {len(algo_opportunities)} algorithmic opportunities in {category}")
 
         # 2. Run LLM Analysis
         # Limit to top 20 events to save tokens, but ensure we cover enough ground
-        if len(data) > 20:
-            data = data[:20]
+        data = store.load_events(snapshot_dir, label=label, limit=20)
 
         prompt = f"""
         Analyze the following Polymarket data for arbitrage opportunities, relying on ASK PRICES.
@@ -588,21 +572,20 @@ class ArbitrageFinder:
         results_path = os.path.join(RESULTS_DIR, f"results_{self.current_timestamp}")
         os.makedirs(results_path, exist_ok=True)
         
-        # 3. Analyze Files concurrently
-        json_files = glob.glob(os.path.join(data_dir, "*.json"))
-        json_files = [f for f in json_files if "all_markets.json" not in f]
+        # 3. Analyze Categories concurrently
+        categories = store.list_categories(data_dir)
         
-        print(f"Found {len(json_files)} category files to analyze.")
+        print(f"Found {len(categories)} categories to analyze.")
         
         # Aggressive concurrency: 50 categories at a time
         concurrency_limit = 50
         semaphore = asyncio.Semaphore(concurrency_limit)
         
-        async def worker(filepath):
+        async def worker(label):
             async with semaphore:
-                await self.analyze_file(filepath, results_path)
+                await self.analyze_category(data_dir, label, results_path)
 
-        tasks = [worker(f) for f in json_files]
+        tasks = [worker(label) for label in categories]
         await asyncio.gather(*tasks)
 
         print("Arbitrage analysis complete.")
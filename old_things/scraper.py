@@ -1,15 +1,25 @@
 import asyncio
 import aiohttp
+import hashlib
 import json
 import os
+import time
 import argparse
 from tqdm import tqdm
+from old_things.store import SnapshotWriter, new_snapshot_dir, write_snapshot
 
 # Directory setup
-DATA_DIR = "data"
+#
+# Run from the repo root as a package module (python3 -m old_things.scraper);
+# snapshots stay next to this file.
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 os.makedirs(DATA_DIR, exist_ok=True)
+# Dot-prefixed so the "latest snapshot" glob in arbitrage.py never picks it up
+STATE_DIR = os.path.join(DATA_DIR, ".state")
 
-GAMMA_API_URL = "https://gamma-api.polymarket.com/events"
+# Override with GAMMA_API_BASE to point at a local stand-in (benchmarks/gamma_server.py)
+GAMMA_API_BASE = os.getenv("GAMMA_API_BASE", "https://gamma-api.polymarket.com")
+GAMMA_API_URL = f"{GAMMA_API_BASE}/events"
 
 async def fetch_all_markets(limit=None):
     """Fetch all market data from Polymarket Gamma API."""
@@ -61,64 +71,344 @@ async def fetch_all_markets(limit=None):
     
     return all_events
 
-from datetime import datetime
-from collections import defaultdict
-import re
+async def stream_all_markets(limit=None, base_dir=DATA_DIR, batch_size=100):
+    """
+    Streaming variant of fetch_all_markets + save_data.
+    Each page is appended to the Parquet snapshot as soon as it
+    arrives, so memory is bounded by the page size instead of the universe size.
+    Returns the snapshot directory.
+    """
+    output_dir = new_snapshot_dir(base_dir)
+    seen_ids = set()
+    offset = 0
+
+    connector = aiohttp.TCPConnector(ssl=False)
+
+    print(f"Streaming market data from API into {output_dir}...")
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        with SnapshotWriter(output_dir) as writer, tqdm() as pbar:
+            while True:
+                status, data, _latency = await fetch_page(session, offset, batch_size)
+                if status != 200:
+                    print(f"Error fetching markets: {status}")
+                    break
+                if not data:
+                    break
+
+                # Offsets can shift between pages; only ids are kept to drop repeats
+                page = [event for event in data if event.get("id") not in seen_ids]
+                if limit:
+                    page = page[:max(0, limit - writer.count)]
+                seen_ids.update(event.get("id") for event in page)
+                writer.write_many(page)
+                pbar.update(len(page))
+
+                if limit and writer.count >= limit:
+                    break
+                if len(data) < batch_size:
+                    break
+                offset += batch_size
+
+    print(f"Saved {writer.count} events to {output_dir}")
+    return output_dir
 
-def sanitize_filename(name):
-    """Sanitize string to be safe for filenames."""
-    return re.sub(r'[<>:"/\\|?*]', '_', name)
+class AdaptiveConcurrency:
+    """
+    AIMD controller for the number of pages fetched in parallel.
+    Grows by one per healthy window, backs off when a window is throttled (429)
+    or its latency degrades well past the best latency seen so far.
+    """
+    def __init__(self, initial=4, minimum=1, maximum=32, latency_factor=2.0):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_factor = latency_factor
+        self.baseline = None
 
-def save_data(data, base_dir="data"):
-    # Create timestamped directory
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    output_dir = os.path.join(base_dir, timestamp)
-    os.makedirs(output_dir, exist_ok=True)
-    print(f"Created output directory: {output_dir}")
+    def record(self, latency, throttled):
+        if throttled:
+            self.limit = max(self.minimum, self.limit // 2)
+        elif self.baseline is not None and latency > self.baseline * self.latency_factor:
+            self.limit = max(self.minimum, int(self.limit * 0.75))
+        else:
+            self.limit = min(self.maximum, self.limit + 1)
+
+        if not throttled:
+            self.baseline = latency if self.baseline is None else min(self.baseline, latency)
 
-    # Save full dataset
-    full_path = os.path.join(output_dir, "all_markets.json")
-    print(f"Saving {len(data)} markets to {full_path}...")
+async def fetch_page(session, offset, batch_size, closed="false", order="id"):
+    """Fetch one /events page. Returns (status, events, latency)."""
+    params = {
+        "closed": closed,
+        "limit": batch_size,
+        "offset": offset,
+        "order": order,
+        "ascending": "false"
+    }
+    start = time.monotonic()
     try:
-        with open(full_path, "w") as f:
-            json.dump(data, f, indent=2)
+        async with session.get(GAMMA_API_URL, params=params) as response:
+            if response.status != 200:
+                return response.status, None, time.monotonic() - start
+            data = await response.json()
+            if data is not None and not isinstance(data, list):
+                # A Gamma error object in a 200 body: a failed page, not an empty one
+                print(f"Unexpected response body at offset {offset}: {str(data)[:200]}")
+                return None, None, time.monotonic() - start
+            return 200, data or [], time.monotonic() - start
     except Exception as e:
-        print(f"Error saving full data: {e}")
+        print(f"Exception during API fetch (offset {offset}): {e}")
+        return None, None, time.monotonic() - start
 
-    # Group by label
-    markets_by_label = defaultdict(list)
-    
-    for market in data:
-        tags = market.get("tags")
-        if tags and isinstance(tags, list):
-            for tag in tags:
-                label = tag.get("label")
-                if label:
-                    markets_by_label[label].append(market)
-        else:
-            markets_by_label["Uncategorized"].append(market)
-            
-    # Save split files
-    print(f"Splitting data into {len(markets_by_label)} categories...")
-    for label, markets in markets_by_label.items():
-        safe_label = sanitize_filename(label)
-        filename = f"{safe_label}.json"
-        filepath = os.path.join(output_dir, filename)
-        
-        try:
-            with open(filepath, "w") as f:
-                json.dump(markets, f, indent=2)
-        except Exception as e:
-            print(f"Error saving category {label}: {e}")
-            
+async def fetch_all_markets_parallel(limit=None, max_concurrency=32, batch_size=100, overlap=5, max_retries=5):
+    """
+    Fetch all events with several pages in flight at once.
+
+    Pages are ordered by id descending and overlap by `overlap` events. The last id
+    of each page is kept as a keyset cursor: the following page must contain it,
+    otherwise events closed mid-scrape shifted the offsets and a bridge page is
+    fetched to cover the gap. Events are deduplicated by id, so pages that shift the
+    other way (new events) only produce harmless repeats.
+    """
+    step = batch_size - overlap
+    events_by_id = {}
+    pages = {}           # page index -> list of event ids
+    pending = []         # page indices to retry
+    attempts = {}
+    next_page = 0
+    last_page = None     # first page index that came back short
+    controller = AdaptiveConcurrency(maximum=max_concurrency)
+
+    connector = aiohttp.TCPConnector(ssl=False, limit=max_concurrency)
+
+    print("Fetching market data from API (parallel)...")
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        with tqdm() as pbar:
+            def collect(data):
+                new_events = 0
+                for event in data:
+                    if event.get("id") not in events_by_id:
+                        new_events += 1
+                    events_by_id[event.get("id")] = event
+                pbar.update(new_events)
+
+            while True:
+                # Build the next window: retries first, then fresh pages until the end is known
+                window = pending[:controller.limit]
+                pending = pending[len(window):]
+                while len(window) < controller.limit and (last_page is None or next_page <= last_page):
+                    if limit and next_page * step >= limit:
+                        break
+                    window.append(next_page)
+                    next_page += 1
+                if not window:
+                    break
+
+                results = await asyncio.gather(*(fetch_page(session, i * step, batch_size) for i in window))
+
+                throttled = False
+                latencies = []
+                for i, (status, data, latency) in zip(window, results):
+                    latencies.append(latency)
+                    if status != 200:
+                        throttled = throttled or status == 429
+                        attempts[i] = attempts.get(i, 0) + 1
+                        if attempts[i] <= max_retries:
+                            pending.append(i)
+                        else:
+                            print(f"Giving up on page {i} after {max_retries} retries (status {status})")
+                        continue
+
+                    collect(data)
+                    pages[i] = [event.get("id") for event in data]
+                    if len(data) < batch_size and (last_page is None or i < last_page):
+                        last_page = i
+
+                # Keyset check: page i+1 must still contain the cursor (last id) of page i.
+                # If it doesn't, refetch page i's offset now; the shifted page bridges the gap.
+                broken = [i for i in pages if (i in window or i + 1 in window)
+                          and pages[i] and pages.get(i + 1) and pages[i][-1] not in pages[i + 1]]
+                for _ in range(max_retries):
+                    if not broken:
+                        break
+                    bridges = await asyncio.gather(*(fetch_page(session, i * step, batch_size) for i in broken))
+                    still_broken = []
+                    for i, (status, data, _latency) in zip(broken, bridges):
+                        ids = [event.get("id") for event in data] if status == 200 else []
+                        if status == 200:
+                            collect(data)
+                        if pages[i][-1] in ids and set(ids) & set(pages[i + 1]):
+                            pages[i + 1] = ids + pages[i + 1]
+                        else:
+                            still_broken.append(i)
+                    broken = still_broken
+                for i in broken:
+                    # Events that moved across this boundary mid-scrape may be missing from the result
+                    print(f"Warning: gap after page {i} still open after {max_retries} bridge retries "
+                          f"(cursor {pages[i][-1]} not on page {i + 1})")
+
+                pending.sort()
+                latencies.sort()
+                controller.record(latencies[len(latencies) // 2], throttled)
+                if throttled:
+                    await asyncio.sleep(1.0)
+
+                if limit and len(events_by_id) >= limit and not pending:
+                    break
+
+    all_events = sorted(events_by_id.values(), key=_event_sort_key, reverse=True)
+    if limit:
+        all_events = all_events[:limit]
+    return all_events
+
+def _event_sort_key(event):
+    try:
+        return int(event.get("id"))
+    except (TypeError, ValueError):
+        return -1
+
+def save_data(data, base_dir=DATA_DIR):
+    """Write the scraped events as a columnar snapshot (see store.py)."""
+    print(f"Saving {len(data)} events...")
+    output_dir = write_snapshot(data, base_dir=base_dir)
     print("Data processing complete.")
+    return output_dir
+
+def event_hash(event):
+    """Stable content hash of an event, used to skip unchanged events."""
+    payload = json.dumps(event, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def load_state(state_dir=STATE_DIR):
+    """
+    Load the persisted watermark and local event store (empty on first run).
+    A watermark without its event store is dropped: a delta on top of nothing
+    would silently lose every event older than the watermark.
+    """
+    watermark = {"max_id": None, "updated_at": None, "hashes": {}}
+    try:
+        with open(os.path.join(state_dir, "watermark.json"), "r") as f:
+            saved = json.load(f)
+        with open(os.path.join(state_dir, "events.json"), "r") as f:
+            store = json.load(f)
+    except FileNotFoundError:
+        return watermark, {}
+    watermark.update(saved)
+    return watermark, store
+
+def save_state(watermark, store, state_dir=STATE_DIR):
+    os.makedirs(state_dir, exist_ok=True)
+    # Write-then-rename so an interrupted run never leaves a half-written store
+    for name, payload in (("events.json", store), ("watermark.json", watermark)):
+        path = os.path.join(state_dir, name)
+        with open(path + ".tmp", "w") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(path + ".tmp", path)
+
+async def fetch_until(session, order, closed, stop, batch_size=100):
+    """
+    Walk /events newest-first by `order` and stop at the first event for which
+    `stop(event)` is true (everything after it is older than the watermark).
+    """
+    events = []
+    offset = 0
+    while True:
+        status, data, _latency = await fetch_page(session, offset, batch_size, closed=closed, order=order)
+        if status != 200:
+            raise RuntimeError(f"Error fetching {order} page at offset {offset}: {status}")
+        for event in data:
+            if stop(event):
+                return events
+            events.append(event)
+        if len(data) < batch_size:
+            return events
+        offset += batch_size
+
+async def fetch_incremental(state_dir=STATE_DIR):
+    """
+    Delta scrape against the persisted watermark.
+
+    New and updated open events are fetched newest-first by updatedAt (plus an id
+    pass for events without updatedAt) until we reach the watermark. Their content
+    hash decides whether they are merged. Events that closed since the watermark
+    are kept in the store as tombstones. Returns (live_events, stats).
+    Without a usable watermark (first run, lost event store, or no updatedAt to
+    stop the closed pass at) it falls back to a full parallel scrape and starts
+    a fresh watermark.
+    """
+    watermark, store = load_state(state_dir)
+    hashes = watermark.get("hashes", {})
+    stats = {"new": 0, "changed": 0, "unchanged": 0, "closed": 0}
+
+    if watermark.get("max_id") is None or not watermark.get("updated_at"):
+        print("No usable watermark found, running full scrape...")
+        watermark, store, hashes = {"max_id": None, "updated_at": None}, {}, {}
+        changed_events, closed_events = await fetch_all_markets_parallel(), []
+    else:
+        max_id = int(watermark["max_id"])
+        updated_at = watermark["updated_at"]
+        # Strict comparisons so events sharing the watermark timestamp are re-checked (hash dedupes them)
+        older = lambda event: (event.get("updatedAt") or "") < updated_at
+
+        connector = aiohttp.TCPConnector(ssl=False)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            updated, new, closed_events = await asyncio.gather(
+                fetch_until(session, "updatedAt", "false", older),
+                fetch_until(session, "id", "false", lambda event: _event_sort_key(event) <= max_id),
+                fetch_until(session, "updatedAt", "true", older),
+            )
+        changed_events = list({event.get("id"): event for event in updated + new}.values())
+
+    for event in changed_events:
+        event_id = str(event.get("id"))
+        digest = event_hash(event)
+        if hashes.get(event_id) == digest:
+            stats["unchanged"] += 1
+            continue
+        stats["new" if event_id not in store else "changed"] += 1
+        store[event_id] = event
+        hashes[event_id] = digest
+
+    for event in closed_events:
+        event_id = str(event.get("id"))
+        if event_id in store and not store[event_id].get("tombstone"):
+            store[event_id] = {"id": event.get("id"), "tombstone": True, "updatedAt": event.get("updatedAt")}
+            hashes.pop(event_id, None)
+            stats["closed"] += 1
+
+    seen = changed_events + closed_events
+    if seen:
+        watermark["max_id"] = max([_event_sort_key(event) for event in seen] + [int(watermark.get("max_id") or -1)])
+        watermark["updated_at"] = max([event.get("updatedAt") or "" for event in seen] + [watermark.get("updated_at") or ""])
+    watermark["hashes"] = hashes
+    save_state(watermark, store, state_dir)
+
+    live_events = sorted((event for event in store.values() if not event.get("tombstone")),
+                         key=_event_sort_key, reverse=True)
+    print(f"Incremental scrape: {stats['new']} new, {stats['changed']} changed, "
+          f"{stats['unchanged']} unchanged, {stats['closed']} closed. {len(live_events)} live events.")
+    return live_events, stats
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Scrape Polymarket market data.")
     parser.add_argument("--limit", type=int, help="Limit the number of markets to fetch.")
+    parser.add_argument("--parallel", action="store_true", help="Fetch pages in parallel with adaptive concurrency.")
+    parser.add_argument("--concurrency", type=int, default=32, help="Maximum pages in flight with --parallel.")
+    parser.add_argument("--incremental", action="store_true", help="Only fetch events changed since the last run.")
+    parser.add_argument("--stream", action="store_true", help="Write each page to disk as it arrives (bounded memory).")
     args = parser.parse_args()
 
-    data = asyncio.run(fetch_all_markets(limit=args.limit))
-    
-    if data:
-        save_data(data)
+    if args.stream:
+        asyncio.run(stream_all_markets(limit=args.limit))
+    else:
+        if args.incremental:
+            data, _stats = asyncio.run(fetch_incremental())
+        elif args.parallel:
+            data = asyncio.run(fetch_all_markets_parallel(limit=args.limit, max_concurrency=args.concurrency))
+        else:
+            data = asyncio.run(fetch_all_markets(limit=args.limit))
+
+        if data:
+            save_data(data)
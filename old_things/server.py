@@ -5,12 +5,13 @@ import asyncio
 import os
 import glob
 import json
-from arbitrage import ArbitrageFinder
+from old_things.arbitrage import HERE, RESULTS_DIR, ArbitrageFinder
+from old_things import store
 
 app = FastAPI()
 
 # Mount static files for UI
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", StaticFiles(directory=os.path.join(HERE, "static")), name="static")
 
 # Global state for progress tracking
 class JobStatus:
@@ -60,20 +61,19 @@ async def run_arbitrage_task(model_provider: str):
         
         # Step 2: Analyze
         job_status.current_step = "Analyzing Markets with LLM..."
-        results_path = os.path.join("results", f"results_{finder.current_timestamp}")
+        results_path = os.path.join(RESULTS_DIR, f"results_{finder.current_timestamp}")
         os.makedirs(results_path, exist_ok=True)
         
-        json_files = glob.glob(os.path.join(data_dir, "*.json"))
-        json_files = [f for f in json_files if "all_markets.json" not in f]
+        categories = store.list_categories(data_dir)
         
-        total_files = len(json_files)
-        for i, f in enumerate(json_files):
-            await finder.analyze_file(f, results_path)
+        total_categories = len(categories)
+        for i, label in enumerate(categories):
+            await finder.analyze_category(data_dir, label, results_path)
             # Update progress
             # Map 30-90% range to analysis progress
-            progress_fraction = (i + 1) / total_files
+            progress_fraction = (i + 1) / total_categories
             job_status.progress = 30 + int(progress_fraction * 60)
-            job_status.current_step = f"Analyzing {os.path.basename(f)}..."
+            job_status.current_step = f"Analyzing {label}..."
             await asyncio.sleep(0.5) # Rate limit buffer
 
         job_status.progress = 100
@@ -88,7 +88,7 @@ async def run_arbitrage_task(model_provider: str):
 
 @app.get("/")
 async def read_root():
-    return FileResponse('static/index.html')
+    return FileResponse(os.path.join(HERE, 'static', 'index.html'))
 
 @app.post("/api/run")
 async def run_arbitrage(background_tasks: BackgroundTasks, model: str = "openai"):
@@ -110,15 +110,15 @@ async def get_status():
 @app.get("/api/results")
 async def list_results():
     # List all timestamped folders in results/
-    if not os.path.exists("results"):
+    if not os.path.exists(RESULTS_DIR):
         return []
-    dirs = glob.glob(os.path.join("results", "*"))
+    dirs = glob.glob(os.path.join(RESULTS_DIR, "*"))
     dirs.sort(key=os.path.getctime, reverse=True)
     return [os.path.basename(d) for d in dirs]
 
 @app.get("/api/results/{timestamp}")
 async def get_result_details(timestamp: str):
-    path = os.path.join("results", timestamp)
+    path = os.path.join(RESULTS_DIR, timestamp)
     if not os.path.exists(path):
         raise HTTPException(status_code=404, detail="Result not found")
     
@@ -0,0 +1,332 @@
+import json
+import os
+import re
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Columnar snapshot store.
+#
+# Each scrape is written to data/<timestamp>/ as four Parquet tables:
+#   events.parquet      one row per event (scalar fields only)
+#   markets.parquet     one row per market, keyed by event_id
+#   tokens.parquet      one row per outcome token, keyed by event_id/market_id
+#   event_tags.parquet  (label, event_id) index used for per-category views
+#
+# Readers pull only the columns and rows they need and rebuild Gamma-shaped
+# event dicts, so the analyzer code works unchanged on the result.
+
+EVENT_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("ticker", pa.string()),
+    ("slug", pa.string()),
+    ("title", pa.string()),
+    ("description", pa.string()),
+    ("resolutionSource", pa.string()),
+    ("startDate", pa.string()),
+    ("endDate", pa.string()),
+    ("creationDate", pa.string()),
+    ("updatedAt", pa.string()),
+    ("active", pa.bool_()),
+    ("closed", pa.bool_()),
+    ("archived", pa.bool_()),
+    ("negRisk", pa.bool_()),
+    ("liquidity", pa.float64()),
+    ("volume", pa.float64()),
+    ("openInterest", pa.float64()),
+    ("commentCount", pa.int64()),
+])
+
+MARKET_SCHEMA = pa.schema([
+    ("event_id", pa.string()),
+    ("id", pa.string()),
+    ("question", pa.string()),
+    ("conditionId", pa.string()),
+    ("slug", pa.string()),
+    ("groupItemTitle", pa.string()),
+    ("description", pa.string()),
+    ("endDate", pa.string()),
+    ("active", pa.bool_()),
+    ("closed", pa.bool_()),
+    ("bestBid", pa.float64()),
+    ("bestAsk", pa.float64()),
+    ("lastTradePrice", pa.float64()),
+    ("spread", pa.float64()),
+    ("volume", pa.float64()),
+    ("liquidity", pa.float64()),
+])
+
+TOKEN_SCHEMA = pa.schema([
+    ("event_id", pa.string()),
+    ("market_id", pa.string()),
+    ("outcome_index", pa.int32()),
+    ("outcome", pa.string()),
+    ("price", pa.float64()),
+    ("token_id", pa.string()),
+])
+
+TAG_SCHEMA = pa.schema([
+    ("label", pa.string()),
+    ("event_id", pa.string()),
+])
+
+TABLES = {
+    "events": EVENT_SCHEMA,
+    "markets": MARKET_SCHEMA,
+    "tokens": TOKEN_SCHEMA,
+    "event_tags": TAG_SCHEMA,
+}
+
+# Columns the algorithmic checks need; everything else is only for the LLM prompt
+ALGO_EVENT_COLUMNS = ["id", "title", "negRisk"]
+
+UNCATEGORIZED = "Uncategorized"
+
+SNAPSHOT_FORMAT = "%Y-%m-%d_%H-%M-%S"
+
+def sanitize_filename(name):
+    """Sanitize string to be safe for filenames."""
+    return re.sub(r'[<>:"/\\|?*]', '_', name)
+
+def _as_str(value):
+    return None if value is None else str(value)
+
+def _as_float(value):
+    try:
+        return None if value is None or value == "" else float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _as_int(value):
+    try:
+        return None if value is None else int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _as_bool(value):
+    return None if value is None else bool(value)
+
+_COERCE = {
+    pa.string(): _as_str,
+    pa.float64(): _as_float,
+    pa.int64(): _as_int,
+    pa.bool_(): _as_bool,
+}
+
+def _row(source, schema, **extra):
+    row = {}
+    for field in schema:
+        if field.name in extra:
+            row[field.name] = extra[field.name]
+        else:
+            row[field.name] = _COERCE[field.type](source.get(field.name))
+    return row
+
+def _json_list(value):
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return []
+    return value if isinstance(value, list) else []
+
+def flatten_event(event):
+    """Split one Gamma event dict into rows for each snapshot table."""
+    event_id = _as_str(event.get("id"))
+    rows = {"events": [_row(event, EVENT_SCHEMA)], "markets": [], "tokens": [], "event_tags": []}
+
+    for market in event.get("markets") or []:
+        market_id = _as_str(market.get("id"))
+        rows["markets"].append(_row(market, MARKET_SCHEMA, event_id=event_id))
+
+        outcomes = _json_list(market.get("outcomes"))
+        prices = _json_list(market.get("outcomePrices"))
+        token_ids = _json_list(market.get("clobTokenIds"))
+        for i in range(max(len(outcomes), len(prices), len(token_ids))):
+            rows["tokens"].append({
+                "event_id": event_id,
+                "market_id": market_id,
+                "outcome_index": i,
+                "outcome": _as_str(outcomes[i]) if i < len(outcomes) else None,
+                "price": _as_float(prices[i]) if i < len(prices) else None,
+                "token_id": _as_str(token_ids[i]) if i < len(token_ids) else None,
+            })
+
+    labels = [tag.get("label") for tag in event.get("tags") or [] if isinstance(tag, dict) and tag.get("label")]
+    for label in labels or [UNCATEGORIZED]:
+        rows["event_tags"].append({"label": label, "event_id": event_id})
+
+    return rows
+
+class SnapshotWriter:
+    """
+    Streams events into a snapshot directory, flushing a Parquet row group
+    every `batch_size` events so memory stays bounded by the batch.
+    """
+    def __init__(self, output_dir, batch_size=1000):
+        self.output_dir = output_dir
+        self.batch_size = batch_size
+        self.count = 0
+        os.makedirs(output_dir, exist_ok=True)
+        self._writers = {
+            name: pq.ParquetWriter(os.path.join(output_dir, f"{name}.parquet"), schema)
+            for name, schema in TABLES.items()
+        }
+        self._buffers = {name: [] for name in TABLES}
+        self._pending = 0
+
+    def write(self, event):
+        for name, rows in flatten_event(event).items():
+            self._buffers[name].extend(rows)
+        self.count += 1
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        # Every table gets exactly one row group per flush (even an empty one), so
+        # row group i of each table covers the same events and can be read in lockstep
+        for name, rows in self._buffers.items():
+            table = pa.Table.from_pylist(rows, schema=TABLES[name])
+            self._writers[name].write_table(table, row_group_size=max(1, len(rows)))
+            self._buffers[name] = []
+        self._pending = 0
+
+    def write_many(self, events):
+        for event in events:
+            self.write(event)
+
+    def close(self):
+        self.flush()
+        for writer in self._writers.values():
+            writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def new_snapshot_dir(base_dir="data"):
+    timestamp = datetime.now().strftime(SNAPSHOT_FORMAT)
+    return os.path.join(base_dir, timestamp)
+
+def write_snapshot(events, base_dir="data", output_dir=None, batch_size=1000):
+    """Write an iterable of events as a new snapshot. Returns the snapshot directory."""
+    output_dir = output_dir or new_snapshot_dir(base_dir)
+    with SnapshotWriter(output_dir, batch_size=batch_size) as writer:
+        writer.write_many(events)
+    print(f"Saved {writer.count} events to {output_dir}")
+    return output_dir
+
+def is_snapshot(path):
+    return os.path.exists(os.path.join(path, "events.parquet"))
+
+def list_snapshots(base_dir="data"):
+    """Snapshot directories under base_dir, oldest first."""
+    snapshots = [os.path.join(base_dir, d) for d in os.listdir(base_dir)] if os.path.isdir(base_dir) else []
+    # Directory names are timestamps, so lexical order is chronological
+    return sorted(d for d in snapshots if is_snapshot(d))
+
+def latest_snapshot(base_dir="data"):
+    snapshots = list_snapshots(base_dir)
+    return snapshots[-1] if snapshots else None
+
+def snapshot_time(snapshot_dir):
+    """Capture time encoded in the directory name (see new_snapshot_dir), or None."""
+    try:
+        return datetime.strptime(os.path.basename(os.path.normpath(snapshot_dir)), SNAPSHOT_FORMAT)
+    except ValueError:
+        return None
+
+def list_categories(snapshot_dir):
+    """Labels present in the snapshot, read from the tag index only."""
+    table = pq.read_table(os.path.join(snapshot_dir, "event_tags.parquet"), columns=["label"])
+    return sorted(set(table.column("label").to_pylist()))
+
+def category_event_ids(snapshot_dir, label):
+    table = pq.read_table(
+        os.path.join(snapshot_dir, "event_tags.parquet"),
+        columns=["event_id"],
+        filters=[("label", "=", label)],
+    )
+    return table.column("event_id").to_pylist()
+
+def _read(snapshot_dir, name, key, ids, columns=None):
+    if ids is not None and not ids:
+        return []
+    filters = [(key, "in", ids)] if ids is not None else None
+    return pq.read_table(os.path.join(snapshot_dir, f"{name}.parquet"), columns=columns, filters=filters).to_pylist()
+
+def _drop_nulls(row):
+    return {k: v for k, v in row.items() if v is not None}
+
+def _assemble(events, markets, tokens):
+    markets_by_event = {}
+    for market in markets:
+        markets_by_event.setdefault(market.pop("event_id"), []).append(market)
+
+    tokens_by_market = {}
+    for token in tokens:
+        tokens_by_market.setdefault(token["market_id"], []).append(token)
+
+    for event in events:
+        event = _drop_nulls(event)
+        event_markets = []
+        for market in markets_by_event.get(event["id"], []):
+            market_tokens = sorted(tokens_by_market.get(market["id"], []), key=lambda t: t["outcome_index"])
+            market = _drop_nulls(market)
+            if market_tokens:
+                # Already-parsed lists; markets.Market accepts these as well as Gamma's JSON strings
+                market["outcomes"] = [t["outcome"] for t in market_tokens]
+                market["outcomePrices"] = [None if t["price"] is None else str(t["price"]) for t in market_tokens]
+                market["clobTokenIds"] = [t["token_id"] for t in market_tokens]
+            event_markets.append(market)
+        event["markets"] = event_markets
+        yield event
+
+def load_events(snapshot_dir, label=None, columns=None, limit=None):
+    """
+    Rebuild Gamma-shaped event dicts (with nested markets) from a snapshot.
+
+    label:   only events in this category (via the tag index)
+    columns: event columns to read (markets/tokens are always included)
+    limit:   only the first `limit` events in scrape order
+    """
+    ids = category_event_ids(snapshot_dir, label) if label is not None else None
+    if ids is not None and limit is not None:
+        ids = ids[:limit]
+    if columns is not None and "id" not in columns:
+        columns = ["id"] + list(columns)
+
+    events = _read(snapshot_dir, "events", "id", ids, columns)
+    if limit is not None:
+        events = events[:limit]
+        ids = [event["id"] for event in events]
+
+    markets = _read(snapshot_dir, "markets", "event_id", ids)
+    tokens = _read(snapshot_dir, "tokens", "event_id", ids)
+    return list(_assemble(events, markets, tokens))
+
+def iter_events(snapshot_dir, label=None, columns=None):
+    """
+    Lazily yield Gamma-shaped events one row group at a time, so memory is
+    bounded by the writer's batch size rather than the snapshot size.
+    """
+    ids = set(category_event_ids(snapshot_dir, label)) if label is not None else None
+    if columns is not None and "id" not in columns:
+        columns = ["id"] + list(columns)
+    files = {name: pq.ParquetFile(os.path.join(snapshot_dir, f"{name}.parquet")) for name in ("events", "markets", "tokens")}
+
+    for i in range(files["events"].num_row_groups):
+        events = files["events"].read_row_group(i, columns=columns).to_pylist()
+        if ids is not None:
+            events = [event for event in events if event["id"] in ids]
+            if not events:
+                continue
+        markets = files["markets"].read_row_group(i).to_pylist()
+        tokens = files["tokens"].read_row_group(i).to_pylist()
+        yield from _assemble(events, markets, tokens)
@@ -0,0 +1,155 @@
+import argparse
+import json
+import logging
+import os
+import time
+
+from markets import iter_normalized
+from mocks import Bar, QuoteTick
+from old_things import store
+from strategies.algo.strategy import QuantitativeStrategy, QuantitativeStrategyConfig
+from strategies.arbitrage.strategy import ArbitrageStrategy, ArbitrageStrategyConfig
+
+# Snapshot replay without nautilus_trader.
+#
+# Walks the scraper's data/<timestamp>/ snapshots oldest first and turns them into
+# an event stream for the strategies:
+#   - a QuoteTick per Yes token whose bid/ask changed since the previous snapshot,
+#     fed to one ArbitrageStrategy (on_quote_tick)
+#   - a Bar per Yes token per snapshot (mid, or last price), fed to a
+#     QuantitativeStrategy per token (on_bar)
+# Opportunities and signals are recorded with the snapshot time they appeared at.
+
+DEFAULT_SNAPSHOT_DIR = os.path.join("old_things", "data")
+
+def _mid(market):
+    if market.best_bid is not None and market.best_ask is not None:
+        return (market.best_bid + market.best_ask) / 2
+    return market.yes_price
+
+class SnapshotReplay:
+    def __init__(self, threshold=0.01, algo_params=None, bars=True, quiet=True):
+        self.arb = ArbitrageStrategy(ArbitrageStrategyConfig(instrument_id="REPLAY", threshold=threshold))
+        self.algo_params = algo_params or {}
+        self.bars = bars
+        self.quiet = quiet
+        self.algos = {}         # yes token -> QuantitativeStrategy
+        self.quotes = {}        # yes token -> (bid, ask) last replayed
+        self.event_ids = set()  # events the arbitrage universe was loaded with
+        self.records = []
+        self.ticks = 0
+        self.bar_count = 0
+        self.load_time = 0.0    # seconds spent reading/normalising snapshots
+        self._quiet_logs()
+
+    def _quiet_logs(self):
+        # Strategy constructors reset their logger to INFO; keep per-tick logging off during replay
+        if self.quiet:
+            logging.getLogger("Strategy").setLevel(logging.WARNING)
+
+    def _algo(self, token):
+        strategy = self.algos.get(token)
+        if strategy is None:
+            strategy = QuantitativeStrategy(QuantitativeStrategyConfig(instrument_id=token, **self.algo_params))
+            self.algos[token] = strategy
+            self._quiet_logs()
+        return strategy
+
+    def _record(self, ts, kind, **fields):
+        self.records.append({"time": ts.isoformat() if ts else None, "kind": kind, **fields})
+
+    def _record_opportunities(self, ts, emitted, retracted):
+        for opp in emitted:
+            self._record(ts, "opportunity", type=opp["type"], market_title=opp["market_title"], description=opp["description"])
+        for opp in retracted:
+            self._record(ts, "retracted", type=opp["type"], market_title=opp["market_title"])
+
+    def replay_snapshot(self, snapshot_dir):
+        ts = store.snapshot_time(snapshot_dir)
+        started = time.time()
+        events = list(iter_normalized(store.iter_events(snapshot_dir)))
+        self.load_time += time.time() - started
+
+        # Events listed since the last reload: re-index the universe from this snapshot
+        ids = {event.id for event in events}
+        if not ids <= self.event_ids:
+            before = dict(self.arb.engine.active)
+            self.arb.load_universe(events)
+            after = self.arb.engine.active
+            self._record_opportunities(
+                ts,
+                [opp for key, opp in after.items() if before.get(key) != opp],
+                [opp for key, opp in before.items() if key not in after],
+            )
+            self.event_ids = ids
+            # The reload already priced everything in this snapshot; only later changes are ticks
+            for event in events:
+                for market in event.markets:
+                    if market.yes_token:
+                        self.quotes[market.yes_token] = (market.yes_bid, market.yes_ask)
+
+        timestamp = int(ts.timestamp() * 1e9) if ts else None
+        for event in events:
+            for market in event.markets:
+                token = market.yes_token
+                if not token:
+                    continue
+                quote = (market.yes_bid, market.yes_ask)
+                if self.quotes.get(token) != quote:
+                    self.quotes[token] = quote
+                    self.arb.on_quote_tick(QuoteTick(bid=quote[0], ask=quote[1], timestamp=timestamp, instrument_id=token))
+                    self.ticks += 1
+                    self._record_opportunities(ts, self.arb.last_emitted, self.arb.last_retracted)
+
+                price = _mid(market)
+                if self.bars and price is not None:
+                    algo = self._algo(token)
+                    algo.on_bar(Bar(close=price, timestamp=timestamp))
+                    self.bar_count += 1
+                    if algo.last_signal:
+                        self._record(ts, "signal", signal=algo.last_signal, token=token, market_title=market.question, price=price)
+
+    def run(self, snapshots):
+        started = time.time()
+        for i, snapshot_dir in enumerate(snapshots, 1):
+            self.replay_snapshot(snapshot_dir)
+            print(f"[{i}/{len(snapshots)}] {os.path.basename(snapshot_dir)}: {self.ticks} ticks, {self.bar_count} bars")
+        elapsed = time.time() - started
+        processed = self.ticks + self.bar_count
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        strategy_time = elapsed - self.load_time
+        strategy_rate = processed / strategy_time if strategy_time > 0 else 0.0
+        print(f"Replayed {len(snapshots)} snapshots: {processed} events in {elapsed:.2f}s ({rate:,.0f} events/sec)")
+        print(f"  loading {self.load_time:.2f}s, strategies {strategy_time:.2f}s ({strategy_rate:,.0f} events/sec)")
+        print(f"Recorded {sum(r['kind'] == 'opportunity' for r in self.records)} opportunities, "
+              f"{sum(r['kind'] == 'signal' for r in self.records)} signals; "
+              f"{len(self.arb.open_opportunities)} opportunities open at the end")
+        return self.records
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay scraped snapshots through the strategies (no Nautilus needed)")
+    parser.add_argument("--data-dir", default=DEFAULT_SNAPSHOT_DIR, help="Directory holding <timestamp>/ snapshots")
+    parser.add_argument("--limit", type=int, default=None, help="Only replay the last N snapshots")
+    parser.add_argument("--threshold", type=float, default=0.01, help="Arbitrage threshold")
+    parser.add_argument("--no-bars", action="store_true", help="Skip the QuantitativeStrategy bar stream")
+    parser.add_argument("--output", default=None, help="Write recorded opportunities/signals as NDJSON")
+    parser.add_argument("--verbose", action="store_true", help="Keep strategy logging on")
+    args = parser.parse_args()
+
+    snapshots = store.list_snapshots(args.data_dir)
+    if args.limit:
+        snapshots = snapshots[-args.limit:]
+    if not snapshots:
+        print(f"No snapshots found in {args.data_dir}. Run the scraper first.")
+        return
+
+    replay = SnapshotReplay(threshold=args.threshold, bars=not args.no_bars, quiet=not args.verbose)
+    records = replay.run(snapshots)
+    if args.output:
+        with open(args.output, "w") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        print(f"Saved {len(records)} records to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 import asyncio
 import json
 import logging
+import os
 from clients.dome_client import DomeClient
 from strategies.arbitrage.strategy import ArbitrageStrategy, ArbitrageStrategyConfig
 from strategies.algo.strategy import QuantitativeStrategy, QuantitativeStrategyConfig
 from mocks import Bar
+from markets import Universe, normalize_events
 
 # Configure Logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -28,10 +30,12 @@ async def run_simulation():
     logger.info("Fetching live markets from Gamma API (Supplemental)...")
     try:
         import requests
-        url = "https://gamma-api.polymarket.com/events?limit=20&active=true&archived=false&closed=false"
+        gamma_base = os.getenv("GAMMA_API_BASE", "https://gamma-api.polymarket.com")
+        url = f"{gamma_base}/events?limit=20&active=true&archived=false&closed=false"
         response = requests.get(url)
         response.raise_for_status()
-        events = response.json()
+        # Parse outcome/price/token strings once; both scans reuse the records
+        events = normalize_events(response.json())
         
         logger.info(f"Fetched {len(events)} events from Gamma.")
         
@@ -45,11 +49,11 @@ async def run_simulation():
     # 4. Run Arbitrage Strategy
     logger.info("Running Arbitrage Strategy...")
     
-    # Events are already in the right format for our strategy (list of dicts with 'markets')
-    # Just pass them directly
+    # Events are already normalised (markets.Event records), pass them directly
     
     # Run checks
-    neg_risk_opps = arb_strategy.check_negative_risk(events)
+    universe = Universe(events)
+    neg_risk_opps = arb_strategy.check_negative_risk_vectorized(universe)
     spread_opps = arb_strategy.check_spread_arb(events)
     
     all_opps = neg_risk_opps + spread_opps
@@ -66,9 +70,9 @@ async def run_simulation():
     if events:
         # Pick a market from the first event
         test_event = events[0]
-        if test_event.get("markets"):
-            test_market = test_event["markets"][0]
-            logger.info(f"Testing Algo on: {test_market.get('question', 'Unknown')}")
+        if test_event.markets:
+            test_market = test_event.markets[0]
+            logger.info(f"Testing Algo on: {test_market.question or 'Unknown'}")
         
         # Simulate 50 bars
         import random
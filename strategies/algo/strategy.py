@@ -1,12 +1,22 @@
 try:
+    import nautilus_trader
+except ImportError:
+    nautilus_trader = None
+
+if nautilus_trader is not None:
+    # Installed: a broken import here is an error, not a reason to run on the mocks
     from nautilus_trader.model.data import Bar
     from nautilus_trader.trading.strategy import Strategy
     from nautilus_trader.config import StrategyConfig
-    from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
-    from nautilus_trader.indicators.rsi import RelativeStrengthIndex
-    from nautilus_trader.indicators.macd import MovingAverageConvergenceDivergence
-except ImportError:
+    from nautilus_trader.indicators import (
+        ExponentialMovingAverage,
+        RelativeStrengthIndex,
+        MovingAverageConvergenceDivergence,
+    )
+    RSI_SCALE = 100.0   # Nautilus' RSI is 0-1; the thresholds are 0-100
+else:
     from mocks import Bar, Strategy, StrategyConfig, ExponentialMovingAverage, RelativeStrengthIndex, MovingAverageConvergenceDivergence
+    RSI_SCALE = 1.0
 
 class QuantitativeStrategyConfig(StrategyConfig):
     instrument_id: str
@@ -15,6 +25,7 @@ class QuantitativeStrategyConfig(StrategyConfig):
     rsi_period: int = 14
     rsi_threshold_oversold: int = 30
     rsi_threshold_overbought: int = 70
+    bar_type: str = ""   # e.g. "<instrument>-1-HOUR-LAST-EXTERNAL"; subscribed on start when set
 
 class QuantitativeStrategy(Strategy):
     def __init__(self, config: QuantitativeStrategyConfig):
@@ -35,21 +46,30 @@ class QuantitativeStrategy(Strategy):
 
         # RSI & MACD
         self.rsi = RelativeStrengthIndex(config.rsi_period)
-        self.macd = MovingAverageConvergenceDivergence() # Default 12, 26, 9
+        self.macd = MovingAverageConvergenceDivergence(12, 26)
+
+        # Signal produced by the latest bar ("BUY", "SELL" or None), for replay/recording
+        self.last_signal = None
 
     def on_start(self):
         self.log.info("Quantitative Strategy Started")
+        if self.config.bar_type:
+            from nautilus_trader.model.data import BarType
+            self.subscribe_bars(BarType.from_str(self.config.bar_type))
 
     def on_bar(self, bar: Bar):
-        # Update Indicators
-        self.ema_short.update(bar.close)
-        self.ema_long.update(bar.close)
-        self.sma_50.update(bar.close)
-        self.sma_200.update(bar.close)
-        self.rsi.update(bar.close)
-        self.macd.update(bar.close)
+        self.last_signal = None
+
+        # Update Indicators (Nautilus Bar closes are Price objects)
+        close = float(bar.close)
+        self.ema_short.update_raw(close)
+        self.ema_long.update_raw(close)
+        self.sma_50.update_raw(close)
+        self.sma_200.update_raw(close)
+        self.rsi.update_raw(close)
+        self.macd.update_raw(close)
         
-        if not self.sma_200.is_initialized:
+        if not self.sma_200.initialized:
             return
 
         # Logic: Golden Crossover (MoonDev)
@@ -61,13 +81,14 @@ class QuantitativeStrategy(Strategy):
             pass
 
         # Logic: EMA Crossover (Original Logic)
-        if self.ema_short.is_initialized and self.ema_long.is_initialized and self.rsi.is_initialized:
+        if self.ema_short.initialized and self.ema_long.initialized and self.rsi.initialized:
+            rsi = self.rsi.value * RSI_SCALE
             # Trend Following (EMA Cross) + Momentum (RSI)
-            if self.ema_short.value > self.ema_long.value and self.rsi.value < self.config.rsi_threshold_overbought:
+            if self.ema_short.value > self.ema_long.value and rsi < self.config.rsi_threshold_overbought:
                 # Bullish signal
                 # self.buy(...)
-                pass
-            elif self.ema_short.value < self.ema_long.value and self.rsi.value > self.config.rsi_threshold_oversold:
+                self.last_signal = "BUY"
+            elif self.ema_short.value < self.ema_long.value and rsi > self.config.rsi_threshold_oversold:
                 # Bearish signal
                 # self.sell(...)
-                pass
+                self.last_signal = "SELL"
@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+
+# Vectorised pre-screen for QuantitativeStrategy.
+#
+# Runs the strategy's rules over a (time x market) close-price array in one go:
+# every indicator is a NumPy kernel that steps through time once and updates all
+# markets per step, instead of one Python callback per bar per market. The
+# indicators follow the streaming ones in mocks.py (recursive EMA seeded with the
+# first price, Wilder RSI, MACD histogram) and the signal rule mirrors on_bar.
+#
+# Prices may contain NaN for bars where a market wasn't trading yet (or had no
+# print); indicators skip those bars and hold their last value.
+
+LONG = 1
+SHORT = -1
+FLAT = 0
+
+def _as_2d(prices):
+    prices = np.asarray(prices, dtype=np.float64)
+    return prices[:, None] if prices.ndim == 1 else prices
+
+def observation_count(prices):
+    """Number of priced bars seen so far, per bar and market."""
+    return np.cumsum(np.isfinite(_as_2d(prices)), axis=0)
+
+def ema(prices, period):
+    """Recursive EMA (alpha = 2 / (period + 1)) seeded with each market's first price."""
+    prices = _as_2d(prices)
+    alpha = 2.0 / (period + 1)
+    out = np.empty_like(prices)
+    state = np.full(prices.shape[1], np.nan)
+    for t, row in enumerate(prices):
+        priced = np.isfinite(row)
+        state = np.where(priced, np.where(np.isnan(state), row, state + alpha * (row - state)), state)
+        out[t] = state
+    return out
+
+def rsi(prices, period):
+    """Wilder RSI: simple mean of the first `period` moves, then smoothed with 1 / period."""
+    prices = _as_2d(prices)
+    markets = prices.shape[1]
+    out = np.full(prices.shape, np.nan)
+    prev = np.full(markets, np.nan)
+    avg_gain = np.zeros(markets)
+    avg_loss = np.zeros(markets)
+    moves = np.zeros(markets)
+    for t, row in enumerate(prices):
+        step = np.isfinite(row) & np.isfinite(prev)
+        change = np.where(step, row - prev, 0.0)
+        moves += step
+        # Running mean until `period` moves are in, fixed 1 / period weight after that
+        weight = np.where(step, 1.0 / np.maximum(np.minimum(moves, period), 1), 0.0)
+        avg_gain += weight * (np.maximum(change, 0.0) - avg_gain)
+        avg_loss += weight * (np.maximum(-change, 0.0) - avg_loss)
+        prev = np.where(np.isfinite(row), row, prev)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = 100 - 100 / (1 + avg_gain / avg_loss)
+        value = np.where(avg_loss == 0, np.where(avg_gain > 0, 100.0, 50.0), value)
+        out[t] = np.where(moves >= period, value, np.nan)
+    return out
+
+def macd(prices, fast=12, slow=26, signal=9):
+    """(macd line, signal line, histogram)."""
+    prices = _as_2d(prices)
+    line = ema(prices, fast) - ema(prices, slow)
+    # The line holds its value over missing bars; the signal EMA must skip them too
+    signal_line = ema(np.where(np.isfinite(prices), line, np.nan), signal)
+    return line, signal_line, line - signal_line
+
+def signals(prices, ema_short=10, ema_long=20, rsi_period=14,
+            rsi_oversold=30, rsi_overbought=70, trend_fast=50, trend_slow=200):
+    """
+    QuantitativeStrategy's rule per bar and market: LONG when the short EMA is above
+    the long EMA and RSI isn't overbought, SHORT when it's below and RSI isn't
+    oversold, FLAT otherwise or while any indicator is still warming up.
+    Returns (signal, indicators) where indicators holds the intermediate arrays.
+    """
+    prices = _as_2d(prices)
+    count = observation_count(prices)
+    fast, slow = ema(prices, ema_short), ema(prices, ema_long)
+    strength = rsi(prices, rsi_period)
+    trend_f, trend_s = ema(prices, trend_fast), ema(prices, trend_slow)
+    _, _, histogram = macd(prices)
+
+    # Same warm-up gates as on_bar: the 200 EMA first, then EMAs and RSI
+    ready = (count >= max(trend_slow, ema_short, ema_long, rsi_period)) & np.isfinite(strength)
+    long = ready & (fast > slow) & (strength < rsi_overbought)
+    short = ready & (fast < slow) & (strength > rsi_oversold)
+    signal = np.where(long, LONG, np.where(short, SHORT, FLAT)).astype(np.int8)
+
+    golden = (trend_f > trend_s) & (count >= trend_slow)
+    golden_cross = golden & ~np.vstack([np.zeros((1, prices.shape[1]), dtype=bool), golden[:-1]])
+
+    indicators = {
+        "ema_short": fast,
+        "ema_long": slow,
+        "rsi": strength,
+        "macd_histogram": histogram,
+        "golden_trend": golden,
+        "golden_cross": golden_cross,
+    }
+    return signal, indicators
+
+class VectorizedBacktestResult:
+    """
+    Per-bar arrays (time x market) plus per-market summary stats.
+    sharpe is per bar (mean / std of bar pnl), not annualised.
+    """
+    __slots__ = ("signal", "position", "pnl", "equity", "indicators", "stats")
+
+    def __init__(self, signal, position, pnl, indicators):
+        self.signal = signal
+        self.position = position
+        self.pnl = pnl
+        self.equity = np.cumsum(pnl, axis=0)
+        self.indicators = indicators
+        self.stats = _stats(position, pnl, self.equity)
+
+    def summary(self, markets=None):
+        """Stats as a DataFrame, one row per market (indexed by `markets` if given)."""
+        return pd.DataFrame(self.stats, index=markets)
+
+def _stats(position, pnl, equity):
+    trades = np.count_nonzero(np.diff(position, axis=0, prepend=0), axis=0)
+    active = position != 0
+    bars_active = active.sum(axis=0)
+    # pnl[t] is earned by the position held from t-1
+    held = np.vstack([np.zeros((1, position.shape[1]), dtype=bool), active[:-1]])
+    wins = ((pnl > 0) & held).sum(axis=0)
+    drawdown = np.maximum.accumulate(np.maximum(equity, 0.0), axis=0) - equity
+    mean = pnl.mean(axis=0)
+    std = pnl.std(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(std > 0, mean / std, 0.0)
+        hit_rate = np.where(bars_active > 0, wins / bars_active, 0.0)
+    return {
+        "pnl": equity[-1] if len(equity) else np.zeros(position.shape[1]),
+        "trades": trades,
+        "exposure": bars_active / max(len(position), 1),
+        "hit_rate": hit_rate,
+        "max_drawdown": drawdown.max(axis=0) if len(drawdown) else np.zeros(position.shape[1]),
+        "sharpe": sharpe,
+    }
+
+def run_vectorized_backtest(prices, size=1.0, **params):
+    """
+    Backtest the QuantitativeStrategy rule on every market at once.
+
+    prices: (time x market) closes; a 1-D array is treated as one market.
+    The signal at bar t is traded at that bar's close, so the position over
+    (t, t+1] is signal[t] and pnl[t+1] = position[t] * (price[t+1] - price[t]).
+    params: forwarded to signals() (ema_short, ema_long, rsi_period, ...).
+    """
+    prices = _as_2d(prices)
+    signal, indicators = signals(prices, **params)
+
+    position = signal.astype(np.float64) * size
+    held = np.vstack([np.zeros((1, prices.shape[1])), position[:-1]])
+    filled = pd.DataFrame(prices).ffill().to_numpy()
+    change = np.nan_to_num(np.diff(filled, axis=0, prepend=filled[:1]))
+    pnl = held * change
+    return VectorizedBacktestResult(signal, position, pnl, indicators)
@@ -0,0 +1,37 @@
+# Basket search for mutually exclusive "No" arbitrage
+# ("ChatGPT #1 Free App", "ChatGPT #2 Free App", ...).
+#
+# At most one leg of a mutually exclusive group can resolve Yes, so buying No on
+# k legs pays at least k - 1. For a fixed k the cheapest k No prices are optimal,
+# so one sort plus a prefix sum covers every basket size.
+
+def best_no_basket(legs):
+    """
+    Best No basket for one mutually exclusive group, in O(k log k).
+
+    legs: dicts with "no_price"; callers must pass at most one leg per exclusive outcome.
+    Returns (basket, cost, profit) for the basket of k >= 2 cheapest legs with the best
+    guaranteed return on cost (profit = (k - 1) - cost > 0), or None if no basket pays.
+    Ties in return go to the larger basket, which locks in more profit.
+    """
+    ordered = sorted(legs, key=lambda leg: leg["no_price"])
+
+    best = None
+    best_return = 0.0
+    cost = 0.0
+    for k, leg in enumerate(ordered, 1):
+        cost += leg["no_price"]
+        if k < 2:
+            continue
+        profit = (k - 1) - cost
+        if profit <= 0:
+            continue
+        guaranteed_return = profit / cost
+        if best is None or guaranteed_return >= best_return:
+            best = (k, cost, profit)
+            best_return = guaranteed_return
+
+    if best is None:
+        return None
+    k, cost, profit = best
+    return ordered[:k], cost, profit
@@ -0,0 +1,240 @@
+import math
+
+from markets import iter_normalized
+from strategies.arbitrage.ladder import SPREAD_PATTERN, ladder_direction, ladder_order
+
+# Incremental, tick-driven arbitrage detection.
+#
+# The batch checks in ArbitrageStrategy rescan the whole universe. This engine is
+# loaded once with the universe and then updated one quote at a time:
+#   - negative risk: a running sum of Yes asks per negRisk event, O(1) per tick
+#   - spread arb: a segment tree per ladder holding the best inversion, O(log k) per tick
+# Each update returns the opportunities that appeared (or changed) and the ones
+# that disappeared, keyed so callers can keep a live book of open opportunities.
+
+_INF = math.inf
+
+class _LadderTree:
+    """
+    Segment tree over a ladder's rungs (loosest first). Rungs with the same condition
+    share one leaf, since a gap between them is an inversion whichever is dearer.
+    Each node keeps the cheapest and dearest rung in its range plus the best inversion
+    inside it, so the root always holds the ladder's most profitable violation.
+    """
+    __slots__ = ("rungs", "leaves", "leaf_of", "size", "min_price", "min_pos", "max_price", "max_pos", "gap", "pair")
+
+    def __init__(self, rungs):
+        self.rungs = rungs
+        self.leaves = []        # leaf -> positions of the rungs sharing its condition
+        self.leaf_of = []       # rung position -> leaf
+        for pos, rung in enumerate(rungs):
+            if not self.leaves or (rung["threshold"], rung["operator"]) != self._condition(self.leaves[-1][0]):
+                self.leaves.append([])
+            self.leaves[-1].append(pos)
+            self.leaf_of.append(len(self.leaves) - 1)
+        self.size = 1
+        while self.size < len(self.leaves):
+            self.size *= 2
+        n = 2 * self.size
+        self.min_price = [_INF] * n
+        self.min_pos = [-1] * n
+        self.max_price = [-_INF] * n
+        self.max_pos = [-1] * n
+        self.gap = [0.0] * n
+        self.pair = [None] * n
+        for leaf in range(len(self.leaves)):
+            self._set_leaf(leaf)
+        for node in range(self.size - 1, 0, -1):
+            self._pull(node)
+
+    def _condition(self, pos):
+        return self.rungs[pos]["threshold"], self.rungs[pos]["operator"]
+
+    def _set_leaf(self, leaf):
+        node = self.size + leaf
+        self.min_price[node], self.max_price[node] = _INF, -_INF
+        self.gap[node], self.pair[node] = 0.0, None
+        for pos in self.leaves[leaf]:
+            price = self.rungs[pos]["price"]
+            if price is None:
+                continue
+            if price < self.min_price[node]:
+                self.min_price[node], self.min_pos[node] = price, pos
+            if price > self.max_price[node]:
+                self.max_price[node], self.max_pos[node] = price, pos
+        if self.max_price[node] > self.min_price[node]:
+            self.gap[node] = self.max_price[node] - self.min_price[node]
+            self.pair[node] = (self.min_pos[node], self.max_pos[node])
+
+    def _pull(self, node):
+        left, right = 2 * node, 2 * node + 1
+        if self.min_price[left] <= self.min_price[right]:
+            self.min_price[node], self.min_pos[node] = self.min_price[left], self.min_pos[left]
+        else:
+            self.min_price[node], self.min_pos[node] = self.min_price[right], self.min_pos[right]
+        if self.max_price[right] >= self.max_price[left]:
+            self.max_price[node], self.max_pos[node] = self.max_price[right], self.max_pos[right]
+        else:
+            self.max_price[node], self.max_pos[node] = self.max_price[left], self.max_pos[left]
+
+        # Best inversion: within either half, or a looser rung on the left priced below a stricter one on the right
+        gap, pair = self.gap[left], self.pair[left]
+        if self.gap[right] > gap:
+            gap, pair = self.gap[right], self.pair[right]
+        cross = self.max_price[right] - self.min_price[left]
+        if cross > gap:
+            gap, pair = cross, (self.min_pos[left], self.max_pos[right])
+        self.gap[node], self.pair[node] = gap, pair
+
+    def update(self, pos, price):
+        self.rungs[pos]["price"] = price
+        leaf = self.leaf_of[pos]
+        self._set_leaf(leaf)
+        node = (self.size + leaf) // 2
+        while node:
+            self._pull(node)
+            node //= 2
+
+    def best(self):
+        """(looser, stricter, gap) for the ladder's largest inversion, or None."""
+        if self.pair[1] is None or self.gap[1] <= 0:
+            return None
+        low, high = self.pair[1]
+        return self.rungs[low], self.rungs[high], self.gap[1]
+
+class _EventSum:
+    """Running sum of Yes asks for one negRisk event; `missing` counts unpriced markets."""
+    __slots__ = ("title", "asks", "total", "missing")
+
+    def __init__(self, title, asks):
+        self.title = title
+        self.asks = asks
+        self.total = sum(ask for ask in asks if ask is not None)
+        self.missing = sum(1 for ask in asks if ask is None)
+
+    def update(self, pos, ask):
+        old = self.asks[pos]
+        if old is None:
+            self.missing -= 1
+        else:
+            self.total -= old
+        if ask is None:
+            self.missing += 1
+        else:
+            self.total += ask
+        self.asks[pos] = ask
+
+class TickArbitrageEngine:
+    def __init__(self, threshold: float = 0.01):
+        self.threshold = threshold
+        self.active = {}        # opportunity key -> opportunity dict
+        self._events = {}       # event index -> _EventSum
+        self._ladders = {}      # (subject, direction) -> _LadderTree
+        self._by_token = {}     # yes token id -> [(kind, key, position)]
+
+    def load(self, events):
+        """Index the universe and evaluate every opportunity once. Returns the opportunities found."""
+        self.active.clear()
+        self._events.clear()
+        self._ladders.clear()
+        self._by_token.clear()
+
+        ladder_rungs = {}
+        for index, event in enumerate(iter_normalized(events)):
+            if event.neg_risk and event.markets:
+                self._events[index] = _EventSum(event.title, [market.yes_ask for market in event.markets])
+                for pos, market in enumerate(event.markets):
+                    self._index(market.yes_token, "event", index, pos)
+
+            match = SPREAD_PATTERN.search(event.title.lower())
+            if match and event.markets:
+                try:
+                    threshold = float(match.group(3).replace(",", ""))
+                except ValueError:
+                    continue
+                market = event.markets[0]
+                subject, operator = match.group(1).strip(), match.group(2)
+                ladder_rungs.setdefault((subject, ladder_direction(operator)), []).append({
+                    "threshold": threshold,
+                    "operator": operator,
+                    "price": market.yes_ask,
+                    "title": event.title,
+                    "token": market.yes_token,
+                })
+
+        for key, rungs in ladder_rungs.items():
+            if len(rungs) < 2:
+                continue
+            # Unpriced rungs sort as free but stay out of the tree until their first tick
+            ordered = ladder_order([dict(r, price=r["price"] or 0.0, quoted=r["price"]) for r in rungs])
+            for rung in ordered:
+                rung["price"] = rung.pop("quoted")
+            self._ladders[key] = _LadderTree(ordered)
+            for pos, rung in enumerate(ordered):
+                self._index(rung["token"], "ladder", key, pos)
+
+        emitted = []
+        for index in self._events:
+            emitted.extend(self._evaluate("event", index)[0])
+        for key in self._ladders:
+            emitted.extend(self._evaluate("ladder", key)[0])
+        return emitted
+
+    def _index(self, token_id, kind, key, pos):
+        if token_id:
+            self._by_token.setdefault(str(token_id), []).append((kind, key, pos))
+
+    def update(self, token_id, ask):
+        """
+        Apply one Yes-ask update. Returns (emitted, retracted): opportunities that
+        appeared or changed, and opportunities that no longer hold.
+        """
+        emitted, retracted = [], []
+        for kind, key, pos in self._by_token.get(str(token_id), ()):
+            if kind == "event":
+                self._events[key].update(pos, ask)
+            else:
+                self._ladders[key].update(pos, ask)
+            new, gone = self._evaluate(kind, key)
+            emitted.extend(new)
+            retracted.extend(gone)
+        return emitted, retracted
+
+    def _evaluate(self, kind, key):
+        opp = self._negative_risk(key) if kind == "event" else self._spread(key)
+        active_key = (kind, key)
+        if opp is not None:
+            if self.active.get(active_key) == opp:
+                return [], []
+            self.active[active_key] = opp
+            return [opp], []
+        if active_key in self.active:
+            return [], [self.active.pop(active_key)]
+        return [], []
+
+    def _negative_risk(self, index):
+        event = self._events[index]
+        if event.missing or event.total >= 1.0 - self.threshold + 1e-9:
+            return None
+        # Re-sum exactly near the limit so add/subtract drift can't flip the decision
+        event.total = math.fsum(event.asks)
+        if event.total >= 1.0 - self.threshold:
+            return None
+        profit = (1.0 - event.total) * 100
+        return {
+            "type": "Negative Risk",
+            "market_title": event.title,
+            "description": f"Event Risk: Sum of 'Yes' is {event.total:.4f} (< 1.0). Profit: {profit:.2f}%."
+        }
+
+    def _spread(self, key):
+        violation = self._ladders[key].best()
+        if violation is None:
+            return None
+        low, high, gap = violation
+        profit = gap * 100
+        return {
+            "type": "Spread Arb",
+            "description": f"Spread Inversion: {high['title']} ({high['price']}) > {low['title']} ({low['price']}). Profit: {profit:.2f}%.",
+            "market_title": f"{low['title']} vs {high['title']}"
+        }
@@ -0,0 +1,49 @@
+# Monotonicity checks for scalar threshold ladders
+# ("BTC > 90k", "BTC > 100k", ... or "CPI < 2.5", "CPI < 3.0", ...).
+#
+# Along a ladder ordered from the loosest condition to the strictest one, each
+# rung's outcome set is a subset of the previous rung's, so its Yes price must
+# not be higher. Any rung priced above an earlier (looser) rung is an arb:
+# buy Yes on the looser rung and No on the stricter one.
+
+import re
+
+# "Subject > 100k" style titles: (subject, operator, threshold)
+SPREAD_PATTERN = re.compile(r'(.+?)\s*(>|>=|<|<=)\s*([\d,.]+)')
+
+ABOVE = "above"   # ">" / ">=" ladders: stricter as the threshold rises
+BELOW = "below"   # "<" / "<=" ladders: stricter as the threshold falls
+
+# At equal thresholds the inclusive operator is the looser condition
+_STRICTNESS = {">=": 0, ">": 1, "<=": 0, "<": 1}
+
+def ladder_direction(operator):
+    return ABOVE if operator in (">", ">=") else BELOW
+
+def ladder_order(rungs):
+    """Rungs sorted loosest first; identical rungs by price so any gap between them shows up."""
+    sign = 1 if ladder_direction(rungs[0]["operator"]) == ABOVE else -1
+    return sorted(rungs, key=lambda r: (sign * r["threshold"], _STRICTNESS[r["operator"]], r["price"]))
+
+def find_ladder_violation(rungs):
+    """
+    Most profitable monotonicity violation in one ladder, in O(k log k).
+
+    rungs: dicts with "threshold", "operator" and "price", all in the same direction.
+    Returns (looser, stricter, gap) where stricter["price"] - looser["price"] = gap > 0
+    is the largest inversion in the ladder, or None if the ladder is consistent.
+    """
+    if len(rungs) < 2:
+        return None
+
+    ordered = ladder_order(rungs)
+
+    best = None
+    cheapest = ordered[0]   # running prefix minimum over looser rungs
+    for rung in ordered[1:]:
+        gap = rung["price"] - cheapest["price"]
+        if gap > 0 and (best is None or gap > best[2]):
+            best = (cheapest, rung, gap)
+        if rung["price"] < cheapest["price"]:
+            cheapest = rung
+    return best
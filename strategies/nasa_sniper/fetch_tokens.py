@@ -1,9 +1,12 @@
 import requests
 import json
+import os
+
+GAMMA_API_BASE = os.getenv("GAMMA_API_BASE", "https://gamma-api.polymarket.com")
 
 def fetch_tokens():
     slug = "november-2025-temperature-increase-c"
-    url = f"https://gamma-api.polymarket.com/events?slug={slug}"
+    url = f"{GAMMA_API_BASE}/events?slug={slug}"
     
     print(f"Fetching event: {slug}")
     res = requests.get(url)
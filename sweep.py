@@ -0,0 +1,162 @@
+import argparse
+import itertools
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+from ingest import CATALOG_PATH
+
+# Parameter sweep over the catalog backtest.
+#
+# Each config runs in its own BacktestNode in a worker process; every worker
+# reads the same Parquet catalog (read-only), so nothing is copied between
+# processes except the parameters going in and a row of metrics coming back.
+
+RESULTS_DIR = "data/sweeps"
+
+# Sweepable QuantitativeStrategyConfig fields (the catalog backtest only runs that strategy)
+ALGO_FIELDS = {"ema_period_short", "ema_period_long", "rsi_period", "rsi_threshold_oversold", "rsi_threshold_overbought"}
+
+def _value(text):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+def parse_space(specs):
+    """["ema_period_short=5,10,20", "rsi_period=7,14"] -> {field: [values]}"""
+    space = {}
+    for spec in specs:
+        field, _, values = spec.partition("=")
+        field = field.strip()
+        if field not in ALGO_FIELDS:
+            raise ValueError(f"Unknown sweep field: {field}")
+        # Repeated values would only repeat configs
+        space[field] = list(dict.fromkeys(_value(v.strip()) for v in values.split(",") if v.strip()))
+    return space
+
+def grid(space):
+    fields = list(space)
+    return [dict(zip(fields, combo)) for combo in itertools.product(*(space[f] for f in fields))]
+
+def random_search(space, samples, seed=0):
+    """
+    `samples` distinct configs drawn uniformly from the grid. Each field is sampled
+    on its own, so the grid is only built when it is no bigger than `samples`.
+    """
+    rng = random.Random(seed)
+    fields = list(space)
+    if samples >= math.prod(len(space[f]) for f in fields):
+        configs = grid(space)
+        rng.shuffle(configs)
+        return configs
+    seen = set()
+    configs = []
+    while len(configs) < samples:
+        combo = tuple(rng.choice(space[f]) for f in fields)
+        if combo not in seen:
+            seen.add(combo)
+            configs.append(dict(zip(fields, combo)))
+    return configs
+
+def _metrics(result):
+    row = {
+        "iterations": result.iterations,
+        "total_orders": result.total_orders,
+        "total_positions": result.total_positions,
+        "elapsed_time": result.elapsed_time,
+    }
+    # stats_pnls is {currency: {stat: value}}; returns stats are flat
+    for currency, stats in (result.stats_pnls or {}).items():
+        for name, value in stats.items():
+            row[f"{currency} {name}"] = value
+    for name, value in (result.stats_returns or {}).items():
+        row[name] = value
+    return row
+
+def run_one(params, catalog_path, interval, chunk_size, quotes):
+    """Worker: run one config and return its parameters plus metrics (or the error)."""
+    from nautilus_trader.backtest.node import BacktestNode
+    from backtest import build_run_config
+
+    row = dict(params)
+    started = time.time()
+    try:
+        config = build_run_config(catalog_path, interval, chunk_size, quotes,
+                                  algo_params=params, log_level="ERROR")
+        if config is None:
+            raise ValueError(f"No instruments in {catalog_path}")
+        results = BacktestNode(configs=[config]).run()
+        if not results:
+            raise RuntimeError("backtest produced no result (see node log)")
+        row.update(_metrics(results[0]))
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    row["wall_time"] = time.time() - started
+    return row
+
+def failures(results):
+    """Number of rows that carry an error instead of metrics."""
+    if "error" not in results:
+        return 0
+    return int(results["error"].notna().sum())
+
+def run_sweep(configs, catalog_path=CATALOG_PATH, interval=60, chunk_size=50_000, quotes=False, workers=None):
+    """Run every config across a process pool. Returns a DataFrame, one row per config."""
+    if not configs:
+        return pd.DataFrame()
+    workers = workers or os.cpu_count() or 1
+    # spawn: each worker starts a clean interpreter rather than forking the Rust runtime
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(run_one, params, catalog_path, interval, chunk_size, quotes) for params in configs]
+        for done, future in enumerate(as_completed(futures), 1):
+            row = future.result()
+            rows.append(row)
+            params = {k: row[k] for k in configs[0]}
+            print(f"[{done}/{len(futures)}] {params} {row.get('error', 'ok')}")
+    results = pd.DataFrame(rows)
+    failed = failures(results)
+    if failed:
+        print(f"{failed}/{len(rows)} configs failed (see the error column)")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel parameter sweep over the catalog backtest")
+    parser.add_argument("params", nargs="+", help="field=v1,v2,... (e.g. ema_period_short=5,10 rsi_period=7,14)")
+    parser.add_argument("--random", type=int, default=0, help="Sample N configs instead of the full grid")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --random")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--catalog", default=CATALOG_PATH, help="Catalog directory (populated by ingest.py)")
+    parser.add_argument("--interval", type=int, default=60, help="Bar interval in minutes used at ingest")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="Rows streamed per chunk")
+    parser.add_argument("--quotes", action="store_true", help="Also replay ingested QuoteTicks")
+    parser.add_argument("--sort", default=None, help="Metric column to sort results by (descending)")
+    args = parser.parse_args()
+
+    space = parse_space(args.params)
+    configs = random_search(space, args.random, args.seed) if args.random else grid(space)
+    print(f"Sweeping {len(configs)} configs...")
+
+    started = time.time()
+    results = run_sweep(configs, args.catalog, args.interval, args.chunk_size, args.quotes, args.workers)
+    if args.sort and args.sort in results:
+        results = results.sort_values(args.sort, ascending=False)
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"sweep_{time.strftime('%Y%m%d_%H%M%S')}.csv")
+    results.to_csv(path, index=False)
+    print(f"Finished {len(configs)} runs in {time.time() - started:.1f}s. Results: {path}")
+
+    if failures(results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
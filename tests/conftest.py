@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Tests import the root modules and benchmarks/synthetic.py the way the scripts do
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "benchmarks")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
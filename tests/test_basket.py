@@ -0,0 +1,45 @@
+import itertools
+import random
+
+import pytest
+
+from strategies.arbitrage.basket import best_no_basket
+
+def _legs(*prices):
+    return [{"no_price": price, "rank": i + 1} for i, price in enumerate(prices)]
+
+def _return(basket):
+    cost = sum(leg["no_price"] for leg in basket)
+    return (len(basket) - 1 - cost) / cost
+
+def test_larger_basket_beats_the_best_pair():
+    legs = _legs(0.9, 0.5, 0.45, 0.5)
+    basket, cost, profit = best_no_basket(legs)
+    # Pair: 0.95 for 1 (5%); three legs: 1.45 for at least 2 (38%); four: 2.35 for 3 (28%)
+    assert sorted(leg["no_price"] for leg in basket) == [0.45, 0.5, 0.5]
+    assert cost == pytest.approx(1.45)
+    assert profit == pytest.approx(0.55)
+
+def test_tied_return_goes_to_the_larger_basket():
+    # 0.25 + 0.25 pays 1 on 0.5; adding 0.5 pays 2 on 1.0: both return 100%
+    basket, cost, profit = best_no_basket(_legs(0.5, 0.25, 0.25, 1.0))
+    assert [leg["no_price"] for leg in basket] == [0.25, 0.25, 0.5]
+    assert (cost, profit) == (1.0, 1.0)
+
+@pytest.mark.parametrize("legs", [[], _legs(0.3), _legs(0.6, 0.6), _legs(0.5, 0.5), _legs(0.7, 0.8, 0.9)])
+def test_no_profitable_basket(legs):
+    assert best_no_basket(legs) is None
+
+@pytest.mark.parametrize("seed", range(30))
+def test_cheapest_legs_match_exhaustive_search(seed):
+    rng = random.Random(seed)
+    legs = _legs(*(round(rng.uniform(0.3, 0.99), 2) for _ in range(rng.randint(2, 8))))
+    best = max((_return(combo) for k in range(2, len(legs) + 1)
+                for combo in itertools.combinations(legs, k) if _return(combo) > 0), default=None)
+    found = best_no_basket(legs)
+    if best is None:
+        assert found is None
+    else:
+        basket, cost, profit = found
+        assert profit / cost == pytest.approx(best)
+        assert profit == pytest.approx(len(basket) - 1 - cost)
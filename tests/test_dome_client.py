@@ -0,0 +1,140 @@
+import asyncio
+import importlib.util
+import os
+import sys
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from clients.dome_client import AsyncDomeClient, DomeClient
+
+CLIENT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "clients", "dome_client.py")
+
+def _markets(n, start=0):
+    return [{"market_slug": f"m{i}"} for i in range(start, start + n)]
+
+def _serve(handler, calls, **client_options):
+    """Run `calls(client)` against a local /polymarket/markets served by `handler`."""
+    async def main():
+        app = web.Application()
+        app.router.add_get("/polymarket/markets", handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            client_options.setdefault("backoff_base", 0.001)
+            async with AsyncDomeClient(api_key="test", **client_options) as client:
+                client.BASE_URL = str(server.make_url("")).rstrip("/")
+                return await calls(client)
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+def test_sync_client_does_not_need_aiohttp():
+    saved = sys.modules.get("aiohttp")
+    sys.modules["aiohttp"] = None   # makes `import aiohttp` raise ImportError
+    try:
+        spec = importlib.util.spec_from_file_location("_dome_client_without_aiohttp", CLIENT_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        assert module.DomeClient(api_key="test").session.headers["Authorization"] == "Bearer test"
+        with pytest.raises(ImportError):
+            module.AsyncDomeClient(api_key="test")
+    finally:
+        sys.modules["aiohttp"] = saved
+
+def test_retries_429_and_5xx_then_succeeds():
+    statuses = [429, 503, 200]
+    seen = []
+
+    async def handler(request):
+        status = statuses[len(seen)]
+        seen.append(status)
+        if status != 200:
+            return web.json_response({"error": "busy"}, status=status, headers={"Retry-After": "0"})
+        return web.json_response({"markets": _markets(1)})
+
+    data = _serve(handler, lambda client: client.get_markets(market_slug="m0"))
+    assert data == {"markets": _markets(1)}
+    assert seen == [429, 503, 200]
+
+def test_gives_up_after_max_retries():
+    seen = []
+
+    async def handler(request):
+        seen.append(request.query.get("market_slug"))
+        return web.json_response({"error": "down"}, status=502)
+
+    with pytest.raises(aiohttp.ClientResponseError) as error:
+        _serve(handler, lambda client: client.get_markets(market_slug="m0"), max_retries=2)
+    assert error.value.status == 502
+    assert len(seen) == 3
+
+def test_client_errors_are_not_retried():
+    seen = []
+
+    async def handler(request):
+        seen.append(1)
+        return web.json_response({"error": "not found"}, status=404)
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        _serve(handler, lambda client: client.get_markets(market_slug="missing"))
+    assert len(seen) == 1
+
+@pytest.mark.parametrize("wrapped", [True, False])
+def test_iter_markets_stops_on_a_short_page(wrapped):
+    universe = _markets(250)
+    offsets = []
+
+    async def handler(request):
+        offset, limit = int(request.query["offset"]), int(request.query["limit"])
+        offsets.append(offset)
+        page = universe[offset:offset + limit]
+        return web.json_response({"markets": page} if wrapped else page)
+
+    async def calls(client):
+        return [page async for page in client.iter_markets(limit=100)]
+
+    pages = _serve(handler, calls)
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert [m for page in pages for m in page] == universe
+    assert offsets == [0, 100, 200]
+
+def test_iter_markets_follows_has_more():
+    async def handler(request):
+        offset = int(request.query["offset"])
+        return web.json_response({"markets": _markets(2, offset), "pagination": {"has_more": offset < 4}})
+
+    async def calls(client):
+        return [page async for page in client.iter_markets(limit=100)]
+
+    assert [len(page) for page in _serve(handler, calls)] == [2, 2, 2]
+
+def test_semaphore_caps_requests_in_flight():
+    in_flight = [0]
+    peak = [0]
+
+    async def handler(request):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.02)
+        in_flight[0] -= 1
+        return web.json_response({"markets": [{"market_slug": request.query["market_slug"]}]})
+
+    slugs = [f"m{i}" for i in range(12)]
+    results = _serve(handler, lambda client: client.get_markets_by_slugs(slugs), max_concurrency=3)
+    assert peak[0] == 3
+    # Same shape as iter_markets pages: the unwrapped list of markets per slug
+    assert results == [[{"market_slug": slug}] for slug in slugs]
+
+def test_get_markets_by_slugs_reports_failures_as_none():
+    async def handler(request):
+        slug = request.query["market_slug"]
+        if slug == "missing":
+            return web.json_response({"error": "not found"}, status=404)
+        return web.json_response([{"market_slug": slug}])
+
+    results = _serve(handler, lambda client: client.get_markets_by_slugs(["a", "missing", "b"]))
+    assert results == [[{"market_slug": "a"}], None, [{"market_slug": "b"}]]
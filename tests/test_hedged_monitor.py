@@ -0,0 +1,137 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+from strategies.nasa_sniper import sniper
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "nasa_sniper_raspi"))
+import sniper_pi
+
+PUBLISHED = {2025: [10] * 12}
+UNPUBLISHED = {2025: [10] * 10 + [None, None]}
+HEDGE = 0.05
+
+def _publishes(rows):
+    return rows[2025][10] is not None
+
+def _source(module, name, delay, answer="unchanged", latency=None):
+    """A GistempSource that answers after `delay` seconds: "published", "unchanged" (304), "****" or "error"."""
+    class Scripted(module.GistempSource):
+        async def fetch(self, session, timeout, years):
+            await asyncio.sleep(delay)
+            if answer == "error":
+                raise ConnectionError(name)
+            return {"published": PUBLISHED, "unchanged": None, "****": UNPUBLISHED}[answer]
+    source = Scripted(name, csv=False)
+    source.latency = latency
+    return source
+
+def _race(module, sources):
+    monitor = module.HedgedMonitor(sources, [2025], _publishes, hedge_delay=HEDGE)
+    return asyncio.run(monitor.race(None))
+
+@pytest.fixture(params=[sniper, sniper_pi], ids=["sniper", "sniper_pi"])
+def module(request):
+    return request.param
+
+@pytest.mark.parametrize("answer", ["unchanged", "****"])
+def test_unpublished_answer_does_not_hedge(module, answer):
+    first = _source(module, "first", 0.01, answer)
+    second = _source(module, "second", 0.01, "published")
+    assert _race(module, [first, second]) == (None, first)
+    assert second.polls == 0
+    # A 304 or still-**** reply is a real round trip and is timed
+    assert first.latency is not None
+
+def test_timeout_hedges_and_lets_in_flight_finish(module):
+    slow = _source(module, "slow", 3 * HEDGE)
+    fast = _source(module, "fast", 0.01)
+    assert _race(module, [slow, fast]) == (None, fast)
+    assert (slow.polls, fast.polls) == (1, 1)
+    assert slow.latency >= 3 * HEDGE > fast.latency
+
+def test_error_hedges_immediately(module):
+    broken = _source(module, "broken", 0.0, "error")
+    backup = _source(module, "backup", 0.01, "published")
+    monitor = module.HedgedMonitor([broken, backup], [2025], _publishes, hedge_delay=10.0)
+    rows, winner = asyncio.run(asyncio.wait_for(monitor.race(None), timeout=1.0))
+    assert (rows, winner) == (PUBLISHED, backup)
+    assert (broken.errors, backup.wins) == (1, 1)
+
+def test_every_source_failing_returns_nothing(module):
+    sources = [_source(module, name, 0.0, "error") for name in ("a", "b")]
+    assert _race(module, sources) == (None, None)
+
+def test_ranking_learns_before_release(module):
+    slow = _source(module, "slow", 3 * HEDGE)
+    fast = _source(module, "fast", 0.01)
+    _race(module, [slow, fast])
+    # Second poll: the fast source is asked first and answers before the hedge delay
+    assert _race(module, [slow, fast]) == (None, fast)
+    assert (slow.polls, fast.polls) == (1, 2)
+    assert fast.score < slow.score
+
+def test_cancelled_loser_is_censored_at_the_winners_time(module):
+    winner = _source(module, "winner", 2 * HEDGE, "published")
+    late = _source(module, "late", 10 * HEDGE, "published")
+    assert _race(module, [winner, late]) == (PUBLISHED, winner)
+    assert late.wins == 0
+    # Hedged in after HEDGE and cancelled ~HEDGE later: its own wait understates it
+    assert late.latency >= winner.latency
+    assert winner.score <= late.score
+
+class _Registry:
+    years, pending = [2025], ["target"]
+
+    def __init__(self):
+        self.evaluated = []
+
+    def publishes(self, rows):
+        return _publishes(rows)
+
+    def evaluate(self, rows, url):
+        self.evaluated.append(url)
+        sniper_pi.FOUND_EVENT.set()
+
+class _Scheduler:
+    def sleep(self, minimum=0.0):
+        pass
+
+    async def sleep_async(self, minimum=0.0):
+        pass
+
+@pytest.fixture
+def pi(monkeypatch):
+    monkeypatch.setattr(sniper_pi, "FOUND_EVENT", sniper_pi.threading.Event())
+    monkeypatch.setattr(sniper_pi, "gistemp_sources", lambda: [_source(sniper_pi, "published", 0.0, "published")])
+    return sniper_pi
+
+@pytest.mark.skipif(sniper_pi.aiohttp is None, reason="the hedged loop needs aiohttp")
+def test_pi_hedged_loop_survives_an_error(pi, monkeypatch):
+    race = pi.HedgedMonitor.race
+    calls = []
+
+    async def flaky(self, session):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return await race(self, session)
+
+    monkeypatch.setattr(pi.HedgedMonitor, "race", flaky)
+    registry = _Registry()
+    pi.monitor_hedged(registry, _Scheduler())
+    assert len(calls) == 2
+    assert registry.evaluated == ["published"]
+
+@pytest.mark.skipif(sniper_pi.aiohttp is None, reason="the hedged loop needs aiohttp")
+def test_pi_falls_back_to_polling_when_the_hedged_loop_exits(pi, monkeypatch):
+    def no_session():
+        raise RuntimeError("no event loop")
+
+    monkeypatch.setattr(pi.aiohttp, "ClientSession", no_session)
+    monkeypatch.setattr(pi.GistempPoller, "poll", lambda self, years: PUBLISHED)
+    registry = _Registry()
+    pi.monitor_hedged(registry, _Scheduler())
+    assert registry.evaluated == [pi.NASA_URL]
@@ -0,0 +1,108 @@
+import pandas as pd
+import pytest
+
+from mocks import (
+    ExponentialMovingAverage,
+    MovingAverageConvergenceDivergence,
+    RelativeStrengthIndex,
+)
+from synthetic import generate_prices
+
+TOL = 1e-12
+
+
+def _feed(indicator, prices):
+    """Value after each close, None until the indicator reports initialized."""
+    out = []
+    for price in prices:
+        indicator.update_raw(price)
+        out.append(indicator.value if indicator.initialized else None)
+    return out
+
+
+def _first_ready(indicator, prices):
+    """1-based bar count at which the indicator first reports initialized."""
+    for bar, price in enumerate(prices, 1):
+        indicator.update_raw(price)
+        if indicator.initialized:
+            return bar
+    return None
+
+
+def _wilder_rsi(prices, period):
+    """Reference Wilder RSI: seed with the mean of the first `period` moves, then smooth."""
+    moves = [b - a for a, b in zip(prices, prices[1:])]
+    gains = [max(m, 0.0) for m in moves]
+    losses = [max(-m, 0.0) for m in moves]
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+    out = [None] * period
+    for i in range(period, len(moves) + 1):
+        if i > period:
+            avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
+        if avg_loss == 0:
+            out.append(100.0 if avg_gain > 0 else 50.0)
+        else:
+            out.append(100 - 100 / (1 + avg_gain / avg_loss))
+    return out
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("period", [5, 12, 26])
+def test_ema_matches_pandas(seed, period):
+    prices = generate_prices(500, seed)
+    expected = pd.Series(prices).ewm(span=period, adjust=False).mean()
+    got = _feed(ExponentialMovingAverage(period), prices)
+    for i, value in enumerate(got):
+        if i + 1 < period:
+            assert value is None
+        else:
+            assert value == pytest.approx(expected.iloc[i], abs=TOL)
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("fast,slow,signal", [(12, 26, 9), (5, 10, 3)])
+def test_macd_histogram_matches_pandas(seed, fast, slow, signal):
+    prices = generate_prices(500, seed)
+    series = pd.Series(prices)
+    macd = series.ewm(span=fast, adjust=False).mean() - series.ewm(span=slow, adjust=False).mean()
+    expected = macd - macd.ewm(span=signal, adjust=False).mean()
+    got = _feed(MovingAverageConvergenceDivergence(fast, slow, signal), prices)
+    for i, value in enumerate(got):
+        if i + 1 <= slow + signal:
+            assert value is None
+        else:
+            assert value == pytest.approx(expected.iloc[i], abs=TOL)
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("period", [2, 14])
+def test_rsi_matches_wilder_reference(seed, period):
+    prices = generate_prices(500, seed)
+    got = _feed(RelativeStrengthIndex(period), prices)
+    for value, expected in zip(got, _wilder_rsi(prices, period)):
+        if expected is None:
+            assert value is None
+        else:
+            assert value == pytest.approx(expected, abs=1e-9)
+
+
+def test_rsi_hand_computed():
+    # Moves +1, -1, +2: seed 0.5/0.5 -> 50, then (0.5 + 2) / 2 = 1.25 vs 0.5 / 2 = 0.25 -> RS 5
+    assert _feed(RelativeStrengthIndex(2), [10, 11, 10, 12]) == [None, None, 50.0, pytest.approx(100 - 100 / 6)]
+
+
+def test_rsi_flat_and_rising():
+    assert _feed(RelativeStrengthIndex(3), [1.0] * 5)[-1] == 50.0
+    assert _feed(RelativeStrengthIndex(3), [1, 2, 3, 4, 5])[-1] == 100.0
+
+
+@pytest.mark.parametrize("indicator,ready_at", [
+    (lambda: ExponentialMovingAverage(10), 10),
+    (lambda: RelativeStrengthIndex(14), 15),
+    (lambda: MovingAverageConvergenceDivergence(12, 26, 9), 36),
+    (lambda: MovingAverageConvergenceDivergence(5, 10, 3), 14),
+])
+def test_initialized_bar(indicator, ready_at):
+    assert _first_ready(indicator(), generate_prices(100)) == ready_at
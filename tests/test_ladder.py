@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from strategies.arbitrage.ladder import ABOVE, BELOW, find_ladder_violation, ladder_direction
+
+def _rung(operator, threshold, price):
+    return {"operator": operator, "threshold": threshold, "price": price, "title": f"x {operator} {threshold}"}
+
+def _implies(stricter, looser):
+    """True if `stricter`'s outcome set is inside `looser`'s (same direction)."""
+    inclusive = {">=": 0, ">": 1, "<=": 0, "<": 1}
+    sign = 1 if ladder_direction(stricter["operator"]) == ABOVE else -1
+    return (sign * stricter["threshold"], inclusive[stricter["operator"]]) >= \
+           (sign * looser["threshold"], inclusive[looser["operator"]])
+
+def _pairwise(rungs):
+    """Every inversion the O(n^2) loop checks: a stricter rung priced above a looser one."""
+    return [
+        (looser, stricter, stricter["price"] - looser["price"])
+        for looser in rungs for stricter in rungs
+        if looser is not stricter and _implies(stricter, looser) and stricter["price"] > looser["price"]
+    ]
+
+def _old_loop(rungs):
+    """The pre-sort-and-sweep check for ">" ladders, as it was written."""
+    items = sorted(rungs, key=lambda x: x["threshold"])
+    pairs = []
+    for i in range(len(items)):
+        for j in range(i + 1, len(items)):
+            low, high = items[i], items[j]
+            if high["price"] > low["price"]:
+                pairs.append((low, high, high["price"] - low["price"]))
+    return pairs
+
+def _assert_best(rungs):
+    found = find_ladder_violation(rungs)
+    pairs = _pairwise(rungs)
+    if not pairs:
+        assert found is None
+        return
+    looser, stricter, gap = found
+    assert gap == pytest.approx(max(p[2] for p in pairs))
+    assert any(looser is p[0] and stricter is p[1] for p in pairs)
+
+@pytest.mark.parametrize("operator,direction", [(">", ABOVE), (">=", ABOVE), ("<", BELOW), ("<=", BELOW)])
+def test_ladder_direction(operator, direction):
+    assert ladder_direction(operator) == direction
+
+def test_above_ladder():
+    low, high = _rung(">", 90_000, 0.5), _rung(">", 100_000, 0.6)
+    rungs = [low, high, _rung(">", 110_000, 0.3)]
+    assert find_ladder_violation(rungs) == (low, high, pytest.approx(0.1))
+
+def test_below_ladder():
+    # "< 2.5" is inside "< 3.0", so it must not cost more
+    looser, stricter = _rung("<", 3.0, 0.4), _rung("<", 2.5, 0.6)
+    assert find_ladder_violation([stricter, looser, _rung("<", 3.5, 0.7)]) == (looser, stricter, pytest.approx(0.2))
+
+def test_largest_inversion_wins():
+    rungs = [_rung(">", 1, 0.5), _rung(">", 2, 0.55), _rung(">", 3, 0.2), _rung(">", 4, 0.45)]
+    looser, stricter, gap = find_ladder_violation(rungs)
+    assert (looser["threshold"], stricter["threshold"], gap) == (3, 4, pytest.approx(0.25))
+
+@pytest.mark.parametrize("prices", [(0.4, 0.5), (0.5, 0.4)])
+def test_tied_thresholds_are_inverted_either_way(prices):
+    rungs = [_rung(">", 100, prices[0]), _rung(">", 100, prices[1])]
+    looser, stricter, gap = find_ladder_violation(rungs)
+    assert (looser["price"], stricter["price"], gap) == (0.4, 0.5, pytest.approx(0.1))
+
+def test_tied_thresholds_inclusive_is_looser():
+    # "> 100" is inside ">= 100": only the strict rung priced higher is an inversion
+    assert find_ladder_violation([_rung(">=", 100, 0.5), _rung(">", 100, 0.6)])[2] == pytest.approx(0.1)
+    assert find_ladder_violation([_rung(">", 100, 0.5), _rung(">=", 100, 0.6)]) is None
+
+@pytest.mark.parametrize("rungs", [
+    [],
+    [_rung(">", 100, 0.5)],
+    [_rung(">", 100, 0.6), _rung(">", 200, 0.4), _rung(">", 300, 0.4)],
+    [_rung("<", 100, 0.2), _rung("<", 200, 0.4), _rung("<=", 200, 0.45)],
+])
+def test_no_violation(rungs):
+    assert find_ladder_violation(rungs) is None
+
+@pytest.mark.parametrize("seed", range(20))
+def test_unsorted_input_matches_pairwise(seed):
+    rng = random.Random(seed)
+    operators = rng.choice([(">", ">="), ("<", "<=")])
+    rungs = [_rung(rng.choice(operators), rng.randint(1, 8) * 10, round(rng.uniform(0.05, 0.95), 2))
+             for _ in range(rng.randint(2, 12))]
+    _assert_best(rungs)
+    shuffled = rungs[:]
+    rng.shuffle(shuffled)
+    _assert_best(shuffled)
+    found, again = find_ladder_violation(rungs), find_ladder_violation(shuffled)
+    assert (found is None) == (again is None)
+    if found is not None:
+        assert again[2] == pytest.approx(found[2])
+
+@pytest.mark.parametrize("seed", range(20))
+def test_reports_the_best_of_the_old_loops_pairs(seed):
+    # Distinct ">" thresholds: the old loop's pair list is exactly the pairwise inversions
+    rng = random.Random(seed)
+    thresholds = rng.sample(range(1, 100), rng.randint(2, 15))
+    rungs = [_rung(">", t, round(rng.uniform(0.05, 0.95), 2)) for t in thresholds]
+    old = _old_loop(rungs)
+    assert sorted((a["threshold"], b["threshold"]) for a, b, _ in old) == \
+           sorted((a["threshold"], b["threshold"]) for a, b, _ in _pairwise(rungs))
+    found = find_ladder_violation(rungs)
+    if not old:
+        assert found is None
+    else:
+        assert found[2] == pytest.approx(max(gap for _, _, gap in old))
+        assert any(found[0] is a and found[1] is b for a, b, _ in old)
@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+from markets import Market, Universe
+
+def _market(prices, outcomes=("Yes", "No"), **fields):
+    return {"outcomes": json.dumps(list(outcomes)), "outcomePrices": prices, **fields}
+
+@pytest.mark.parametrize("prices,expected", [
+    (json.dumps(["0.6", "0.4"]), [0.6, 0.4]),
+    (json.dumps([None, "0.4"]), [None, 0.4]),
+    (json.dumps(["0.6", "n/a"]), [0.6, None]),
+    (["0.6", 0.4], [0.6, 0.4]),
+    (json.dumps(["0", "1"]), [0.0, 1.0]),
+    ("not json", []),
+    (None, []),
+])
+def test_prices_parse_per_outcome(prices, expected):
+    assert Market(_market(prices)).prices == expected
+
+def test_one_bad_price_keeps_the_other_outcome():
+    market = Market(_market(json.dumps(["0.6", None]), bestAsk="0.61"))
+    assert (market.yes_price, market.no_price) == (0.6, None)
+    assert market.yes_ask == 0.61
+
+    market = Market(_market(json.dumps([None, "0.4"])))
+    assert (market.yes_price, market.no_price, market.yes_ask) == (None, 0.4, None)
+
+def test_universe_marks_unparsed_prices_missing():
+    universe = Universe([{"id": "1", "markets": [_market(json.dumps(["abc", "0.4"]))]}])
+    row = universe.markets[0]
+    assert row["no_price"] == 0.4
+    assert row["yes_price"] != row["yes_price"]   # NaN
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from markets import Universe
+from strategies.arbitrage.strategy import ArbitrageStrategy, ArbitrageStrategyConfig
+from synthetic import generate_events
+
+def _strategy(threshold):
+    return ArbitrageStrategy(ArbitrageStrategyConfig(instrument_id="TEST", threshold=threshold))
+
+def _event(event_id, asks, neg_risk=True, prices=None):
+    markets = []
+    for j, ask in enumerate(asks):
+        market = {
+            "id": f"{event_id}-{j}",
+            "question": f"Outcome {j}?",
+            "outcomes": json.dumps(["Yes", "No"]),
+            "outcomePrices": prices if prices is not None else json.dumps([f"{ask or 0.5}", "0.5"]),
+        }
+        if ask is not None:
+            market["bestAsk"] = ask
+        markets.append(market)
+    return {"id": event_id, "title": f"Event {event_id}", "negRisk": neg_risk, "markets": markets}
+
+def _both(strategy, events):
+    return strategy.check_negative_risk_vectorized(Universe(events)), strategy.check_negative_risk(events)
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("threshold", [0.0, 0.01, 0.05])
+def test_vectorized_matches_loop_on_synthetic_universes(seed, threshold):
+    events = generate_events(2_000, seed)
+    vectorized, loop = _both(_strategy(threshold), events)
+    assert vectorized == loop
+    if threshold == 0.0:
+        assert loop   # the generator prices some negRisk events under 1
+
+def test_missing_best_ask_falls_back_to_yes_price():
+    # No bestAsk: both use the Yes outcome price; no price at all disqualifies the event
+    events = [
+        _event("1", [None, None], prices=json.dumps(["0.30", "0.70"])),
+        _event("2", [0.2, None], prices=json.dumps([])),
+    ]
+    vectorized, loop = _both(_strategy(0.01), events)
+    assert vectorized == loop
+    assert [opp["market_title"] for opp in loop] == ["Event 1"]
+
+@pytest.mark.parametrize("prices", ["not json", json.dumps(["abc", "0.5"]), json.dumps("0.4"), ""])
+def test_malformed_outcome_prices(prices):
+    events = [
+        _event("1", [None, 0.3], prices=prices),   # unparseable and no ask: skipped
+        _event("2", [0.3, 0.3], prices=prices),    # asks quoted: prices aren't needed
+    ]
+    vectorized, loop = _both(_strategy(0.01), events)
+    assert vectorized == loop
+    assert [opp["market_title"] for opp in loop] == ["Event 2"]
+
+@pytest.mark.parametrize("asks, threshold, hit", [
+    ([0.33, 0.33, 0.33], 0.01, False),   # exactly 1 - threshold is not an opportunity
+    ([0.1, 0.2, 0.69], 0.01, False),     # same sum, but not exact in binary floating point
+    ([0.33, 0.33, 0.329], 0.01, True),   # one tick under
+    ([0.5, 0.5], 0.0, False),
+    ([0.25, 0.25, 0.25, 0.249], 0.0, True),
+])
+def test_sums_at_the_threshold(asks, threshold, hit):
+    events = [_event("1", asks), _event("2", asks, neg_risk=False)]
+    vectorized, loop = _both(_strategy(threshold), events)
+    assert vectorized == loop
+    assert bool(loop) is hit
+
+def test_empty_and_marketless_events():
+    strategy = _strategy(0.01)
+    assert _both(strategy, []) == ([], [])
+    events = [{"id": "1", "title": "Empty", "negRisk": True, "markets": []}]
+    assert _both(strategy, events) == ([], [])
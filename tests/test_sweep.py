@@ -0,0 +1,36 @@
+import math
+
+import pytest
+
+pytest.importorskip("nautilus_trader")   # sweep.py imports the catalog layout from ingest.py
+
+from sweep import grid, parse_space, random_search
+
+def test_parse_space_rejects_unknown_fields():
+    with pytest.raises(ValueError, match="threshold"):
+        parse_space(["threshold=0.01,0.02"])
+
+def test_parse_space_drops_repeated_values():
+    assert parse_space(["rsi_period=7,14,7"]) == {"rsi_period": [7, 14]}
+
+def test_random_search_draws_distinct_configs_from_the_space():
+    space = parse_space(["ema_period_short=5,8,10,12", "ema_period_long=20,26,30", "rsi_period=7,14"])
+    configs = random_search(space, 10, seed=3)
+    assert len(configs) == 10
+    assert len({tuple(c.items()) for c in configs}) == 10
+    full = [tuple(c.items()) for c in grid(space)]
+    assert all(tuple(c.items()) in full for c in configs)
+    assert random_search(space, 10, seed=3) == configs
+
+def test_random_search_returns_the_whole_grid_when_asked_for_more():
+    space = parse_space(["ema_period_short=5,10", "rsi_period=7,14"])
+    configs = random_search(space, 10)
+    assert sorted(map(lambda c: tuple(c.items()), configs)) == sorted(tuple(c.items()) for c in grid(space))
+
+def test_random_search_never_builds_a_huge_grid():
+    # 100^5 = 1e10 combinations: only feasible if each axis is sampled on its own
+    space = {field: list(range(100)) for field in
+             ("ema_period_short", "ema_period_long", "rsi_period", "rsi_threshold_oversold", "rsi_threshold_overbought")}
+    assert math.prod(map(len, space.values())) == 10**10
+    configs = random_search(space, 5, seed=1)
+    assert len({tuple(c.values()) for c in configs}) == 5
@@ -0,0 +1,101 @@
+import json
+import random
+
+import pytest
+
+from mocks import QuoteTick
+from strategies.arbitrage.strategy import ArbitrageStrategy, ArbitrageStrategyConfig
+from synthetic import generate_events
+
+def _strategy(threshold=0.01):
+    return ArbitrageStrategy(ArbitrageStrategyConfig(instrument_id="TEST", threshold=threshold))
+
+def _yes_markets(events):
+    """Yes token id -> the market dict it prices, so a tick can be applied to the snapshot too."""
+    markets = {}
+    for event in events:
+        for market in event["markets"]:
+            markets[json.loads(market["clobTokenIds"])[0]] = market
+    return markets
+
+def _batch(strategy, events):
+    """What a full rescan finds, in the shape the engine book is compared with."""
+    neg_risk = sorted(strategy.check_negative_risk(events), key=lambda opp: opp["market_title"])
+    # Ties between equal gaps may pick a different pair, so spread arbs compare by profit
+    spreads = sorted(opp["description"].rsplit("Profit: ", 1)[1] for opp in strategy.check_spread_arb(events))
+    return neg_risk, spreads
+
+def _book(opportunities):
+    neg_risk = sorted((opp for opp in opportunities if opp["type"] == "Negative Risk"), key=lambda opp: opp["market_title"])
+    spreads = sorted(opp["description"].rsplit("Profit: ", 1)[1] for opp in opportunities if opp["type"] == "Spread Arb")
+    return neg_risk, spreads
+
+def _ladder(rungs):
+    """Ladder events from (threshold, operator, ask) with one market each."""
+    events = []
+    for i, (threshold, operator, ask) in enumerate(rungs):
+        title = f"bitcoin {operator} {threshold:,} by june?"
+        events.append({
+            "id": str(i),
+            "title": title,
+            "negRisk": False,
+            "markets": [{
+                "id": f"{i}-0",
+                "question": title,
+                "outcomes": json.dumps(["Yes", "No"]),
+                "outcomePrices": json.dumps([f"{ask}", f"{1 - ask}"]),
+                "clobTokenIds": json.dumps([f"yes{i}", f"no{i}"]),
+                "bestAsk": ask,
+            }],
+        })
+    return events
+
+@pytest.mark.parametrize("seed", range(3))
+def test_ticks_match_batch_rescan(seed):
+    events = generate_events(600, seed)
+    strategy = _strategy()
+    markets = _yes_markets(events)
+    tokens = sorted(markets)
+
+    strategy.load_universe(events)
+    assert _book(strategy.open_opportunities) == _batch(strategy, events)
+
+    rng = random.Random(seed)
+    for step in range(1_500):
+        token = rng.choice(tokens)
+        ask = round(rng.uniform(0.01, 0.99), 3)
+        markets[token]["bestAsk"] = ask
+        strategy.on_quote_tick(QuoteTick(bid=ask - 0.01, ask=ask, instrument_id=f"0xcondition-{token}.POLYMARKET"))
+        if step % 100 == 0:
+            assert _book(strategy.open_opportunities) == _batch(strategy, events)
+    assert _book(strategy.open_opportunities) == _batch(strategy, events)
+
+@pytest.mark.parametrize("dearer", [0, 1])
+def test_equal_conditions_inverted_either_way(dearer):
+    # Two "> 100,000" rungs are the same outcome set: any price gap between them is an arb
+    events = _ladder([(90_000, ">", 0.7), (100_000, ">", 0.4), (100_000, ">", 0.4)])
+    strategy = _strategy()
+    assert strategy.load_universe(events) == []
+
+    strategy.on_quote_tick(QuoteTick(bid=0.6, ask=0.65, instrument_id=f"yes{1 + dearer}"))
+    events[1 + dearer]["markets"][0]["bestAsk"] = 0.65
+    (opp,) = strategy.last_emitted
+    assert opp == strategy.check_spread_arb(events)[0]
+    assert "Profit: 25.00%" in opp["description"]
+
+def test_retracts_when_inversion_closes():
+    events = _ladder([(90_000, ">", 0.5), (100_000, ">", 0.6)])
+    strategy = _strategy()
+    (opp,) = strategy.load_universe(events)
+    assert opp == strategy.check_spread_arb(events)[0]
+
+    strategy.on_quote_tick(QuoteTick(bid=0.3, ask=0.4, instrument_id="yes1"))
+    assert strategy.last_emitted == []
+    assert strategy.last_retracted == [opp]
+    assert strategy.open_opportunities == []
+
+def test_unknown_token_is_ignored():
+    strategy = _strategy()
+    strategy.load_universe(_ladder([(90_000, ">", 0.5), (100_000, ">", 0.4)]))
+    strategy.on_quote_tick(QuoteTick(bid=0.1, ask=0.2, instrument_id="unknown"))
+    assert (strategy.last_emitted, strategy.last_retracted) == ([], [])
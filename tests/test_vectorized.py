@@ -0,0 +1,115 @@
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from mocks import Bar
+from strategies.algo.vectorized import LONG, SHORT, FLAT, ema, macd, rsi, run_vectorized_backtest, signals
+from synthetic import generate_prices
+
+STRATEGY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "strategies", "algo", "strategy.py")
+SIGNALS = {"BUY": LONG, "SELL": SHORT, None: FLAT}
+TOL = 1e-12
+
+# (strategy config, signals() keyword arguments) for the same rule
+PARAMS = [
+    ({}, {}),
+    ({"ema_period_short": 5, "ema_period_long": 30, "rsi_period": 7,
+      "rsi_threshold_oversold": 40, "rsi_threshold_overbought": 60},
+     {"ema_short": 5, "ema_long": 30, "rsi_period": 7, "rsi_oversold": 40, "rsi_overbought": 60}),
+]
+
+@pytest.fixture(scope="module")
+def algo():
+    """strategies/algo/strategy.py loaded on the mocks, whether or not Nautilus is installed."""
+    saved = sys.modules.get("nautilus_trader")
+    sys.modules["nautilus_trader"] = None   # makes `import nautilus_trader` raise ImportError
+    try:
+        spec = importlib.util.spec_from_file_location("_algo_strategy_on_mocks", STRATEGY_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if saved is None:
+            del sys.modules["nautilus_trader"]
+        else:
+            sys.modules["nautilus_trader"] = saved
+    assert module.RSI_SCALE == 1.0
+    return module
+
+def _prices(bars=600):
+    """Three markets: always listed, listed 150 bars late, and one with missing prints."""
+    prices = np.column_stack([generate_prices(bars, seed) for seed in range(3)])
+    prices[:150, 1] = np.nan
+    prices[np.random.default_rng(0).random(bars) < 0.1, 2] = np.nan
+    return prices
+
+def _stream(algo, prices, **config):
+    """Bar-by-bar QuantitativeStrategy per market; a NaN close is a bar without a print."""
+    out = {name: np.full(prices.shape, np.nan) for name in ("ema_short", "ema_long", "rsi", "macd")}
+    signal = np.zeros(prices.shape, dtype=np.int8)
+    for m in range(prices.shape[1]):
+        strategy = algo.QuantitativeStrategy(algo.QuantitativeStrategyConfig(instrument_id=f"M{m}", **config))
+        for t, close in enumerate(prices[:, m]):
+            if np.isfinite(close):
+                strategy.on_bar(Bar(close=close))
+            for name in out:
+                indicator = getattr(strategy, name)
+                if indicator.initialized:
+                    out[name][t, m] = indicator.value
+            signal[t, m] = SIGNALS[strategy.last_signal]
+    return out, signal
+
+@pytest.mark.parametrize("config,params", PARAMS)
+def test_indicators_match_streaming(algo, config, params):
+    prices = _prices()
+    streamed, _signal = _stream(algo, prices, **config)
+    short, long = params.get("ema_short", 10), params.get("ema_long", 20)
+    vectorized = {
+        "ema_short": ema(prices, short),
+        "ema_long": ema(prices, long),
+        "rsi": rsi(prices, params.get("rsi_period", 14)),
+        "macd": macd(prices)[2],
+    }
+    for name, expected in streamed.items():
+        ready = np.isfinite(expected)
+        assert ready.any(axis=0).all(), name
+        np.testing.assert_allclose(vectorized[name][ready], expected[ready], rtol=0, atol=TOL, err_msg=name)
+    # RSI is NaN exactly while the streaming one is warming up
+    np.testing.assert_array_equal(np.isfinite(vectorized["rsi"]), np.isfinite(streamed["rsi"]))
+
+def test_late_listed_market_warms_up_from_its_first_print(algo):
+    prices = _prices()
+    expected = ema(prices[150:, 1], 20)[:, 0]
+    np.testing.assert_allclose(ema(prices, 20)[150:, 1], expected, rtol=0, atol=TOL)
+    assert np.isnan(ema(prices, 20)[:150, 1]).all()
+    assert np.isnan(rsi(prices, 14)[:150 + 14, 1]).all()
+
+@pytest.mark.parametrize("config,params", PARAMS)
+def test_signals_match_on_bar(algo, config, params):
+    prices = _prices()
+    _streamed, expected = _stream(algo, prices, **config)
+    signal, _indicators = signals(prices, **params)
+    np.testing.assert_array_equal(signal, expected)
+    assert (expected[:199] == FLAT).all()
+    assert (expected == LONG).any() and (expected == SHORT).any()
+
+@pytest.mark.parametrize("config,params", PARAMS)
+def test_backtest_matches_streaming_positions(algo, config, params):
+    prices = _prices()
+    _streamed, signal = _stream(algo, prices, **config)
+    result = run_vectorized_backtest(prices, size=2.0, **params)
+
+    # Trade each streamed signal at its bar's close; a missing print carries the last price
+    pnl = np.zeros(prices.shape)
+    for m in range(prices.shape[1]):
+        last = None
+        for t, close in enumerate(prices[:, m]):
+            if np.isfinite(close):
+                if last is not None and t > 0:
+                    pnl[t, m] = 2.0 * signal[t - 1, m] * (close - last)
+                last = close
+    np.testing.assert_array_equal(result.position, 2.0 * signal)
+    np.testing.assert_allclose(result.pnl, pnl, rtol=0, atol=TOL)
+    np.testing.assert_allclose(result.equity[-1], pnl.sum(axis=0), rtol=0, atol=1e-9)